@@ -0,0 +1,95 @@
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+
+@dataclass
+class StoredAnalysis:
+    pdf_url: str
+    content_hash: str
+    matcher_version: str
+    eo_references: List[str]
+    pages: List[str]
+    # False when only a preview of a streamed PDF was kept; such rows cannot be re-matched.
+    text_complete: bool = True
+
+    @property
+    def text(self) -> str:
+        """The document text as the analyzer matches it: pages joined by newlines."""
+        return "\n".join(self.pages)
+
+
+class AnalysisStore:
+    """
+    Persistent cache of PDF analysis results keyed by PDF URL and content hash.
+
+    Each row keeps the extracted page texts, the EO references found in them, and the
+    matcher version that produced them, so a rerun can skip PDF parsing for
+    unchanged documents and only re-match cached text when the patterns change.
+    """
+
+    DEFAULT_PATH = Path("./.cache/analysis.sqlite")
+    # Bump when the table layout changes; older caches are dropped and rebuilt.
+    SCHEMA_VERSION = 2
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self._conn.execute("DROP TABLE IF EXISTS analyses")
+            self._conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS analyses (
+                pdf_url TEXT PRIMARY KEY,
+                content_hash TEXT NOT NULL,
+                matcher_version TEXT NOT NULL,
+                eo_references TEXT NOT NULL,
+                pages TEXT NOT NULL,
+                text_complete INTEGER NOT NULL DEFAULT 1
+            )
+            """
+        )
+        self._conn.commit()
+
+    def lookup(self, pdf_url: str, content_hash: str) -> Optional[StoredAnalysis]:
+        """Returns the stored analysis if ``pdf_url`` was last seen with the same content."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT matcher_version, eo_references, pages, text_complete FROM analyses "
+                "WHERE pdf_url = ? AND content_hash = ?",
+                (pdf_url, content_hash),
+            ).fetchone()
+        if not row:
+            return None
+
+        matcher_version, eo_references, pages, text_complete = row
+        return StoredAnalysis(
+            pdf_url, content_hash, matcher_version, json.loads(eo_references), json.loads(pages), bool(text_complete)
+        )
+
+    def save(self, analysis: StoredAnalysis) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO analyses "
+                "(pdf_url, content_hash, matcher_version, eo_references, pages, text_complete) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    analysis.pdf_url,
+                    analysis.content_hash,
+                    analysis.matcher_version,
+                    json.dumps(sorted(analysis.eo_references)),
+                    json.dumps(analysis.pages, ensure_ascii=False),
+                    int(analysis.text_complete),
+                ),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,101 @@
+import gzip
+import json
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, TextIO, Union
+
+# "json" is the pretty-printed array every stage wrote originally; the NDJSON formats
+# hold one record per line and are written and read without holding the list in memory.
+FORMATS = ("json", "ndjson", "ndjson.gz", "ndjson.zst")
+DEFAULT_FORMAT = "json"
+GZIP_LEVEL = 6
+ZSTD_MODULE = "zstandard"
+
+PathLike = Union[str, Path]
+
+
+def artifact_format(path: PathLike) -> str:
+    """Format of ``path`` from its suffixes; anything unrecognized is treated as JSON."""
+    name = Path(path).name
+    for fmt in sorted(FORMATS, key=len, reverse=True):
+        if name.endswith(f".{fmt}"):
+            return fmt
+    return DEFAULT_FORMAT
+
+
+def artifact_path(path: PathLike, fmt: str = None) -> Path:
+    """``path`` with its format suffix replaced, e.g. ``DA_Memos.json`` -> ``DA_Memos.ndjson.gz``."""
+    path = Path(path)
+    if not fmt:
+        return path
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown artifact format '{fmt}'; choose from {', '.join(FORMATS)}")
+    suffix = f".{artifact_format(path)}"
+    stem = path.name[: -len(suffix)] if path.name.endswith(suffix) else path.name
+    return path.with_name(f"{stem}.{fmt}")
+
+
+def write_records(path: PathLike, records: Iterable[Dict]) -> int:
+    """
+    Writes ``records`` one at a time in the format of ``path`` and returns how many were
+    written. JSON output is byte-identical to ``json.dump(list(records), f, indent=2)``.
+    The file is written next to ``path`` and swapped in, so readers never see half of it.
+    """
+    fmt = artifact_format(path)
+    count = 0
+    with _atomic(path, fmt) as f:
+        if fmt == "json":
+            for record in records:
+                body = json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                f.write(("[\n  " if count == 0 else ",\n  ") + body)
+                count += 1
+            f.write("\n]" if count else "[]")
+        else:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                count += 1
+    return count
+
+
+def write_json(path: PathLike, data: Any) -> None:
+    """Writes ``data`` as one pretty-printed JSON document, swapped in like ``write_records``."""
+    with _atomic(path, "json") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def read_records(path: PathLike) -> Iterator[Dict]:
+    """Yields the records of ``path``. NDJSON is streamed; a JSON array has to be parsed whole."""
+    fmt = artifact_format(path)
+    with _open(Path(path), fmt, "r") as f:
+        if fmt == "json":
+            yield from json.load(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+@contextmanager
+def _atomic(path: PathLike, fmt: str) -> Iterator[TextIO]:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with _open(tmp_path, fmt, "w") as f:
+            yield f
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _open(path: Path, fmt: str, mode: str) -> TextIO:
+    if fmt == "ndjson.gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=GZIP_LEVEL)
+    if fmt == "ndjson.zst":
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError(f"zstd artifacts need {ZSTD_MODULE}: pip install {ZSTD_MODULE}") from None
+        return zstandard.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
@@ -0,0 +1,148 @@
+import json
+import logging
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from HTTP_Client import HTTPClient
+from Pipeline_Records import Memo
+
+
+class BackfillCrawler:
+    """
+    Crawls every page of a paginated memo listing, starting from the scraper's URL.
+
+    The scraper supplies ``parse_listing(html, page_url) -> (memos, page_links)``;
+    discovered pages on the same listing path go into a frontier that is fetched
+    on a thread pool. Progress is checkpointed to disk after every page, so an
+    interrupted backfill resumes with only the pages it had not finished. The
+    checkpoint is removed once every discovered page has been fetched.
+
+    Exposes ``scrape_records()`` so it can stand in for the scraper it wraps.
+    """
+
+    DEFAULT_CHECKPOINT_DIR = Path("./.cache/backfill")
+
+    def __init__(
+        self,
+        scraper,
+        checkpoint_path: Optional[Path] = None,
+        workers: int = 4,
+        max_pages: Optional[int] = None,
+        client: HTTPClient = None,
+    ):
+        """
+        Args:
+            scraper: An ``OPMMemoScraper`` or ``ArmyGuidanceScraper``; its ``url`` seeds the crawl.
+            checkpoint_path: Where progress is saved; defaults to one file per scraper class.
+            workers: Listing pages fetched concurrently.
+            max_pages: Stop after fetching this many pages in this run; the rest
+                stays in the checkpoint for the next run.
+            client: HTTP client; defaults to the scraper's.
+        """
+        self.scraper = scraper
+        self.seed_url = scraper.url
+        self.client = client or scraper.client
+        self.workers = max(1, workers)
+        self.max_pages = max_pages
+        self.checkpoint_path = Path(
+            checkpoint_path or self.DEFAULT_CHECKPOINT_DIR / f"{type(scraper).__name__}.json"
+        )
+
+    def scrape_records(self) -> List[Memo]:
+        memos = self.crawl()
+        self.scraper._write_to_file(memos)
+        return memos
+
+    def crawl(self) -> List[Memo]:
+        """Fetches the frontier until it is empty and returns memos in page discovery order."""
+        state = self._load_checkpoint()
+        pending = deque(url for url in state["discovered"] if url not in state["pages"])
+        if state["pages"]:
+            logging.info(f"↩️ Resuming backfill of {self.seed_url}: {len(state['pages'])} pages already fetched")
+
+        failed, started = [], 0
+        with ThreadPoolExecutor(self.workers) as pool:
+            running = {}
+            while pending or running:
+                while pending and len(running) < self.workers and self._has_budget(started):
+                    url = pending.popleft()
+                    running[pool.submit(self._fetch_page, url)] = url
+                    started += 1
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    url = running.pop(future)
+                    try:
+                        memos, links = future.result()
+                    except Exception as e:
+                        logging.warning(f"⚠️ Backfill page {url} failed: {e}")
+                        failed.append(url)
+                        continue
+
+                    state["pages"][url] = [memo.to_dict() for memo in memos]
+                    for link in links:
+                        if link not in state["discovered"] and self._in_scope(link):
+                            state["discovered"].append(link)
+                            pending.append(link)
+                    self._save_checkpoint(state)
+
+        remaining = [url for url in state["discovered"] if url not in state["pages"]]
+        if remaining:
+            logging.warning(
+                f"⏸️ Backfill of {self.seed_url} stopped with {len(remaining)} pages left; "
+                f"rerun to resume from {self.checkpoint_path}"
+            )
+        else:
+            self.checkpoint_path.unlink(missing_ok=True)
+        logging.info(f"✅ Backfill fetched {len(state['pages'])} pages ({len(failed)} failed)")
+
+        return self._collect(state)
+
+    def _fetch_page(self, url: str) -> Tuple[List[Memo], List[str]]:
+        headers = getattr(self.scraper, "HEADERS", None)
+        response = self.client.get(url, headers=headers, timeout=30)
+        response.raise_for_status()
+        return self.scraper.parse_listing(response.text, url)
+
+    def _has_budget(self, started: int) -> bool:
+        # Pages from the checkpoint are not counted, so each run makes progress.
+        return self.max_pages is None or started < self.max_pages
+
+    def _in_scope(self, url: str) -> bool:
+        """Only other pages of the seed listing are followed, not the rest of the site."""
+        seed, link = urlsplit(self.seed_url), urlsplit(url)
+        return (link.netloc, link.path.rstrip("/")) == (seed.netloc, seed.path.rstrip("/"))
+
+    def _collect(self, state: Dict) -> List[Memo]:
+        # Listings shift while they are crawled, so a memo can appear on two pages.
+        memos, seen_links = [], set()
+        for url in state["discovered"]:
+            for data in state["pages"].get(url, []):
+                if data["pdf_link"] in seen_links:
+                    continue
+                seen_links.add(data["pdf_link"])
+                memos.append(Memo.from_dict(data))
+        return memos
+
+    def _load_checkpoint(self) -> Dict:
+        try:
+            state = json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = None
+
+        if not state or state.get("seed") != self.seed_url:
+            return {"seed": self.seed_url, "discovered": [self.seed_url], "pages": {}}
+        return state
+
+    def _save_checkpoint(self, state: Dict) -> None:
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_name(f"{self.checkpoint_path.name}.tmp")
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, self.checkpoint_path)
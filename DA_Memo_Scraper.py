@@ -1,8 +1,12 @@
 import json
 import re
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Optional, Tuple
+
+from Artifact_IO import artifact_path, write_records
+from HTML_Parsing import parse_region
+from HTTP_Client import HTTPClient, get_default_client
+from Pipeline_Records import Memo
 
 
 class ArmyGuidanceScraper:
@@ -21,23 +25,34 @@ class ArmyGuidanceScraper:
     }
 
     DATE_REGEX = re.compile(r"^(\d{2}/\d{2}/\d{4})\s*—\s*(.*)$")
+    PARSE_ONLY = SoupStrainer("section", class_="microtext")
 
-    def __init__(self, url: str = None):
+    def __init__(self, url: str = None, client: HTTPClient = None, parser: str = None, output_format: str = None):
         self.url = url or self.DEFAULT_URL
+        self.client = client or get_default_client()
+        self.parser = parser
+        self.output_path = artifact_path(self.OUTPUT_PATH, output_format)
 
     def scrape(self) -> str:
+        return json.dumps([memo.to_dict() for memo in self.scrape_records()], indent=2, ensure_ascii=False)
+
+    def scrape_records(self) -> List[Memo]:
         html = self._fetch_html()
         memos = self._extract_memos(html)
         self._write_to_file(memos)
-        return json.dumps(memos, indent=2, ensure_ascii=False)
+        return memos
 
     def _fetch_html(self) -> str:
-        response = requests.get(self.url, headers=self.HEADERS, timeout=10)
+        response = self.client.get(self.url, headers=self.HEADERS, timeout=10)
         response.raise_for_status()
         return response.text
 
-    def _extract_memos(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, "html.parser")
+    def parse_listing(self, html: str, page_url: str) -> Tuple[List[Memo], List[str]]:
+        """Returns the memos on the guidance page; it is not paginated, so there are no page links."""
+        return self._extract_memos(html), []
+
+    def _extract_memos(self, html: str) -> List[Memo]:
+        soup = parse_region(html, self.PARSE_ONLY, self.parser)
         section = self._find_target_section(soup)
         if not section:
             return []
@@ -52,25 +67,17 @@ class ArmyGuidanceScraper:
                 return section
         return None
 
-    def _parse_list_item(self, li_tag) -> Dict:
+    def _parse_list_item(self, li_tag) -> Memo:
         link_tag = li_tag.find("a")
         title = link_tag.get_text(strip=True)
         pdf_link = link_tag.get("href", "").strip()
         date = self._extract_date(li_tag.get_text(" ", strip=True))
 
-        return {
-            "title": title,
-            "pdf_link": pdf_link,
-            "from": None,
-            "date": date,
-            "stakeholders": None,
-            "combined_text": None,
-        }
+        return Memo(title=title, pdf_link=pdf_link, date=date)
 
     def _extract_date(self, text: str) -> Optional[str]:
         match = self.DATE_REGEX.match(text)
         return match.group(1) if match else None
 
-    def _write_to_file(self, memos: List[Dict]) -> None:
-        with open(self.OUTPUT_PATH, "w", encoding="utf-8") as f:
-            json.dump(memos, f, indent=2, ensure_ascii=False)
+    def _write_to_file(self, memos: List[Memo]) -> None:
+        write_records(self.output_path, (memo.to_dict() for memo in memos))
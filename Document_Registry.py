@@ -0,0 +1,58 @@
+import threading
+from concurrent.futures import Future
+from typing import Dict, Tuple
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+
+class DocumentRegistry:
+    """
+    Run-wide registry that lets every PDF be fetched and analyzed once.
+
+    Links are normalized before they are claimed, so the same PDF reached through
+    different spellings of its URL is only downloaded once. After download, the
+    content hash is claimed too, so identical bytes served from different URLs
+    are only parsed once. The first claimant of a key owns it and must resolve
+    the returned future; every later claimant waits on that future instead.
+    """
+
+    DEFAULT_PORTS = {"http": 80, "https": 443}
+    TRACKING_PARAM_PREFIXES = ("utm_",)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_url: Dict[str, Future] = {}
+        self._by_content: Dict[str, Future] = {}
+
+    @classmethod
+    def normalize_url(cls, url: str) -> str:
+        """Canonical form of ``url``: lowercase scheme and host, no default port,
+        fragment or tracking parameters, sorted query and consistent escaping."""
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = (parts.hostname or "").lower()
+        port = parts.port
+        netloc = host if port is None or cls.DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+        path = quote(unquote(parts.path), safe="/:@!$&'()*+,;=~") or "/"
+        query = urlencode(
+            sorted(
+                (key, value)
+                for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                if not key.lower().startswith(cls.TRACKING_PARAM_PREFIXES)
+            )
+        )
+        return urlunsplit((scheme, netloc, path, query, ""))
+
+    def claim_url(self, url: str) -> Tuple[Future, bool]:
+        """Returns the future for ``url``'s analysis and whether the caller owns it."""
+        return self._claim(self._by_url, self.normalize_url(url))
+
+    def claim_content(self, content_hash: str) -> Tuple[Future, bool]:
+        """Returns the future for the analysis of these bytes and whether the caller owns it."""
+        return self._claim(self._by_content, content_hash)
+
+    def _claim(self, claims: Dict[str, Future], key: str) -> Tuple[Future, bool]:
+        with self._lock:
+            if key in claims:
+                return claims[key], False
+            future = claims[key] = Future()
+            return future, True
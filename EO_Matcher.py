@@ -0,0 +1,437 @@
+import math
+import re
+import unicodedata
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+
+@dataclass(frozen=True)
+class EOMatch:
+    """A single EO hit: ``kind`` is "numeric", "keyword" or "title"; offsets index the scanned text."""
+
+    eo_number: str
+    start: int
+    end: int
+    kind: str
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick automaton over lowercase phrases.
+
+    Scanning is linear in the length of the text regardless of how many phrases
+    were added. Each hit reports the end offset and the payload of the phrase.
+    """
+
+    def __init__(self):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, object]]] = [[]]
+        self._built = False
+
+    def add(self, phrase: str, payload: object) -> None:
+        phrase = phrase.lower()
+        if not phrase:
+            return
+
+        state = 0
+        for ch in phrase:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._out[state].append((len(phrase), payload))
+        self._built = False
+
+    def build(self) -> "KeywordAutomaton":
+        """Computes failure links breadth-first and merges outputs along them."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+        self._built = True
+        return self
+
+    def scan(self, lowered: str, state: int = 0) -> Tuple[List[Tuple[int, int, object]], int]:
+        """
+        Scans already-lowercased text starting from ``state``.
+
+        Returns ``(hits, state)`` where each hit is ``(start, end, payload)``
+        relative to ``lowered`` and ``state`` can be passed back in to continue
+        a scan across chunk boundaries. Starts of hits that began in an earlier
+        chunk are negative.
+        """
+        if not self._built:
+            self.build()
+
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = []
+        for index, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = index + 1
+                for length, payload in out[state]:
+                    hits.append((end - length, end, payload))
+        return hits, state
+
+
+class TitleShingleIndex:
+    """
+    Approximate EO title matching through an inverted index of word shingles.
+
+    Titles and text are tokenized the same way: punctuation, dashes and quotes
+    separate words and are dropped, accents are folded and case is ignored, so
+    "K–12" and "K-12" or "President’s" and "President's" give the same tokens.
+    Each title is indexed by its runs of ``SHINGLE_SIZE`` consecutive tokens. A
+    title matches when at least ``MIN_COVERAGE`` of its shingles occur within a
+    window not much longer than the title, which tolerates an inserted, dropped
+    or reworded word. Shingles shared by more than ``MAX_TITLES_PER_SHINGLE``
+    titles (boilerplate such as "of the United") are not indexed.
+
+    Titles that share a long prefix ("Initial Rescissions of Harmful Executive
+    Orders" and "Additional Rescissions of ...") would otherwise match each
+    other's quotes, so at least ``MIN_DISTINCTIVE_COVERAGE`` (and at least one)
+    of a title's distinguishing shingles must be in the window as well: those no
+    other title has, or if there are none, those shared by the fewest titles. Where candidates overlap in the text, only
+    the best-covered ones are kept.
+
+    A document costs one dictionary lookup per token plus the work on the titles
+    it actually hits, however many titles are indexed.
+    """
+
+    SHINGLE_SIZE = 3
+    MIN_COVERAGE = 0.6
+    MIN_DISTINCTIVE_COVERAGE = 0.3
+    MAX_TITLES_PER_SHINGLE = 16
+    WINDOW_SLACK = 1.5
+    WORD = re.compile(r"[^\W_]+")
+
+    def __init__(self, titles: Dict[str, str]):
+        """``titles`` maps EO numbers to their titles; titles shorter than a shingle are skipped."""
+        postings: Dict[str, List[int]] = {}
+        self._titles: List[Tuple[str, int]] = []
+        for eo_number, title in sorted(titles.items()):
+            tokens = [token for token, _, _ in self.tokenize(title)]
+            shingles = set(self._shingles(tokens))
+            if not shingles:
+                continue
+            for shingle in shingles:
+                postings.setdefault(shingle, []).append(len(self._titles))
+            self._titles.append((eo_number, len(tokens)))
+
+        self._index = {
+            shingle: title_ids
+            for shingle, title_ids in postings.items()
+            if len(title_ids) <= self.MAX_TITLES_PER_SHINGLE
+        }
+        indexed = Counter(title_id for title_ids in self._index.values() for title_id in title_ids)
+        self._required = [
+            math.ceil(self.MIN_COVERAGE * indexed[title_id]) if indexed[title_id] else 0
+            for title_id in range(len(self._titles))
+        ]
+        self._indexed = indexed
+
+        rarest: Dict[int, int] = {}
+        for title_ids in self._index.values():
+            for title_id in title_ids:
+                rarest[title_id] = min(rarest.get(title_id, len(title_ids)), len(title_ids))
+        self._distinctive: List[Set[str]] = [set() for _ in self._titles]
+        for shingle, title_ids in self._index.items():
+            for title_id in title_ids:
+                if len(title_ids) == rarest[title_id]:
+                    self._distinctive[title_id].add(shingle)
+        self._required_distinctive = [
+            max(1, math.ceil(self.MIN_DISTINCTIVE_COVERAGE * len(distinctive))) for distinctive in self._distinctive
+        ]
+
+    def __len__(self) -> int:
+        return sum(1 for required in self._required if required)
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[Tuple[str, int, int]]:
+        """Folded words of ``text`` with their start and end offsets in ``text``."""
+        tokens = []
+        for match in cls.WORD.finditer(text):
+            word = match.group()
+            if not word.isascii():
+                word = unicodedata.normalize("NFKD", word).encode("ascii", "ignore").decode("ascii")
+            tokens.append((word.lower(), match.start(), match.end()))
+        return tokens
+
+    def find_matches(self, text: str) -> List[EOMatch]:
+        tokens = self.tokenize(text)
+        words = [token for token, _, _ in tokens]
+
+        hits: Dict[int, List[Tuple[int, str]]] = {}
+        for position, shingle in enumerate(self._shingles(words)):
+            for title_id in self._index.get(shingle, ()):
+                hits.setdefault(title_id, []).append((position, shingle))
+
+        candidates = []
+        for title_id, title_hits in hits.items():
+            required = self._required[title_id]
+            if len(title_hits) < required:
+                continue
+            eo_number, length = self._titles[title_id]
+            window = max(length, int(length * self.WINDOW_SLACK)) - self.SHINGLE_SIZE + 1
+            for first, last, covered in self._dense_windows(
+                title_hits, required, window, self._distinctive[title_id], self._required_distinctive[title_id]
+            ):
+                end_token = tokens[last + self.SHINGLE_SIZE - 1]
+                match = EOMatch(eo_number, tokens[first][1], end_token[2], "title")
+                candidates.append((covered / self._indexed[title_id], covered, match))
+        return self._best_covered(candidates)
+
+    def _shingles(self, words: List[str]) -> List[str]:
+        size = self.SHINGLE_SIZE
+        return [" ".join(words[index:index + size]) for index in range(len(words) - size + 1)]
+
+    @staticmethod
+    def _dense_windows(
+        hits: List[Tuple[int, str]], required: int, window: int, distinctive: Set[str], required_distinctive: int
+    ) -> List[Tuple[int, int, int]]:
+        """
+        Non-overlapping (first, last, covered) hit positions spanning ``required`` distinct
+        shingles, ``required_distinctive`` of them from ``distinctive``, within ``window``.
+        A span that qualifies keeps growing while later hits fit in the window, and repeated
+        shingles are dropped from its start, so it covers as much of one quote as it can.
+        ``covered`` is the number of distinct shingles in the span.
+        """
+        found, counts, left, rare, qualified = [], Counter(), 0, 0, False
+        for right, (position, shingle) in enumerate(hits):
+            if qualified and position - hits[left][0] >= window:
+                found.append((hits[left][0], hits[right - 1][0], len(counts)))
+                counts.clear()
+                left, rare, qualified = right, 0, False
+            if not counts[shingle] and shingle in distinctive:
+                rare += 1
+            counts[shingle] += 1
+            while position - hits[left][0] >= window or counts[hits[left][1]] > 1:
+                dropped = hits[left][1]
+                counts[dropped] -= 1
+                if not counts[dropped]:
+                    del counts[dropped]
+                    if dropped in distinctive:
+                        rare -= 1
+                left += 1
+            qualified = qualified or (len(counts) >= required and rare >= required_distinctive)
+        if qualified:
+            found.append((hits[left][0], hits[-1][0], len(counts)))
+        return found
+
+    @staticmethod
+    def _best_covered(candidates: List[Tuple[float, int, EOMatch]]) -> List[EOMatch]:
+        """
+        Drops each candidate that overlaps a better one: a higher share of its title
+        covered, or the same share over more shingles (a longer title quoted in full
+        against a shorter one it contains). Equally good overlapping candidates are kept.
+        """
+        candidates.sort(key=lambda candidate: candidate[:2], reverse=True)
+        kept: List[Tuple[float, int, EOMatch]] = []
+        for candidate in candidates:
+            match = candidate[2]
+            if not any(
+                other[:2] > candidate[:2] and other[2].start < match.end and match.start < other[2].end
+                for other in kept
+            ):
+                kept.append(candidate)
+        return [match for _, _, match in kept]
+
+
+class _NumericTrigger:
+    """
+    Automaton payload marking a numeric trigger. It is recognized by type, not
+    identity, because the matcher is pickled into parse worker processes.
+    """
+
+
+class EOMatcher:
+    """
+    Finds numeric EO citations and EO title keywords in a single pass.
+
+    The numeric pattern is not run over the whole document. Instead its leading
+    literals ("Executive Order", "E.O.") are added to the keyword automaton as
+    triggers, and the pattern is only anchored at the offsets where a trigger
+    was seen.
+
+    With ``titles`` (EO number to title, e.g. from the scraped EO list), titles
+    are also matched approximately through a ``TitleShingleIndex``.
+    """
+
+    NUMERIC_TRIGGERS = ("executive order", "e.o.")
+
+    _TRIGGER = _NumericTrigger()
+
+    def __init__(
+        self, keywords: Dict[str, Iterable[str]], numeric_pattern: Pattern, titles: Optional[Dict[str, str]] = None
+    ):
+        self.numeric_pattern = numeric_pattern
+        self.title_index = TitleShingleIndex(titles) if titles else None
+        self.automaton = KeywordAutomaton()
+        for trigger in self.NUMERIC_TRIGGERS:
+            self.automaton.add(trigger, self._TRIGGER)
+        for eo_number, phrases in keywords.items():
+            for phrase in phrases:
+                self.automaton.add(phrase, eo_number)
+        self.automaton.build()
+
+    def find_matches(self, text: str) -> List[EOMatch]:
+        """Returns every numeric and keyword hit in ``text``, ordered by end offset."""
+        lowered, offsets = self._lower(text)
+        hits, _ = self.automaton.scan(lowered)
+
+        matches = []
+        for start, end, payload in hits:
+            start, end = offsets(start), offsets(end)
+            if isinstance(payload, _NumericTrigger):
+                numeric = self._match_numeric(text, start)
+                if numeric:
+                    matches.append(numeric)
+            else:
+                matches.append(EOMatch(payload, start, end, "keyword"))
+        if self.title_index:
+            matches.extend(self.title_index.find_matches(text))
+            matches.sort(key=lambda match: match.end)
+        return matches
+
+    def find_eo_numbers(self, text: str) -> Set[str]:
+        return {match.eo_number for match in self.find_matches(text)}
+
+    def stream(self) -> "EOStreamScanner":
+        """Returns a scanner that matches text fed to it in chunks."""
+        return EOStreamScanner(self)
+
+    def _match_numeric(self, text: str, start: int) -> Optional[EOMatch]:
+        match = self.numeric_pattern.match(text, start)
+        if not match:
+            return None
+        number = next((group for group in match.groups()[1:] if group), None)
+        if not number:
+            return None
+        return EOMatch(number, match.start(), match.end(), "numeric")
+
+    @staticmethod
+    def _lower(text: str):
+        """
+        Lowercases ``text`` and returns a function mapping lowered offsets back to
+        ``text``. The mapping is the identity unless lowercasing changed the length.
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            return lowered, lambda offset: offset
+
+        pieces, origin = [], []
+        for index, ch in enumerate(text):
+            lower_ch = ch.lower()
+            pieces.append(lower_ch)
+            origin.extend([index] * len(lower_ch))
+        origin.append(len(text))
+        return "".join(pieces), lambda offset: origin[offset]
+
+
+class EOStreamScanner:
+    """
+    Incremental counterpart of ``EOMatcher.find_matches`` for text that arrives in
+    chunks (e.g. one PDF page at a time).
+
+    The automaton state carries over between chunks, so phrases split across a
+    chunk boundary are still found. Only the text needed to confirm pending
+    numeric citations is retained, which keeps memory independent of document size.
+    Offsets are absolute over the concatenation of all fed chunks.
+    """
+
+    # How far past a trigger a numeric citation may extend before it is given up on.
+    NUMERIC_LOOKAHEAD = 256
+    # Text kept from earlier chunks so approximate titles that straddle a boundary are found.
+    TITLE_CARRY = 1024
+
+    def __init__(self, matcher: EOMatcher):
+        self.matcher = matcher
+        self._state = 0
+        self._buffer = ""
+        self._buffer_start = 0
+        self._pending: List[int] = []
+        self._trigger_length = max(len(trigger) for trigger in matcher.NUMERIC_TRIGGERS)
+        self._title_tail = ""
+
+    def feed(self, chunk: str) -> List[EOMatch]:
+        """Scans ``chunk`` and returns the matches that could be confirmed so far."""
+        chunk_start = self._buffer_start + len(self._buffer)
+        lowered, offsets = self.matcher._lower(chunk)
+        hits, self._state = self.matcher.automaton.scan(lowered, self._state)
+        self._buffer += chunk
+
+        matches = []
+        for start, end, payload in hits:
+            end = chunk_start + offsets(end)
+            # A hit that began in an earlier chunk has a negative start.
+            start = chunk_start + (offsets(start) if start >= 0 else start)
+            if isinstance(payload, _NumericTrigger):
+                self._pending.append(start)
+            else:
+                matches.append(EOMatch(payload, start, end, "keyword"))
+
+        matches.extend(self._resolve_pending(final=False))
+        if self.matcher.title_index:
+            matches.extend(self._match_titles(chunk, chunk_start))
+        self._trim()
+        return matches
+
+    def finish(self) -> List[EOMatch]:
+        """Confirms any numeric citations still waiting for more text."""
+        matches = self._resolve_pending(final=True)
+        self._pending.clear()
+        self._buffer = ""
+        return matches
+
+    def _match_titles(self, chunk: str, chunk_start: int) -> List[EOMatch]:
+        # Titles ending inside the carried tail were already reported with the previous chunk.
+        text = self._title_tail + chunk
+        text_start = chunk_start - len(self._title_tail)
+        matches = [
+            EOMatch(match.eo_number, text_start + match.start, text_start + match.end, "title")
+            for match in self.matcher.title_index.find_matches(text)
+            if match.end > len(self._title_tail)
+        ]
+        self._title_tail = text[-self.TITLE_CARRY:]
+        return matches
+
+    def _resolve_pending(self, final: bool) -> List[EOMatch]:
+        matches, still_pending = [], []
+        buffer_end = len(self._buffer)
+        for start in self._pending:
+            local = start - self._buffer_start
+            numeric = self.matcher._match_numeric(self._buffer, local)
+            # A match that stops short of the buffer end cannot change with more text.
+            settled = final or (numeric and numeric.end < buffer_end) or buffer_end - local > self.NUMERIC_LOOKAHEAD
+            if not settled:
+                still_pending.append(start)
+            elif numeric:
+                matches.append(EOMatch(numeric.eo_number, numeric.start + self._buffer_start,
+                                       numeric.end + self._buffer_start, "numeric"))
+        self._pending = still_pending
+        return matches
+
+    def _trim(self) -> None:
+        # Keep enough tail for a trigger that is only partly scanned, plus one
+        # character before the earliest pending trigger for the \b check.
+        buffer_end = self._buffer_start + len(self._buffer)
+        keep_from = min(self._pending, default=buffer_end - self._trigger_length) - 1
+        drop = max(0, keep_from - self._buffer_start)
+        if drop:
+            self._buffer = self._buffer[drop:]
+            self._buffer_start += drop
@@ -0,0 +1,280 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from EO_Reference_Consolidator import document_id, iter_eo_links
+
+
+class EOQueryStore:
+    """
+    Indexed SQLite copy of the consolidated EO references for the dashboard.
+
+    ``rebuild`` normalizes the consolidated JSON into ``eos``, ``documents`` and
+    ``links`` tables, indexed on EO number, source, date and agency, plus a
+    ``eo_source_counts`` table of precomputed per-EO/per-source document counts.
+    Documents are keyed by ``document_id``, the ID the normalized output uses, so
+    documents without a link or sharing one stay separate.
+    The query methods answer dashboard filters and aggregations with SQL, so
+    callbacks never load or scan the whole JSON.
+
+    Rows returned by ``documents`` have the same keys as ``flatten_eo_docs`` rows.
+    """
+
+    DEFAULT_PATH = Path("./docs/eo_docs.sqlite")
+    # Agency recorded for a document without a "from" field.
+    SOURCE_AGENCIES = {"opm": "OPM", "dod": "DoD", "da": "Army"}
+    DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%B %d, %Y", "%b %d, %Y", "%b. %d, %Y", "%m/%d/%y")
+
+    SCHEMA = """
+        CREATE TABLE eos (
+            eo_number TEXT PRIMARY KEY,
+            eo_title TEXT,
+            eo_link TEXT
+        );
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY,
+            doc_key TEXT NOT NULL UNIQUE,
+            source TEXT NOT NULL,
+            doc_link TEXT,
+            doc_title TEXT,
+            date TEXT,
+            date_iso TEXT,
+            agency TEXT,
+            from_ TEXT,
+            stakeholders TEXT
+        );
+        CREATE TABLE links (
+            eo_number TEXT NOT NULL,
+            document_id INTEGER NOT NULL,
+            PRIMARY KEY (eo_number, document_id)
+        );
+        CREATE TABLE eo_source_counts (
+            eo_number TEXT NOT NULL,
+            source TEXT NOT NULL,
+            documents INTEGER NOT NULL,
+            PRIMARY KEY (eo_number, source)
+        );
+        CREATE INDEX documents_source ON documents (source);
+        CREATE INDEX documents_date ON documents (date_iso);
+        CREATE INDEX documents_agency ON documents (agency);
+        CREATE INDEX links_document ON links (document_id);
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or self.DEFAULT_PATH)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def rebuild(self, eo_data: Union[Iterable[Dict], Dict]) -> None:
+        """
+        Replaces the store with ``eo_data`` (the consolidated output, nested or normalized,
+        or a stream of nested EO records).
+        The new file is built next to the old one and swapped in, so open readers are
+        not disturbed.
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+
+        conn = sqlite3.connect(str(tmp_path))
+        try:
+            conn.executescript(self.SCHEMA)
+            document_ids: Dict[str, int] = {}
+            issued: Dict[str, str] = {}
+            for eo, docs in iter_eo_links(eo_data):
+                conn.execute(
+                    "INSERT OR REPLACE INTO eos (eo_number, eo_title, eo_link) VALUES (?, ?, ?)",
+                    (eo["eo_number"], eo.get("eo_title"), eo.get("eo_link")),
+                )
+                for source, doc in docs:
+                    record = {key: value for key, value in doc.items() if key != "source"}
+                    doc_key = document_id(source, record, issued)
+                    if doc_key not in document_ids:
+                        document_ids[doc_key] = conn.execute(
+                            "INSERT INTO documents (doc_key, source, doc_link, doc_title, date, date_iso, agency, "
+                            "from_, stakeholders) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                            (
+                                doc_key,
+                                source,
+                                doc.get("pdf_link") or "",
+                                doc.get("title") or doc.get("doc_number"),
+                                doc.get("date"),
+                                self._iso_date(doc.get("date")),
+                                doc.get("from") or self.SOURCE_AGENCIES.get(source),
+                                doc.get("from"),
+                                doc.get("stakeholders"),
+                            ),
+                        ).lastrowid
+                    conn.execute(
+                        "INSERT OR IGNORE INTO links (eo_number, document_id) VALUES (?, ?)",
+                        (eo["eo_number"], document_ids[doc_key]),
+                    )
+            conn.execute(
+                "INSERT INTO eo_source_counts (eo_number, source, documents) "
+                "SELECT l.eo_number, d.source, COUNT(*) FROM links l JOIN documents d ON d.id = l.document_id "
+                "GROUP BY l.eo_number, d.source"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+            os.replace(tmp_path, self.path)
+
+    def documents(
+        self,
+        eo_number: Optional[str] = None,
+        source: Optional[str] = None,
+        agency: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Dict]:
+        """EO↔document rows matching every given filter, newest first. Dates are ISO ``YYYY-MM-DD``."""
+        where, params = self._filters(eo_number, source, agency, date_from, date_to)
+        query = (
+            "SELECT e.eo_number, e.eo_title, e.eo_link, d.source, d.doc_title, d.doc_link, d.date, "
+            "d.from_, d.stakeholders FROM links l JOIN documents d ON d.id = l.document_id "
+            "JOIN eos e ON e.eo_number = l.eo_number"
+            f"{where} ORDER BY d.date_iso IS NULL, d.date_iso DESC, l.eo_number, d.id LIMIT ? OFFSET ?"
+        )
+        rows = self._query(query, params + [-1 if limit is None else limit, offset])
+        columns = (
+            "eo_number", "eo_title", "eo_link", "source", "doc_title", "doc_link", "date", "from", "stakeholders"
+        )
+        return [dict(zip(columns, row)) for row in rows]
+
+    def count_links(
+        self,
+        eo_number: Optional[str] = None,
+        source: Optional[str] = None,
+        agency: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+    ) -> int:
+        """Number of rows ``documents`` would return without a limit, for pagination."""
+        where, params = self._filters(eo_number, source, agency, date_from, date_to)
+        query = f"SELECT COUNT(*) FROM links l JOIN documents d ON d.id = l.document_id{where}"
+        return self._query(query, params)[0][0]
+
+    def eo_counts(self, source: Optional[str] = None) -> List[Dict]:
+        """
+        Per-EO document counts by source from the precomputed table, most referenced first.
+        With ``source`` only its documents are counted; EOs it never cites are listed with zero.
+        """
+        join, params = "c.eo_number = e.eo_number", []
+        if source:
+            # Filtered in the join, not a WHERE, so the LEFT JOIN keeps EOs without such documents.
+            join += " AND c.source = ?"
+            params.append(source)
+        query = (
+            "SELECT e.eo_number, e.eo_title, "
+            "COALESCE(SUM(CASE WHEN c.source = 'opm' THEN c.documents END), 0), "
+            "COALESCE(SUM(CASE WHEN c.source = 'dod' THEN c.documents END), 0), "
+            "COALESCE(SUM(CASE WHEN c.source = 'da' THEN c.documents END), 0), "
+            "COALESCE(SUM(c.documents), 0) AS total "
+            f"FROM eos e LEFT JOIN eo_source_counts c ON {join} "
+            "GROUP BY e.eo_number ORDER BY total DESC, e.eo_number"
+        )
+        columns = ("eo_number", "eo_title", "opm", "dod", "da", "total")
+        return [dict(zip(columns, row)) for row in self._query(query, params)]
+
+    def source_counts(self) -> Dict[str, int]:
+        """Documents per source, each counted once however many EOs it references."""
+        return dict(self._query("SELECT source, COUNT(*) FROM documents GROUP BY source ORDER BY source", []))
+
+    def agency_counts(self, source: Optional[str] = None) -> Dict[str, int]:
+        query, params = "SELECT agency, COUNT(*) FROM documents", []
+        if source:
+            query += " WHERE source = ?"
+            params.append(source)
+        query += " GROUP BY agency ORDER BY COUNT(*) DESC, agency"
+        return dict(self._query(query, params))
+
+    def eo_numbers(self) -> List[str]:
+        return [row[0] for row in self._query("SELECT eo_number FROM eos ORDER BY eo_number", [])]
+
+    def date_range(self) -> Tuple[Optional[str], Optional[str]]:
+        return tuple(self._query("SELECT MIN(date_iso), MAX(date_iso) FROM documents", [])[0])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def _filters(
+        self,
+        eo_number: Optional[str],
+        source: Optional[str],
+        agency: Optional[str],
+        date_from: Optional[str],
+        date_to: Optional[str],
+    ) -> Tuple[str, List]:
+        conditions, params = [], []
+        for condition, value in (
+            ("l.eo_number = ?", eo_number),
+            ("d.source = ?", source),
+            ("d.agency = ?", agency),
+            ("d.date_iso >= ?", date_from),
+            ("d.date_iso <= ?", date_to),
+        ):
+            if value:
+                conditions.append(condition)
+                params.append(value)
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def _query(self, query: str, params: List) -> List[Tuple]:
+        with self._lock:
+            if self._conn is None:
+                # Read-only: the dashboard never writes, and rebuilds swap the file underneath it.
+                self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+            return self._conn.execute(query, params).fetchall()
+
+    @classmethod
+    def _iso_date(cls, value: Optional[str]) -> Optional[str]:
+        for date_format in cls.DATE_FORMATS:
+            try:
+                return datetime.strptime((value or "").strip(), date_format).date().isoformat()
+            except ValueError:
+                continue
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Query the indexed EO reference store.")
+    parser.add_argument("--eo", dest="eo_number", help="only links to this EO number")
+    parser.add_argument("--source", help="only documents from this source (opm, dod, da)")
+    parser.add_argument("--agency", help="only documents from this agency")
+    parser.add_argument("--since", dest="date_from", help="only documents dated on or after YYYY-MM-DD")
+    parser.add_argument("--until", dest="date_to", help="only documents dated on or before YYYY-MM-DD")
+    parser.add_argument("--counts", action="store_true", help="print per-EO counts by source instead of rows")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--store", type=Path, default=EOQueryStore.DEFAULT_PATH, help="store file")
+    args = parser.parse_args(argv)
+
+    if not args.store.exists():
+        parser.error(f"no store at {args.store}; run flatten.py first")
+
+    store = EOQueryStore(args.store)
+    try:
+        if args.counts:
+            result = store.eo_counts(args.source)[: args.limit]
+        else:
+            result = store.documents(args.eo_number, args.source, args.agency, args.date_from, args.date_to, args.limit)
+    finally:
+        store.close()
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,67 @@
+import hashlib
 import json
 import re
-from typing import Dict, List
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+from Artifact_IO import artifact_format, read_records
+from Document_Registry import DocumentRegistry
+from Pipeline_Records import ExecutiveOrder, Memo, PresidentialDocument, PresidentialOrders
+
+# Source label and consolidated-JSON key of each document list on an EO.
+SOURCE_KEYS = (("opm", "opm_docs"), ("dod", "dod_docs"), ("da", "da_docs"))
+NORMALIZED_FORMAT = "normalized"
+
+
+def load_consolidated(path: Union[str, Path]) -> Union[List[Dict], Dict, Iterator[Dict]]:
+    """
+    The consolidated output at ``path`` in a form ``iter_eo_links`` accepts. NDJSON
+    artifacts (nested EOs, one per line) come back as a one-shot iterator.
+    """
+    if artifact_format(path) == "json":
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return read_records(path)
+
+
+def iter_eo_links(eo_data: Union[Iterable[Dict], Dict]) -> Iterator[Tuple[Dict, List[Tuple[str, Dict]]]]:
+    """
+    Yields each EO of a consolidated output with its ``(source, document)`` pairs,
+    for both the nested and the normalized format. Normalized documents are yielded
+    as the same dict every time they are referenced.
+    """
+    if isinstance(eo_data, dict) and eo_data.get("format") == NORMALIZED_FORMAT:
+        documents = eo_data["documents"]
+        for eo in eo_data["executive_orders"]:
+            yield eo, [(source, documents[doc_id]) for source, key in SOURCE_KEYS for doc_id in eo.get(key, [])]
+    else:
+        for eo in eo_data:
+            yield eo, [(source, doc) for source, key in SOURCE_KEYS for doc in eo.get(key, [])]
+
+
+def document_id(source: str, record: Dict, ids: Optional[Dict[str, str]] = None) -> str:
+    """
+    Stable ID of a document record (``Memo``/``PresidentialDocument.to_dict`` without
+    references) from its source and normalized PDF link, or its title if it has no link.
+
+    ``ids`` maps the IDs handed out so far to a digest of their record. A different
+    record of the same source whose link or title is already taken gets an ID that
+    hashes its content as well, so both documents are kept.
+    """
+    link = record.get("pdf_link")
+    key = DocumentRegistry.normalize_url(link) if link else f"title:{record.get('title')}"
+    doc_id = f"{source}-{_short_hash(key)}"
+    if ids is None:
+        return doc_id
+    digest = _short_hash(json.dumps(record, sort_keys=True, ensure_ascii=False))
+    if ids.setdefault(doc_id, digest) != digest:
+        doc_id = f"{source}-{_short_hash(f'{key}|{digest}')}"
+        ids.setdefault(doc_id, digest)
+    return doc_id
+
+
+def _short_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
 
 
 class EOReferenceConsolidator:
@@ -8,70 +69,130 @@ class EOReferenceConsolidator:
     Consolidates Executive Orders with related OPM, DA (Army), and DoD memos.
     """
 
+    WORD_TOKEN = re.compile(r"\w+")
+
     def __init__(self):
         pass
 
     def build_relationships(self, po_json_str: str, army_json_str: str, opm_json_str: str) -> str:
-        po_data = json.loads(po_json_str)
-        army_memos = json.loads(army_json_str)
-        opm_memos = json.loads(opm_json_str)
+        """JSON-in/JSON-out wrapper around ``consolidate``."""
+        executive_orders = self.consolidate(
+            PresidentialOrders.from_dict(json.loads(po_json_str)),
+            [Memo.from_dict(memo) for memo in json.loads(army_json_str)],
+            [Memo.from_dict(memo) for memo in json.loads(opm_json_str)],
+        )
+        return json.dumps([eo.to_dict() for eo in executive_orders], indent=2, ensure_ascii=False)
+
+    def normalize(self, executive_orders: List[ExecutiveOrder]) -> Dict:
+        """
+        Normalized alternative to ``[eo.to_dict() ...]``: every document is stored once
+        under a stable ID in ``documents``, and each EO lists the IDs it is cited by.
+        Size grows with the number of documents rather than documents × references.
+        Distinct records that share a link keep separate IDs (see ``document_id``).
+        """
+        documents: Dict[str, Dict] = {}
+        assigned: Dict[int, str] = {}
+        ids: Dict[str, str] = {}
+        entries = []
+        for eo in executive_orders:
+            entry = {"eo_number": eo.eo_number, "eo_title": eo.eo_title, "eo_link": eo.eo_link}
+            for source, key in SOURCE_KEYS:
+                doc_ids = []
+                for doc in getattr(eo, key):
+                    # The same record is shared by every EO it cites, so it is only serialized once.
+                    doc_id = assigned.get(id(doc))
+                    if doc_id is None:
+                        record = doc.to_dict(include_references=False)
+                        doc_id = assigned[id(doc)] = document_id(source, record, ids)
+                        documents.setdefault(doc_id, {"source": source, **record})
+                    doc_ids.append(doc_id)
+                entry[key] = doc_ids
+            entries.append(entry)
+        return {"format": NORMALIZED_FORMAT, "documents": documents, "executive_orders": entries}
 
-        executive_orders = self._extract_executive_orders(po_data.get("executive_orders", []))
-        eo_numbers = {eo["eo_number"] for eo in executive_orders}
+    def consolidate(
+        self,
+        presidential_orders: PresidentialOrders,
+        army_memos: List[Memo],
+        opm_memos: List[Memo],
+    ) -> List[ExecutiveOrder]:
+        executive_orders = self._extract_executive_orders(presidential_orders.executive_orders)
+        eo_numbers = {eo.eo_number for eo in executive_orders}
 
         eo_to_opm = self._map_references(opm_memos)
         eo_to_da = self._map_references(army_memos)
-        eo_to_dod = self._map_dod_references(po_data.get("memos", []), eo_numbers)
+        eo_to_dod = self._map_dod_references(presidential_orders.memos, eo_numbers)
 
         self._merge_references(executive_orders, eo_to_opm, eo_to_da, eo_to_dod)
 
-        return json.dumps(executive_orders, indent=2, ensure_ascii=False)
+        return executive_orders
 
-    def _extract_executive_orders(self, eo_list: List[Dict]) -> List[Dict]:
+    def _extract_executive_orders(self, eo_list: List[PresidentialDocument]) -> List[ExecutiveOrder]:
         extracted = []
         for eo in eo_list:
-            doc_number = eo.get("doc_number", "").strip()
-            if doc_number.upper().startswith("EO "):
-                eo_number = doc_number[3:].strip()
-                extracted.append({
-                    "eo_number": eo_number,
-                    "eo_title": eo.get("title", ""),
-                    "eo_link": eo.get("pdf_link", ""),
-                    "opm_docs": [],
-                    "dod_docs": [],
-                    "da_docs": []
-                })
+            if eo.eo_number is not None:
+                extracted.append(ExecutiveOrder(eo_number=eo.eo_number, eo_title=eo.title, eo_link=eo.pdf_link))
         return extracted
 
-    def _map_references(self, memos: List[Dict]) -> Dict[str, List[Dict]]:
+    def _map_references(self, memos: List[Memo]) -> Dict[str, List[Memo]]:
         reference_map = {}
         for memo in memos:
-            for ref in memo.get("eo_references", []):
-                cleaned_memo = {k: v for k, v in memo.items() if k != "eo_references"}
-                reference_map.setdefault(ref.strip(), []).append(cleaned_memo)
+            for ref in memo.eo_references or []:
+                reference_map.setdefault(ref.strip(), []).append(memo)
         return reference_map
 
-    def _map_dod_references(self, memos: List[Dict], eo_numbers: set) -> Dict[str, List[Dict]]:
+    def _map_dod_references(
+        self, memos: List[PresidentialDocument], eo_numbers: set
+    ) -> Dict[str, List[PresidentialDocument]]:
         mapping = {eo: [] for eo in eo_numbers}
-        for memo in memos:
-            doc_number = memo.get("doc_number", "")
-            title = memo.get("title", "")
-            cleaned = {k: v for k, v in memo.items() if k != "eo_references"}
+        token_index, fallback_patterns = self._build_eo_index(eo_numbers)
 
-            for eo in eo_numbers:
-                if re.search(rf"\b{re.escape(eo)}\b", doc_number) or re.search(rf"\b{re.escape(eo)}\b", title):
-                    mapping[eo].append(cleaned)
+        for memo in memos:
+            for eo in self._find_eo_numbers(memo.doc_number, memo.title, token_index, fallback_patterns):
+                mapping[eo].append(memo)
         return mapping
 
+    def _build_eo_index(self, eo_numbers: set) -> Tuple[Set[str], Dict[str, re.Pattern]]:
+        """
+        Splits EO numbers into a token set and a few fallback patterns.
+
+        For an EO number made only of word characters, ``\\b{eo}\\b`` matches exactly
+        when some maximal ``\\w+`` run of the text equals it, so a set lookup per
+        token replaces a regex per EO. Anything else keeps its own compiled pattern.
+        """
+        token_index = set()
+        fallback_patterns = {}
+        for eo in eo_numbers:
+            if self.WORD_TOKEN.fullmatch(eo):
+                token_index.add(eo)
+            else:
+                fallback_patterns[eo] = re.compile(rf"\b{re.escape(eo)}\b")
+        return token_index, fallback_patterns
+
+    def _find_eo_numbers(
+        self,
+        doc_number: str,
+        title: str,
+        token_index: Set[str],
+        fallback_patterns: Dict[str, re.Pattern],
+    ) -> Set[str]:
+        found = set()
+        for text in (doc_number, title):
+            found.update(token for token in self.WORD_TOKEN.findall(text) if token in token_index)
+        for eo, pattern in fallback_patterns.items():
+            if pattern.search(doc_number) or pattern.search(title):
+                found.add(eo)
+        return found
+
     def _merge_references(
         self,
-        eo_list: List[Dict],
-        opm_map: Dict[str, List[Dict]],
-        da_map: Dict[str, List[Dict]],
-        dod_map: Dict[str, List[Dict]],
+        eo_list: List[ExecutiveOrder],
+        opm_map: Dict[str, List[Memo]],
+        da_map: Dict[str, List[Memo]],
+        dod_map: Dict[str, List[PresidentialDocument]],
     ) -> None:
         for eo in eo_list:
-            number = eo["eo_number"]
-            eo["opm_docs"] = opm_map.get(number, [])
-            eo["da_docs"] = da_map.get(number, [])
-            eo["dod_docs"] = dod_map.get(number, [])
+            number = eo.eo_number
+            eo.opm_docs = opm_map.get(number, [])
+            eo.da_docs = da_map.get(number, [])
+            eo.dod_docs = dod_map.get(number, [])
@@ -0,0 +1,31 @@
+import importlib.util
+from typing import TYPE_CHECKING, List, Optional
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup, SoupStrainer
+
+DEFAULT_PARSER = "html.parser"
+
+# BeautifulSoup tree builders that honour ``parse_only``, fastest first, with the module they need.
+STRAINABLE_PARSERS = (("lxml", "lxml"), ("html.parser", None))
+
+
+def available_parsers() -> List[str]:
+    """Parser backends usable with ``parse_region`` in this environment, fastest first."""
+    return [name for name, module in STRAINABLE_PARSERS if module is None or importlib.util.find_spec(module)]
+
+
+def parse_region(
+    html: str, parse_only: Optional["SoupStrainer"] = None, parser: Optional[str] = None
+) -> "BeautifulSoup":
+    """
+    Parses ``html``, building tree nodes only for the regions matched by ``parse_only``.
+
+    The whole document is still tokenized, but everything outside the matched
+    elements is dropped as it is read instead of being turned into a tree.
+    ``parser`` selects the BeautifulSoup backend, e.g. "lxml" when it is installed.
+    """
+    # Imported here so the CLI can list parsers without loading BeautifulSoup.
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(html, parser or DEFAULT_PARSER, parse_only=parse_only)
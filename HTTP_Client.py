@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from Host_Scheduler import HostScheduler
+from Pipeline_Metrics import PipelineMetrics
+
+
+class HTTPClient:
+    """
+    Shared fetch layer for the scrapers and the PDF analyzer.
+
+    A single ``requests.Session`` keeps connections alive and pools them per host.
+    Successful responses that carry an ``ETag`` or ``Last-Modified`` header are
+    stored on disk, and later requests for the same URL are sent as conditional
+    GETs so an unchanged page or PDF costs a 304 instead of a full download.
+
+    Every request goes through a ``HostScheduler``, which keeps an adaptive
+    concurrency limit per host and retries 429/503 responses after the host's
+    back-off (``Retry-After`` when given). Thread pools above the client only
+    bound the total; each host runs at the rate it sustains.
+
+    When ``metrics`` is given, every request is recorded with its URL, duration,
+    body size and whether it was served from the cache.
+    """
+
+    DEFAULT_CACHE_DIR = Path("./.cache/http")
+    CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+    MAX_ATTEMPTS = 3
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        pool_maxsize: int = 16,
+        metrics: Optional[PipelineMetrics] = None,
+        scheduler: Optional[HostScheduler] = None,
+    ):
+        self.cache_dir = Path(cache_dir or self.DEFAULT_CACHE_DIR)
+        self.use_cache = use_cache
+        self.metrics = metrics
+        self.scheduler = scheduler or HostScheduler(max_limit=pool_maxsize, metrics=metrics)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 10) -> requests.Response:
+        """
+        Fetches ``url`` and returns a ``requests.Response``. Responses served from
+        the cache after a 304 have ``from_cache`` set to True and status 200.
+        """
+        start = time.perf_counter()
+        request_headers, entry = self._conditional_headers(url, headers)
+        response = self._fetch(url, request_headers, timeout)
+
+        if response.status_code == 304 and entry:
+            cached = self._cached_response(url, entry)
+            if cached is not None:
+                self._record(url, start, len(cached.content), cached)
+                return cached
+            # The body went missing; fetch it again without validators.
+            response = self._fetch(url, headers, timeout)
+
+        response.from_cache = False
+        if self.use_cache and response.status_code == 200:
+            self._store_entry(url, response)
+        self._record(url, start, len(response.content), response)
+        return response
+
+    def download(
+        self,
+        url: str,
+        sink: BinaryIO,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 10,
+        chunk_size: int = 64 * 1024,
+    ) -> requests.Response:
+        """
+        Streams the body of ``url`` into ``sink`` chunk by chunk instead of holding
+        it in memory. The body is only written for a 200 (or a cached 304); the
+        returned response carries the status for ``raise_for_status``.
+        """
+        start = time.perf_counter()
+        request_headers, entry = self._conditional_headers(url, headers)
+        # The host slot is held until the body has been streamed.
+        with self._send(url, request_headers, timeout, stream=True) as response:
+            if response.status_code != 304:
+                return self._stream_body(url, response, sink, chunk_size, start)
+
+            response.close()
+            _, body_path = self._entry_paths(url)
+            if entry and body_path.exists():
+                with open(body_path, "rb") as body:
+                    shutil.copyfileobj(body, sink, chunk_size)
+                response.status_code = 200
+                response.from_cache = True
+                self._record(url, start, body_path.stat().st_size, response)
+                return response
+
+        # The body went missing; fetch it again without validators.
+        with self._send(url, headers, timeout, stream=True) as response:
+            return self._stream_body(url, response, sink, chunk_size, start)
+
+    def _fetch(self, url: str, headers: Optional[Dict[str, str]], timeout: float) -> requests.Response:
+        with self._send(url, headers, timeout) as response:
+            return response
+
+    @contextmanager
+    def _send(
+        self, url: str, headers: Optional[Dict[str, str]], timeout: float, stream: bool = False
+    ) -> Iterator[requests.Response]:
+        """
+        Sends a GET inside one of the host's concurrency slots and keeps the slot
+        until the block exits. Throttled responses are retried once the host's
+        back-off has passed; the last one is returned as is.
+        """
+        for attempt in range(1, self.MAX_ATTEMPTS + 1):
+            host = self.scheduler.acquire(url)
+            try:
+                try:
+                    response = self.session.get(url, headers=headers, timeout=timeout, stream=stream)
+                except requests.RequestException:
+                    self.scheduler.observe(host, None)
+                    raise
+                if self.scheduler.observe(host, response) and attempt < self.MAX_ATTEMPTS:
+                    response.close()
+                    continue
+                yield response
+                return
+            finally:
+                host.release()
+
+    def _stream_body(
+        self, url: str, response: requests.Response, sink: BinaryIO, chunk_size: int, start: float
+    ) -> requests.Response:
+        with response:
+            response.from_cache = False
+            if response.status_code != 200:
+                self._record(url, start, 0, response)
+                return response
+
+            cache_file = self._open_cache_body(url, response) if self.use_cache else None
+            size = 0
+            try:
+                for chunk in response.iter_content(chunk_size):
+                    sink.write(chunk)
+                    size += len(chunk)
+                    if cache_file:
+                        cache_file.write(chunk)
+            except BaseException:
+                if cache_file:
+                    cache_file.close()
+                    os.remove(cache_file.name)
+                raise
+
+            if cache_file:
+                cache_file.close()
+                self._commit_cache_body(url, response, cache_file.name)
+            self._record(url, start, size, response)
+            return response
+
+    def _record(self, url: str, start: float, size: int, response: requests.Response) -> None:
+        if self.metrics:
+            self.metrics.record_request(
+                url, time.perf_counter() - start, size, response.status_code, response.from_cache
+            )
+
+    def _conditional_headers(self, url: str, headers: Optional[Dict[str, str]]):
+        request_headers = dict(headers or {})
+        entry = self._load_entry(url) if self.use_cache else None
+        if entry:
+            if entry.get("ETag"):
+                request_headers["If-None-Match"] = entry["ETag"]
+            if entry.get("Last-Modified"):
+                request_headers["If-Modified-Since"] = entry["Last-Modified"]
+        return request_headers, entry
+
+    def _cache_key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _entry_paths(self, url: str):
+        key = self._cache_key(url)
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load_entry(self, url: str) -> Optional[Dict]:
+        meta_path, _ = self._entry_paths(url)
+        try:
+            return json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _store_entry(self, url: str, response: requests.Response) -> None:
+        validators = self._validators(response)
+        if not validators:
+            return
+
+        meta_path, body_path = self._entry_paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._atomic_write(body_path, response.content)
+        self._atomic_write(meta_path, json.dumps({"url": url, **validators}).encode("utf-8"))
+
+    def _open_cache_body(self, url: str, response: requests.Response) -> Optional[BinaryIO]:
+        """Opens a temporary body file for a streamed response that can be revalidated later."""
+        if not self._validators(response):
+            return None
+        _, body_path = self._entry_paths(url)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        return open(self._tmp_path(body_path), "wb")
+
+    def _commit_cache_body(self, url: str, response: requests.Response, tmp_name: str) -> None:
+        meta_path, body_path = self._entry_paths(url)
+        os.replace(tmp_name, body_path)
+        self._atomic_write(meta_path, json.dumps({"url": url, **self._validators(response)}).encode("utf-8"))
+
+    def _validators(self, response: requests.Response) -> Optional[Dict[str, Optional[str]]]:
+        validators = {name: response.headers.get(name) for name in self.CACHED_HEADERS}
+        if not (validators["ETag"] or validators["Last-Modified"]):
+            return None
+        return validators
+
+    def _cached_response(self, url: str, entry: Dict) -> Optional[requests.Response]:
+        _, body_path = self._entry_paths(url)
+        try:
+            body = body_path.read_bytes()
+        except OSError:
+            return None
+
+        response = requests.Response()
+        response._content = body
+        response.status_code = 200
+        response.url = url
+        response.headers = CaseInsensitiveDict({k: v for k, v in entry.items() if k in self.CACHED_HEADERS and v})
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+    @classmethod
+    def _atomic_write(cls, path: Path, data: bytes) -> None:
+        tmp_path = cls._tmp_path(path)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _tmp_path(path: Path) -> Path:
+        return path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+_default_client: Optional[HTTPClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> HTTPClient:
+    """Returns the process-wide client shared by every scraper and analyzer."""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient()
+        return _default_client
@@ -0,0 +1,162 @@
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+
+class HostLimit:
+    """
+    AIMD concurrency limit for one host.
+
+    Every healthy response grows the limit by ``1 / limit`` (about one slot per
+    round of requests). A 429/503, a connection error, or header latency rising
+    past ``LATENCY_TOLERANCE`` times the best latency seen (and by more than
+    ``LATENCY_SLACK`` seconds, so jitter on fast hosts is ignored) halves it, at
+    most once per cooldown. ``Retry-After`` pauses the host until it expires.
+    """
+
+    LATENCY_TOLERANCE = 2.0
+    LATENCY_SLACK = 0.05
+    LATENCY_SMOOTHING = 0.2
+    DECREASE_FACTOR = 0.5
+
+    def __init__(self, host: str, initial: float, minimum: float, maximum: float):
+        self.host = host
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.latency: Optional[float] = None
+        self.baseline: Optional[float] = None
+        self._cooldown_until = 0.0
+        self._condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._condition:
+            while True:
+                wait = self.paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self) -> None:
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_response(self, latency: float) -> None:
+        """Feeds a healthy response's time-to-headers into the limit."""
+        with self._condition:
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency += self.LATENCY_SMOOTHING * (latency - self.latency)
+            self.baseline = self.latency if self.baseline is None else min(self.baseline, self.latency)
+
+            if self._latency_rising():
+                if self._decrease():
+                    # Latency that has settled at a higher level becomes the new reference.
+                    self.baseline = self.latency
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self._condition.notify_all()
+
+    def on_throttle(self, retry_after: Optional[float]) -> None:
+        """Backs off after a 429/503 or a failed request and pauses for ``retry_after`` seconds."""
+        with self._condition:
+            self._decrease()
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+    def _latency_rising(self) -> bool:
+        return (
+            self.latency > self.baseline * self.LATENCY_TOLERANCE
+            and self.latency - self.baseline > self.LATENCY_SLACK
+        )
+
+    def _decrease(self) -> bool:
+        now = time.monotonic()
+        if now < self._cooldown_until:
+            return False
+        self.limit = max(self.minimum, self.limit * self.DECREASE_FACTOR)
+        # Let requests sent at the old limit drain before judging the new one.
+        self._cooldown_until = now + max(1.0, self.latency or 0.0)
+        return True
+
+
+class HostScheduler:
+    """
+    Per-host concurrency control shared by every fetch in a run.
+
+    Each host gets its own ``HostLimit``, so a slow or throttling host backs
+    off on its own while the others keep their throughput. Callers wrap each
+    request in ``acquire``/``release`` and report its outcome with ``observe``.
+    """
+
+    THROTTLE_STATUSES = (429, 503)
+    DEFAULT_BACKOFF = 1.0
+    MAX_RETRY_AFTER = 120.0
+
+    def __init__(self, initial_limit: float = 4, min_limit: float = 1, max_limit: float = 16, metrics=None):
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.metrics = metrics
+        self._hosts: Dict[str, HostLimit] = {}
+        self._lock = threading.Lock()
+
+    def host_limit(self, url: str) -> HostLimit:
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = HostLimit(host, self.initial_limit, self.min_limit, self.max_limit)
+            return self._hosts[host]
+
+    def acquire(self, url: str) -> HostLimit:
+        limit = self.host_limit(url)
+        limit.acquire()
+        return limit
+
+    def observe(self, limit: HostLimit, response: Optional[requests.Response]) -> bool:
+        """
+        Adjusts the host's limit from a response (None for a failed request).
+        Returns True if the response was a throttle and the request may be retried.
+        """
+        if response is None:
+            limit.on_throttle(None)
+            throttled = False
+        elif response.status_code in self.THROTTLE_STATUSES:
+            limit.on_throttle(self._retry_after(response))
+            throttled = True
+            if self.metrics:
+                self.metrics.increment("http_throttled_total", host=limit.host)
+        else:
+            limit.on_response(response.elapsed.total_seconds())
+            throttled = False
+
+        if self.metrics:
+            self.metrics.gauge("host_concurrency_limit", round(limit.limit, 2), host=limit.host)
+        return throttled
+
+    def limits(self) -> Dict[str, float]:
+        with self._lock:
+            return {host: limit.limit for host, limit in self._hosts.items()}
+
+    def _retry_after(self, response: requests.Response) -> float:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return self.DEFAULT_BACKOFF
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                delay = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                delay = self.DEFAULT_BACKOFF
+        return min(self.MAX_RETRY_AFTER, max(0.0, delay))
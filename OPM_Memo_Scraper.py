@@ -1,8 +1,12 @@
 import json
-import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
-from typing import List, Dict, Optional
+from typing import List, Tuple
+
+from Artifact_IO import artifact_path, write_records
+from HTML_Parsing import parse_region
+from HTTP_Client import HTTPClient, get_default_client
+from Pipeline_Records import Memo
 
 
 class OPMMemoScraper:
@@ -14,34 +18,59 @@ class OPMMemoScraper:
     DEFAULT_URL = "https://www.opm.gov/policy-data-oversight/latest-and-other-highlighted-memos/"
     BASE_URL = "https://www.opm.gov"
     OUTPUT_PATH = "./docs/OPM_Memos.json"
+    # Memo entries, plus the pager links a backfill crawl follows.
+    PARSE_ONLY = SoupStrainer(["li", "nav"], class_=["usa-collection__item", "usa-pagination", "pager__item"])
+    PAGE_LINK_SELECTOR = "nav.usa-pagination a[href], li.pager__item a[href]"
 
-    def __init__(self, url: str = None):
+    def __init__(
+        self,
+        url: str = None,
+        client: HTTPClient = None,
+        base_url: str = None,
+        parser: str = None,
+        output_format: str = None,
+    ):
         self.url = url or self.DEFAULT_URL
+        self.base_url = base_url or self.BASE_URL
+        self.client = client or get_default_client()
+        self.parser = parser
+        self.output_path = artifact_path(self.OUTPUT_PATH, output_format)
 
     def scrape(self) -> str:
-        response = requests.get(self.url, timeout=10)
+        return json.dumps([memo.to_dict() for memo in self.scrape_records()], indent=2, ensure_ascii=False)
+
+    def scrape_records(self) -> List[Memo]:
+        response = self.client.get(self.url, timeout=10)
         response.raise_for_status()
 
         memos = self._parse_html(response.text)
         self._write_to_file(memos)
-        return json.dumps(memos, indent=2, ensure_ascii=False)
+        return memos
+
+    def parse_listing(self, html: str, page_url: str) -> Tuple[List[Memo], List[str]]:
+        """Returns the memos on one listing page and the absolute URLs of its pager links."""
+        soup = parse_region(html, self.PARSE_ONLY, self.parser)
+        page_links = [urljoin(page_url, a["href"]) for a in soup.select(self.PAGE_LINK_SELECTOR)]
+        return self._memos_from_soup(soup), page_links
+
+    def _parse_html(self, html: str) -> List[Memo]:
+        return self._memos_from_soup(parse_region(html, self.PARSE_ONLY, self.parser))
 
-    def _parse_html(self, html: str) -> List[Dict]:
-        soup = BeautifulSoup(html, "html.parser")
+    def _memos_from_soup(self, soup) -> List[Memo]:
         memo_items = soup.find_all("li", class_="usa-collection__item")
         return [self._parse_memo_item(item) for item in memo_items if self._has_link(item)]
 
     def _has_link(self, item) -> bool:
         return item.find("a", class_="usa-link") is not None
 
-    def _parse_memo_item(self, item) -> Dict:
+    def _parse_memo_item(self, item) -> Memo:
         link_tag = item.find("a", class_="usa-link")
-        pdf_link = urljoin(self.BASE_URL, link_tag.get("href", "").strip())
+        pdf_link = urljoin(self.base_url, link_tag.get("href", "").strip())
         title = link_tag.get_text(strip=True)
 
         description = item.find("div", class_="usa-collection__description")
         if not description:
-            return self._memo_dict(title, pdf_link)
+            return Memo(title=title, pdf_link=pdf_link)
 
         paragraphs = description.find_all("p")
         fields = {
@@ -62,26 +91,14 @@ class OPMMemoScraper:
             if label in fields:
                 if label == "from":
                     fields["from_"] = content
-        return self._memo_dict(title, pdf_link, from_=fields["from_"], date=fields["date"], stakeholders=fields["stakeholders"], combined_text=fields["combined_text"])
-
-    def _memo_dict(
-        self,
-        title: str,
-        pdf_link: str,
-        from_: Optional[str] = None,
-        date: Optional[str] = None,
-        stakeholders: Optional[str] = None,
-        combined_text: Optional[str] = None,
-    ) -> Dict:
-        return {
-            "title": title,
-            "pdf_link": pdf_link,
-            "from": from_,
-            "date": date,
-            "stakeholders": stakeholders,
-            "combined_text": combined_text,
-        }
-
-    def _write_to_file(self, data: List[Dict]) -> None:
-        with open(self.OUTPUT_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        return Memo(
+            title=title,
+            pdf_link=pdf_link,
+            from_=fields["from_"],
+            date=fields["date"],
+            stakeholders=fields["stakeholders"],
+            combined_text=fields["combined_text"],
+        )
+
+    def _write_to_file(self, data: List[Memo]) -> None:
+        write_records(self.output_path, (memo.to_dict() for memo in data))
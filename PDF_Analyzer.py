@@ -1,19 +1,30 @@
+import hashlib
 import json
 import re
-import requests
+import tempfile
+import threading
+import time
 from io import BytesIO
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 from urllib.parse import urljoin
-from typing import List, Dict, Set, Tuple
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
-try:
-    import PyPDF2
-except ImportError:
-    raise ImportError("Please install PyPDF2 using 'pip install PyPDF2'")
+from Analysis_Store import AnalysisStore, StoredAnalysis
+from Document_Registry import DocumentRegistry
+from EO_Matcher import EOMatch, EOMatcher, TitleShingleIndex
+from HTTP_Client import HTTPClient, get_default_client
+from PDF_Backends import DEFAULT_BACKEND, PDFDocument, get_backend
+from Pipeline_Metrics import PipelineMetrics
+from Pipeline_Records import AnalysisResult, Memo, PresidentialDocument
+from Remote_File import RemoteFile
+from Search_Index import SearchIndex
 
 
 class PDFAnalyzer:
     """Analyzes PDFs for Executive Order references using numeric and keyword-based matching."""
 
+    PREVIEW_LENGTH = 200
+
     EO_PATTERN = re.compile(
         r"(Executive Order(?:\s+No\.)?\s*(\d+)(?=\b|\s))|\bE\.O\.\s*(\d+)(?=\b|\s)",
         re.IGNORECASE,
@@ -44,60 +55,586 @@ class PDFAnalyzer:
         "14003": ["Executive Order 14003", "Revocation of Executive Order 14003"],
     }
 
-    def __init__(self, base_url: str = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        download_workers: int = 1,
+        parse_workers: int = 0,
+        client: HTTPClient = None,
+        store: AnalysisStore = None,
+        streaming: bool = False,
+        memory_limit: int = 8 * 1024 * 1024,
+        search_index: SearchIndex = None,
+        source: str = None,
+        metrics: PipelineMetrics = None,
+        registry: DocumentRegistry = None,
+        backend: str = DEFAULT_BACKEND,
+        fast_scan_pages: int = 0,
+        executive_orders: Union[List[PresidentialDocument], Future] = None,
+        lazy_fetch: bool = False,
+    ):
+        """
+        Args:
+            base_url: Base URL used to resolve relative PDF links.
+            download_workers: Number of concurrent PDF downloads. 1 downloads sequentially.
+            parse_workers: Number of processes used for PDF parsing and matching.
+                0 parses on the calling thread.
+            client: Shared HTTP client; defaults to the process-wide one.
+            store: Optional persistent analysis cache. Unchanged PDFs are not re-parsed,
+                and cached text is re-matched when the EO patterns change.
+            streaming: Spool each download to a temporary file and match it page by
+                page instead of loading the PDF and its full text into memory.
+                Only ``PREVIEW_LENGTH`` characters of text are kept per PDF, and
+                parsing happens on the download threads (``parse_workers`` is unused).
+            memory_limit: Bytes of a streamed download kept in RAM before the
+                spool rolls over to disk.
+            search_index: Optional full-text index that receives the text of every
+                page, linked to the PDF link, ``source`` and detected EO references.
+            source: Label recorded with indexed documents (e.g. "army", "opm").
+            metrics: Optional collector for pages parsed, parse and matcher time,
+                and analysis cache hits, labelled with ``source``.
+            registry: Run-wide registry shared with other analyzers so each unique
+                PDF (by normalized URL, then by content hash) is fetched and parsed
+                once. Defaults to one private to this analyzer.
+            backend: Text-extraction backend name from ``PDF_Backends.BACKENDS``.
+            fast_scan_pages: If set, extract only the first this-many pages plus the
+                last one, and the rest only when those contain no EO reference.
+                Skipped pages are kept as empty strings so page numbers still line up.
+                Streaming mode always extracts every page.
+            executive_orders: Scraped EO list (``PresidentialOrders.executive_orders``).
+                Their titles are matched approximately, in addition to the
+                hand-maintained ``EO_NAME_KEYWORDS``. May be a ``Future`` of the list,
+                so PDFs are fetched while the EO listing is still being scraped; the
+                analyzer waits for it when it first needs the matcher.
+            lazy_fetch: Read each PDF through HTTP range requests (``RemoteFile``) so
+                only the parts the backend touches are downloaded; pays off with
+                ``fast_scan_pages`` on large attachments. Servers without range
+                support send the whole file. Takes precedence over ``streaming``;
+                parsing happens on the download threads (``parse_workers`` is unused).
+        """
         self.base_url = base_url or "https://www.opm.gov"
+        self.download_workers = max(1, download_workers)
+        self.parse_workers = max(0, parse_workers)
+        self.client = client or get_default_client()
+        self.store = store
+        self.streaming = streaming
+        self.memory_limit = memory_limit
+        self.search_index = search_index
+        self.source = source
+        self.metrics = metrics
+        self.registry = registry or DocumentRegistry()
+        self.backend = get_backend(backend)
+        self.fast_scan_pages = max(0, fast_scan_pages)
+        self.lazy_fetch = lazy_fetch
+        self._executive_orders = executive_orders
+        self._matcher: Optional[EOMatcher] = None
+        self._matcher_lock = threading.Lock()
+        # PDFs of the last ``analyze_memos`` call that could not be fetched or parsed.
+        self.failed_urls: Set[str] = set()
         print(f"Initialized PDFAnalyzer with base_url: {self.base_url}")
 
+    def __getstate__(self) -> Dict:
+        # Parse workers only match text; network and storage handles stay in the parent.
+        self._build_matcher()
+        state = self.__dict__.copy()
+        state.pop("client", None)
+        state.pop("store", None)
+        state.pop("search_index", None)
+        state.pop("metrics", None)
+        state.pop("registry", None)
+        state.pop("_executive_orders", None)
+        state.pop("_matcher_lock", None)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._matcher_lock = threading.Lock()
+
+    @property
+    def matcher(self) -> EOMatcher:
+        if self._matcher is None:
+            self._build_matcher()
+        return self._matcher
+
+    @property
+    def matcher_version(self) -> str:
+        if self._matcher is None:
+            self._build_matcher()
+        return self._matcher_version
+
+    @property
+    def eo_titles(self) -> Dict[str, str]:
+        if self._matcher is None:
+            self._build_matcher()
+        return self._eo_titles
+
+    def _build_matcher(self) -> None:
+        """Builds the matcher once, waiting for ``executive_orders`` if it is still a ``Future``."""
+        with self._matcher_lock:
+            if self._matcher is not None:
+                return
+            executive_orders = self._executive_orders
+            if isinstance(executive_orders, Future):
+                executive_orders = executive_orders.result()
+            self._eo_titles = {
+                eo.eo_number: eo.title for eo in executive_orders or [] if eo.eo_number and eo.title
+            }
+            self._matcher_version = self._compute_matcher_version()
+            self._matcher = EOMatcher(self.EO_NAME_KEYWORDS, self.EO_PATTERN, self._eo_titles)
+
     def parse_pdfs_for_eo_references(self, json_output: str) -> List[Dict]:
-        """Parses memos and extracts EO references from their PDFs."""
-        memo_list = json.loads(json_output)
-        results = []
+        """Parses memos from a JSON string and extracts EO references from their PDFs."""
+        memos = [Memo.from_dict(memo) for memo in json.loads(json_output)]
+        return [result.to_dict() for result in self.analyze_memos(memos)]
+
+    def analyze_memos(self, memos: List[Memo]) -> List[AnalysisResult]:
+        """
+        Extracts EO references from the PDF of each memo, in memo order. PDFs that
+        fail get no references and are listed in ``failed_urls``.
+        """
+        self.failed_urls = set()
+        pdf_urls = []
 
-        for memo in memo_list:
-            pdf_url = urljoin(self.base_url, memo.get("pdf_link", ""))
+        for memo in memos:
+            pdf_url = self.resolve_link(memo.pdf_link)
             if not pdf_url:
                 continue
+            pdf_urls.append(pdf_url)
+
+        claims = {}
+        for pdf_url in pdf_urls:
+            if pdf_url not in claims:
+                claims[pdf_url] = self.registry.claim_url(pdf_url)
+        owned = [pdf_url for pdf_url, (_, owner) in claims.items() if owner]
+        self._count("documents_deduplicated_total", len(pdf_urls) - len(owned), kind="url")
+
+        if (self.streaming or self.lazy_fetch) and self.download_workers > 1:
+            with ThreadPoolExecutor(self.download_workers) as pool:
+                extracted = list(pool.map(self._extract_safely, owned))
+        elif self.download_workers > 1 or self.parse_workers > 0:
+            extracted = self._extract_parallel(owned)
+        else:
+            extracted = [self._extract_safely(pdf_url) for pdf_url in owned]
+
+        for pdf_url, result in zip(owned, extracted):
+            claims[pdf_url][0].set_result(result)
+        # Links claimed by another analyzer (or spelled differently here) share its result.
+        extracted = [self._shared_result(pdf_url, claims[pdf_url][0]) for pdf_url in pdf_urls]
+
+        return [
+            AnalysisResult(
+                pdf_link=pdf_url,
+                eo_references=list(eo_refs),
+                pdf_text_preview=self._preview(pages),
+            )
+            for pdf_url, (eo_refs, pages) in zip(pdf_urls, extracted)
+        ]
+
+    def resolve_link(self, pdf_link: str) -> str:
+        """Resolves a memo's (possibly relative) PDF link against ``base_url``."""
+        return urljoin(self.base_url, pdf_link or "")
+
+    def find_eo_matches(self, text: str) -> List[EOMatch]:
+        """Returns every numeric and keyword EO hit in ``text`` with its offsets."""
+        return self.matcher.find_matches(text)
+
+    def _extract_safely(self, pdf_url: str) -> Tuple[Set[str], List[str]]:
+        try:
+            return self._extract_eo_references_from_pdf(pdf_url)
+        except Exception as e:
+            return self._failed(pdf_url, e)
 
-            try:
-                eo_refs, pdf_text = self._extract_eo_references_from_pdf(pdf_url)
-            except Exception as e:
-                print(f"Failed to process {pdf_url}: {e}")
-                eo_refs, pdf_text = set(), ""
+    def _extract_parallel(self, pdf_urls: List[str]) -> List[Tuple[Set[str], List[str]]]:
+        """
+        Downloads PDFs on a bounded thread pool and hands each one to the parse pool
+        as soon as it arrives. Results are returned in the order of ``pdf_urls``.
+        """
+        parse_pool = None
+        try:
+            with ThreadPoolExecutor(self.download_workers) as download_pool:
+                downloads = [download_pool.submit(self._download_pdf, url) for url in pdf_urls]
+                pending = []
+                for pdf_url, download in zip(pdf_urls, downloads):
+                    shared = None
+                    try:
+                        content = download.result()
+                        content_hash = self._content_hash(content)
+                        shared, owner = self._claim_content(content_hash)
+                        if not owner:
+                            job = shared
+                        elif (cached := self._cached_analysis(pdf_url, content_hash)) is not None:
+                            job = cached
+                            shared.set_result(job)
+                        elif self.parse_workers:
+                            if parse_pool is None:
+                                # Workers receive the analyzer with its matcher, so they start once the EO
+                                # titles are in; downloads already submitted keep running meanwhile.
+                                self._build_matcher()
+                                parse_pool = ProcessPoolExecutor(
+                                    self.parse_workers, initializer=_init_parse_worker, initargs=(self,)
+                                )
+                            # Resolved as soon as the worker finishes, so other analyzers never wait on this loop.
+                            parse_job = parse_pool.submit(_analyze_in_worker, content)
+                            parse_job.add_done_callback(
+                                lambda done, pdf_url=pdf_url, content_hash=content_hash, shared=shared:
+                                self._resolve_parse_job(pdf_url, content_hash, shared, done)
+                            )
+                            job = shared
+                        else:
+                            job = self._analyze_content(pdf_url, content, content_hash)
+                            shared.set_result(job)
+                    except Exception as e:
+                        if shared is not None and not shared.done():
+                            shared.set_exception(e)
+                        job = self._failed(pdf_url, e)
+                    pending.append((pdf_url, job))
 
-            results.append({
-                "pdf_link": pdf_url,
-                "eo_references": list(eo_refs),
-                "pdf_text_preview": pdf_text[:200],
-            })
+            results = []
+            for pdf_url, job in pending:
+                if not isinstance(job, tuple):
+                    try:
+                        job = job.result()
+                    except Exception as e:
+                        job = self._failed(pdf_url, e)
+                results.append(job)
+            return results
+        finally:
+            if parse_pool:
+                parse_pool.shutdown()
 
-        return results
+    def _extract_eo_references_from_pdf(self, pdf_url: str) -> Tuple[Set[str], List[str]]:
+        """Downloads a PDF and returns EO references and the text of each page."""
+        if self.lazy_fetch:
+            return self._extract_lazy(pdf_url)
+        if self.streaming:
+            return self._extract_streaming(pdf_url)
+        return self._analyze_fetched(pdf_url, self._download_pdf(pdf_url))
 
-    def _extract_eo_references_from_pdf(self, pdf_url: str) -> Tuple[Set[str], str]:
-        """Downloads a PDF and returns EO references and full text."""
-        response = requests.get(pdf_url, timeout=30)
+    def _analyze_fetched(self, pdf_url: str, content: bytes) -> Tuple[Set[str], List[str]]:
+        content_hash = self._content_hash(content)
+        shared, owner = self._claim_content(content_hash)
+        if not owner:
+            return shared.result()
+        return self._resolve(shared, lambda: self._analyze_download(pdf_url, content, content_hash))
+
+    def _analyze_download(self, pdf_url: str, content: bytes, content_hash: str) -> Tuple[Set[str], List[str]]:
+        cached = self._cached_analysis(pdf_url, content_hash)
+        if cached is not None:
+            return cached
+        return self._analyze_content(pdf_url, content, content_hash)
+
+    def _download_pdf(self, pdf_url: str) -> bytes:
+        response = self.client.get(pdf_url, timeout=30)
         response.raise_for_status()
+        return response.content
+
+    def _analyze_content(self, pdf_url: str, content: bytes, content_hash: str) -> Tuple[Set[str], List[str]]:
+        """Extracts text from raw PDF bytes, stores the analysis and returns EO references and page texts."""
+        result, counts = self._analyze_content_timed(content)
+        self._record_counts(*counts)
+        self._remember(pdf_url, content_hash, result, text_complete=self._read_every_page(result, counts))
+        return result
+
+    def _analyze_content_timed(
+        self, content: bytes
+    ) -> Tuple[Tuple[Set[str], List[str]], Tuple[int, float, float]]:
+        """
+        ``_analyze_content`` plus its (pages parsed, parse seconds, match seconds),
+        for workers that cannot record metrics.
+        """
+        with BytesIO(content) as file:
+            return self._analyze_file_timed(file)
+
+    def _analyze_file_timed(
+        self, file: BinaryIO
+    ) -> Tuple[Tuple[Set[str], List[str]], Tuple[int, float, float]]:
+        start = time.perf_counter()
+        document = self.backend.open(file)
+        try:
+            pages = [""] * document.page_count
+            scanned = self._fast_scan_indexes(document.page_count)
+            for index in scanned:
+                pages[index] = document.page_text(index)
+            parsed = time.perf_counter()
+            eo_refs = self._match_text("\n".join(pages))
+            matched = time.perf_counter()
+            parse_seconds, match_seconds = parsed - start, matched - parsed
+            pages_parsed = len(scanned)
+
+            if not eo_refs and len(scanned) < len(pages):
+                # Nothing in the usual places; fall back to the whole document.
+                for index in range(self.fast_scan_pages, len(pages) - 1):
+                    pages[index] = document.page_text(index)
+                parsed = time.perf_counter()
+                eo_refs = self._match_text("\n".join(pages))
+                parse_seconds += parsed - matched
+                match_seconds += time.perf_counter() - parsed
+                pages_parsed = len(pages)
+        finally:
+            document.close()
+
+        return (eo_refs, pages), (pages_parsed, parse_seconds, match_seconds)
+
+    def _fast_scan_indexes(self, page_count: int) -> List[int]:
+        """Pages read before deciding whether the rest is needed: the first N and the last."""
+        if not self.fast_scan_pages or page_count <= self.fast_scan_pages + 1:
+            return list(range(page_count))
+        return list(range(self.fast_scan_pages)) + [page_count - 1]
+
+    def _extract_lazy(self, pdf_url: str) -> Tuple[Set[str], List[str]]:
+        """
+        Analyzes a PDF read through range requests, so unread pages and their images
+        are never downloaded. A server that sent the whole file gets the normal path.
+        """
+        with RemoteFile(self.client, pdf_url, timeout=30) as remote:
+            if not remote.ranged:
+                return self._analyze_fetched(pdf_url, remote.read())
+
+            # The whole content is never seen, so the server's validator identifies the version.
+            version = self._version_key(pdf_url, remote.validator) if remote.validator else None
+            cached = self._cached_analysis(pdf_url, version)
+            if cached is not None:
+                return cached
+
+            result, counts = self._analyze_file_timed(remote)
+            self._record_counts(*counts)
+            self._count("pdf_lazy_bytes_total", remote.size)
+            self._count("pdf_lazy_bytes_fetched_total", remote.bytes_fetched)
+            self._remember(pdf_url, version, result, text_complete=self._read_every_page(result, counts))
+            return result
+
+    def _extract_streaming(self, pdf_url: str) -> Tuple[Set[str], List[str]]:
+        """
+        Spools a PDF download and matches it page by page. Pages go straight to the
+        search index; only the first ``PREVIEW_LENGTH`` characters are returned.
+        """
+        with tempfile.SpooledTemporaryFile(max_size=self.memory_limit) as spool:
+            response = self.client.download(pdf_url, spool, timeout=30)
+            response.raise_for_status()
+
+            content_hash = self._file_hash(spool)
+            shared, owner = self._claim_content(content_hash)
+            if not owner:
+                return shared.result()
+            return self._resolve(shared, lambda: self._analyze_spool(pdf_url, spool, content_hash))
+
+    def _analyze_spool(self, pdf_url: str, spool: BinaryIO, content_hash: str) -> Tuple[Set[str], List[str]]:
+        cached = self._cached_analysis(pdf_url, content_hash)
+        if cached is not None:
+            return cached
+
+        spool.seek(0)
+        scanner = self.matcher.stream()
+        eo_refs, preview = set(), ""
+        page_count, parse_seconds, match_seconds = 0, 0.0, 0.0
+        if self.search_index:
+            self.search_index.clear_pages(pdf_url)
+        clock = time.perf_counter()
+        for index, page_text in enumerate(self._iter_page_texts(spool)):
+            parsed = time.perf_counter()
+            parse_seconds += parsed - clock
+            chunk = page_text if index == 0 else "\n" + page_text
+            eo_refs |= {match.eo_number for match in scanner.feed(chunk)}
+            match_seconds += time.perf_counter() - parsed
+            page_count += 1
+            if len(preview) < self.PREVIEW_LENGTH:
+                preview = (preview + chunk)[:self.PREVIEW_LENGTH]
+            if self.search_index:
+                self.search_index.add_page(pdf_url, index + 1, page_text)
+            clock = time.perf_counter()
+        eo_refs |= {match.eo_number for match in scanner.finish()}
+        self._record_counts(page_count, parse_seconds, match_seconds)
+
+        if self.search_index:
+            self.search_index.set_document(pdf_url, self.source, eo_refs, content_hash)
+        if self.store:
+            self.store.save(
+                StoredAnalysis(
+                    pdf_url, content_hash, self.matcher_version, list(eo_refs), [preview], text_complete=False
+                )
+            )
+        return eo_refs, [preview]
+
+    def _iter_page_texts(self, file: BinaryIO) -> Iterator[str]:
+        """Yields the text of each page without joining the document into one string."""
+        document: PDFDocument = self.backend.open(file)
+        try:
+            for index in range(document.page_count):
+                yield document.page_text(index)
+        finally:
+            document.close()
+
+    def _preview(self, pages: List[str]) -> str:
+        preview = ""
+        for index, page_text in enumerate(pages):
+            preview += page_text if index == 0 else "\n" + page_text
+            if len(preview) >= self.PREVIEW_LENGTH:
+                break
+        return preview[:self.PREVIEW_LENGTH]
+
+    def _file_hash(self, file: BinaryIO) -> str:
+        file.seek(0)
+        digest = hashlib.sha256()
+        for block in iter(lambda: file.read(64 * 1024), b""):
+            digest.update(block)
+        return digest.hexdigest()
+
+    def _match_text(self, text: str) -> Set[str]:
+        return self.matcher.find_eo_numbers(text)
+
+    def _content_hash(self, content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def _version_key(pdf_url: str, validator: str) -> str:
+        return "validator:" + hashlib.sha256(f"{pdf_url}\n{validator}".encode("utf-8")).hexdigest()
+
+    def _claim_content(self, content_hash: str) -> Tuple[Future, bool]:
+        shared, owner = self.registry.claim_content(content_hash)
+        if not owner:
+            self._count("documents_deduplicated_total", kind="content")
+        return shared, owner
+
+    @staticmethod
+    def _resolve(shared: Future, analyze: Callable[[], Tuple[Set[str], List[str]]]) -> Tuple[Set[str], List[str]]:
+        """Runs the analysis this analyzer owns and publishes its outcome to other claimants."""
+        try:
+            result = analyze()
+        except BaseException as e:
+            shared.set_exception(e)
+            raise
+        shared.set_result(result)
+        return result
+
+    def _resolve_parse_job(self, pdf_url: str, content_hash: str, shared: Future, parse_job: Future) -> None:
+        try:
+            result, counts = parse_job.result()
+            self._record_counts(*counts)
+            self._remember(pdf_url, content_hash, result, text_complete=self._read_every_page(result, counts))
+        except BaseException as e:
+            shared.set_exception(e)
+            return
+        shared.set_result(result)
+
+    def _shared_result(self, pdf_url: str, shared: Future) -> Tuple[Set[str], List[str]]:
+        try:
+            return shared.result()
+        except Exception as e:
+            return self._failed(pdf_url, e)
+
+    def _failed(self, pdf_url: str, error: Exception) -> Tuple[Set[str], List[str]]:
+        """Records a PDF that could not be analyzed and returns the empty result it gets."""
+        print(f"Failed to process {pdf_url}: {error}")
+        self.failed_urls.add(pdf_url)
+        return set(), []
+
+    def _cached_analysis(self, pdf_url: str, content_hash: Optional[str]) -> Optional[Tuple[Set[str], List[str]]]:
+        """Returns a stored result for unchanged content, re-matching it if the patterns changed."""
+        if not self.store or not content_hash:
+            return None
+
+        stored = self.store.lookup(pdf_url, content_hash)
+        if stored is None:
+            self._count("analysis_cache_total", result="miss")
+            return None
+
+        needs_indexing = self.search_index and not self.search_index.has_document(pdf_url, content_hash)
+        if not stored.text_complete and (needs_indexing or stored.matcher_version != self.matcher_version):
+            # Only a preview of a streamed PDF was kept, so it has to be parsed again.
+            self._count("analysis_cache_total", result="miss")
+            return None
+
+        if stored.matcher_version == self.matcher_version:
+            self._count("analysis_cache_total", result="hit")
+            result = set(stored.eo_references), stored.pages
+            if needs_indexing:
+                self._index(pdf_url, content_hash, result)
+            return result
+
+        self._count("analysis_cache_total", result="rematched")
+        start = time.perf_counter()
+        result = self._match_text(stored.text), stored.pages
+        self._count("matcher_seconds_total", time.perf_counter() - start)
+        self._remember(pdf_url, content_hash, result)
+        return result
+
+    def _record_counts(self, page_count: int, parse_seconds: float, match_seconds: float) -> None:
+        self._count("pdf_documents_total")
+        self._count("pdf_pages_parsed_total", page_count)
+        self._count("pdf_parse_seconds_total", parse_seconds)
+        self._count("matcher_seconds_total", match_seconds)
+
+    def _count(self, name: str, value: float = 1, **labels: str) -> None:
+        if self.metrics:
+            self.metrics.increment(name, value, source=self.source, **labels)
+
+    def _remember(
+        self,
+        pdf_url: str,
+        content_hash: Optional[str],
+        result: Tuple[Set[str], List[str]],
+        text_complete: bool = True,
+    ) -> None:
+        """
+        Stores and indexes an analysis. ``text_complete`` is False when a fast scan
+        left pages unread, so the stored text cannot be re-matched later.
+        """
+        eo_refs, pages = result
+        if self.store and content_hash:
+            self.store.save(
+                StoredAnalysis(
+                    pdf_url,
+                    content_hash,
+                    self.matcher_version,
+                    list(eo_refs),
+                    pages,
+                    text_complete=text_complete,
+                )
+            )
+        self._index(pdf_url, content_hash, result)
+
+    @staticmethod
+    def _read_every_page(result: Tuple[Set[str], List[str]], counts: Tuple[int, float, float]) -> bool:
+        # A fast scan that fell back to the whole document read every page after all.
+        return counts[0] == len(result[1])
+
+    def _index(self, pdf_url: str, content_hash: Optional[str], result: Tuple[Set[str], List[str]]) -> None:
+        if not self.search_index:
+            return
+        eo_refs, pages = result
+        self.search_index.index_document(pdf_url, self.source, eo_refs, pages, content_hash)
+
+    def _compute_matcher_version(self) -> str:
+        """Fingerprint of the patterns and keywords, used to invalidate stored matches."""
+        fingerprint = json.dumps(
+            [
+                self.EO_PATTERN.pattern,
+                self.EO_PATTERN.flags,
+                EOMatcher.NUMERIC_TRIGGERS,
+                self.EO_NAME_KEYWORDS,
+                self.fast_scan_pages,
+                self._eo_titles,
+                [
+                    TitleShingleIndex.SHINGLE_SIZE,
+                    TitleShingleIndex.MIN_COVERAGE,
+                    TitleShingleIndex.MIN_DISTINCTIVE_COVERAGE,
+                    TitleShingleIndex.MAX_TITLES_PER_SHINGLE,
+                    TitleShingleIndex.WINDOW_SLACK,
+                ],
+            ],
+            sort_keys=True,
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+_worker_analyzer: Optional[PDFAnalyzer] = None
+
+
+def _init_parse_worker(analyzer: PDFAnalyzer) -> None:
+    """Receives the analyzer once per worker process instead of once per task."""
+    global _worker_analyzer
+    _worker_analyzer = analyzer
+
 
-        with BytesIO(response.content) as file:
-            reader = PyPDF2.PdfReader(file)
-            text = "\n".join(page.extract_text() or "" for page in reader.pages)
-
-        eo_refs = self._match_eo_numeric(text)
-        eo_refs |= self._match_eo_keywords(text)
-
-        return eo_refs, text
-
-    def _match_eo_numeric(self, text: str) -> Set[str]:
-        """Finds EO numbers using numeric patterns."""
-        matches = self.EO_PATTERN.findall(text)
-        return {g2 or g3 for _, g2, g3 in matches if g2 or g3}
-
-    def _match_eo_keywords(self, text: str) -> Set[str]:
-        """Finds EO numbers using name/title-based matching."""
-        lower_text = text.lower()
-        found = set()
-        for eo_num, phrases in self.EO_NAME_KEYWORDS.items():
-            if any(phrase.lower() in lower_text for phrase in phrases):
-                print(f"[Keyword Match] Found EO {eo_num}")
-                found.add(eo_num)
-        return found
-    
\ No newline at end of file
+def _analyze_in_worker(content: bytes) -> Tuple[Tuple[Set[str], List[str]], Tuple[int, float, float]]:
+    return _worker_analyzer._analyze_content_timed(content)
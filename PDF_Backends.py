@@ -0,0 +1,139 @@
+import importlib.util
+from typing import BinaryIO, Dict, List, Type
+
+
+class PDFDocument:
+    """An open PDF whose pages can be extracted individually and in any order."""
+
+    # Backends disagree on line endings and on decoding quotes, which breaks keyword matches.
+    NORMALIZE = str.maketrans({"\u2018": "'", "\u2019": "'", "\u201c": '"', "\u201d": '"'})
+
+    page_count: int
+
+    def page_text(self, index: int) -> str:
+        """Text of page ``index`` with plain newlines and ASCII quotes."""
+        return self._extract(index).replace("\r\n", "\n").replace("\r", "\n").translate(self.NORMALIZE)
+
+    def _extract(self, index: int) -> str:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class PDFBackend:
+    """
+    Text-extraction backend. ``open`` takes a binary file positioned anywhere; backends
+    must not keep state between documents so analyzers stay picklable for worker processes.
+    Libraries are imported when a document is opened, so listing backends stays cheap.
+    """
+
+    name = ""
+    module = None
+
+    def open(self, file: BinaryIO) -> PDFDocument:
+        raise NotImplementedError
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return cls.module is None or importlib.util.find_spec(cls.module) is not None
+
+
+class _PyPDF2Document(PDFDocument):
+    def __init__(self, file: BinaryIO):
+        import PyPDF2
+
+        file.seek(0)
+        self._reader = PyPDF2.PdfReader(file)
+        self.page_count = len(self._reader.pages)
+
+    def _extract(self, index: int) -> str:
+        return self._reader.pages[index].extract_text() or ""
+
+
+class PyPDF2Backend(PDFBackend):
+    """Pure-Python and in requirements.txt; the reference for match recall."""
+
+    name = "pypdf2"
+    module = "PyPDF2"
+
+    def open(self, file: BinaryIO) -> PDFDocument:
+        return _PyPDF2Document(file)
+
+
+class _PdfiumDocument(PDFDocument):
+    def __init__(self, file: BinaryIO):
+        import pypdfium2
+
+        file.seek(0)
+        self._document = pypdfium2.PdfDocument(file)
+        self.page_count = len(self._document)
+
+    def _extract(self, index: int) -> str:
+        page = self._document[index]
+        try:
+            text_page = page.get_textpage()
+            try:
+                return text_page.get_text_range() or ""
+            finally:
+                text_page.close()
+        finally:
+            page.close()
+
+    def close(self) -> None:
+        self._document.close()
+
+
+class PdfiumBackend(PDFBackend):
+    """PDFium through ``pypdfium2``; reads the file lazily, so spooled downloads stay on disk."""
+
+    name = "pdfium"
+    module = "pypdfium2"
+
+    def open(self, file: BinaryIO) -> PDFDocument:
+        return _PdfiumDocument(file)
+
+
+class _PyMuPDFDocument(PDFDocument):
+    def __init__(self, file: BinaryIO):
+        import pymupdf
+
+        file.seek(0)
+        self._document = pymupdf.open(stream=file.read(), filetype="pdf")
+        self.page_count = self._document.page_count
+
+    def _extract(self, index: int) -> str:
+        return self._document[index].get_text() or ""
+
+    def close(self) -> None:
+        self._document.close()
+
+
+class PyMuPDFBackend(PDFBackend):
+    """MuPDF through ``pymupdf``; needs the whole file in memory."""
+
+    name = "pymupdf"
+    module = "pymupdf"
+
+    def open(self, file: BinaryIO) -> PDFDocument:
+        return _PyMuPDFDocument(file)
+
+
+BACKENDS: Dict[str, Type[PDFBackend]] = {
+    backend.name: backend for backend in (PyPDF2Backend, PdfiumBackend, PyMuPDFBackend)
+}
+DEFAULT_BACKEND = PyPDF2Backend.name
+
+
+def available_backends() -> List[str]:
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> PDFBackend:
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown PDF backend '{name}'; choose from {', '.join(BACKENDS)}") from None
+    if not backend.is_available():
+        raise ImportError(f"The '{name}' PDF backend needs {backend.module}: pip install {backend.module}")
+    return backend()
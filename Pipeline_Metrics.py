@@ -0,0 +1,187 @@
+import cProfile
+import heapq
+import itertools
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class PipelineMetrics:
+    """
+    Thread-safe collector for per-stage timings and pipeline counters.
+
+    Stages are timed with ``stage()``; everything else (bytes transferred, pages
+    parsed, cache hits, matcher time) is a labelled counter fed by ``increment()``.
+    Individual HTTP requests are kept as per-URL records for the JSON report only,
+    so the Prometheus file stays low-cardinality. Only the ``max_requests`` slowest
+    are kept, so a long-running watcher does not accumulate its whole history.
+
+    With ``profile_dir`` set, each top-level stage also runs under cProfile and its
+    stats are dumped to ``<profile_dir>/<stage>.pstats``.
+    """
+
+    DEFAULT_JSON_PATH = Path("./docs/pipeline_metrics.json")
+    DEFAULT_PROMETHEUS_PATH = Path("./docs/pipeline_metrics.prom")
+    PROMETHEUS_PREFIX = "eo_pipeline_"
+    DEFAULT_MAX_REQUESTS = 1000
+
+    METRICS = {
+        "stage_seconds": ("gauge", "Wall-clock seconds spent in each pipeline stage."),
+        "stage_success": ("gauge", "1 if the stage finished without raising, else 0."),
+        "http_requests_total": ("counter", "HTTP requests issued, by cache outcome."),
+        "http_bytes_total": ("counter", "Response body bytes delivered, by cache outcome."),
+        "http_request_seconds_total": ("counter", "Seconds spent waiting on HTTP requests."),
+        "http_throttled_total": ("counter", "429/503 responses, by host."),
+        "host_concurrency_limit": ("gauge", "Current adaptive concurrency limit, by host."),
+        "analysis_cache_total": ("counter", "Analysis store lookups, by result."),
+        "documents_deduplicated_total": ("counter", "PDF links that reused another link's analysis, by match kind."),
+        "pdf_documents_total": ("counter", "PDFs analyzed, by source."),
+        "pdf_pages_parsed_total": ("counter", "PDF pages whose text was extracted, by source."),
+        "pdf_parse_seconds_total": ("counter", "Seconds spent extracting PDF text, by source."),
+        "matcher_seconds_total": ("counter", "Seconds spent matching EO references, by source."),
+        "pdf_lazy_bytes_total": ("counter", "Size of PDFs read through range requests, by source."),
+        "pdf_lazy_bytes_fetched_total": ("counter", "Bytes of those PDFs actually downloaded, by source."),
+    }
+
+    def __init__(self, profile_dir: Optional[Path] = None, max_requests: int = DEFAULT_MAX_REQUESTS):
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.max_requests = max(0, max_requests)
+        self.started_at = datetime.now(timezone.utc)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        # Min-heap of (seconds, sequence, record), so the fastest kept request is dropped first.
+        self._requests: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._request_sequence = itertools.count()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Times the enclosed block as stage ``name``, profiling it if enabled."""
+        profiler = self._start_profiler(name)
+        start = time.perf_counter()
+        status = "failed"
+        try:
+            yield
+            status = "ok"
+        finally:
+            seconds = time.perf_counter() - start
+            if profiler:
+                self._stop_profiler(name, profiler)
+            with self._lock:
+                self._stages[name] = {"seconds": round(seconds, 6), "status": status}
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Returns ``func`` timed as stage ``name``, for use with ``StageScheduler.add``."""
+
+        def timed(**kwargs):
+            with self.stage(name):
+                return func(**kwargs)
+
+        return timed
+
+    def increment(self, name: str, value: float = 1, **labels: Optional[str]) -> None:
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None)))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def gauge(self, name: str, value: float, **labels: Optional[str]) -> None:
+        """Sets a labelled value; reported like a counter but overwritten instead of summed."""
+        key = (name, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None)))
+        with self._lock:
+            self._counters[key] = value
+
+    def record_request(self, url: str, seconds: float, size: int, status: int, from_cache: bool) -> None:
+        """Records one HTTP request and folds it into the HTTP counters; keeps it if among the slowest."""
+        cache = "hit" if from_cache else "miss"
+        self.increment("http_requests_total", cache=cache)
+        self.increment("http_bytes_total", size, cache=cache)
+        self.increment("http_request_seconds_total", seconds)
+        if not self.max_requests:
+            return
+        record = {"url": url, "seconds": round(seconds, 6), "bytes": size, "status": status, "from_cache": from_cache}
+        entry = (seconds, next(self._request_sequence), record)
+        with self._lock:
+            if len(self._requests) < self.max_requests:
+                heapq.heappush(self._requests, entry)
+            elif entry > self._requests[0]:
+                heapq.heapreplace(self._requests, entry)
+
+    @property
+    def empty(self) -> bool:
+        """True until a stage, counter or request has been recorded."""
+        with self._lock:
+            return not (self._stages or self._counters or self._requests)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            counters: Dict[str, Any] = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append({"labels": dict(labels), "value": round(value, 6)})
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "stages": dict(self._stages),
+                "counters": counters,
+                "requests": [record for _, _, record in sorted(self._requests, reverse=True)],
+            }
+
+    def to_prometheus(self) -> str:
+        """Renders stages and counters in the Prometheus text exposition format."""
+        with self._lock:
+            samples: Dict[str, List[Tuple[Dict[str, str], float]]] = {}
+            for name, stage in sorted(self._stages.items()):
+                samples.setdefault("stage_seconds", []).append(({"stage": name}, stage["seconds"]))
+                samples.setdefault("stage_success", []).append(({"stage": name}, float(stage["status"] == "ok")))
+            for (name, labels), value in sorted(self._counters.items()):
+                samples.setdefault(name, []).append((dict(labels), value))
+
+        lines = []
+        for name, series in samples.items():
+            kind, description = self.METRICS.get(name, ("untyped", name))
+            metric = self.PROMETHEUS_PREFIX + name
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for labels, value in series:
+                label_text = ",".join(f'{k}="{self._escape_label(v)}"' for k, v in labels.items())
+                lines.append(f"{metric}{{{label_text}}} {value:g}" if label_text else f"{metric} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path: Optional[Path] = None, prometheus_path: Optional[Path] = None) -> None:
+        json_path = Path(json_path or self.DEFAULT_JSON_PATH)
+        prometheus_path = Path(prometheus_path or self.DEFAULT_PROMETHEUS_PATH)
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        prometheus_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        prometheus_path.write_text(self.to_prometheus(), encoding="utf-8")
+        logging.info(f"📊 Metrics written to {json_path} and {prometheus_path}")
+
+    def _start_profiler(self, name: str) -> Optional[cProfile.Profile]:
+        # Only the outermost stage on a thread is profiled; nested stages are covered by it.
+        if not self.profile_dir or getattr(self._local, "profiling", False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Python 3.12+ allows a single active profiler per process.
+            logging.warning(f"⚠️ Not profiling stage {name}: {e}")
+            return None
+        self._local.profiling = True
+        return profiler
+
+    def _stop_profiler(self, name: str, profiler: cProfile.Profile) -> None:
+        profiler.disable()
+        self._local.profiling = False
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        path = self.profile_dir / f"{name}.pstats"
+        profiler.dump_stats(str(path))
+        logging.info(f"🔬 Profile for stage {name} written to {path}")
+
+    @staticmethod
+    def _escape_label(value: str) -> str:
+        return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
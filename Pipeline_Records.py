@@ -0,0 +1,150 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+@dataclass(slots=True)
+class Memo:
+    """An OPM or Army memo, optionally enriched with the EO numbers found in its PDF."""
+
+    title: str
+    pdf_link: str
+    from_: Optional[str] = None
+    date: Optional[str] = None
+    stakeholders: Optional[str] = None
+    combined_text: Optional[str] = None
+    eo_references: Optional[List[str]] = None
+
+    def to_dict(self, include_references: bool = True) -> Dict:
+        data = {
+            "title": self.title,
+            "pdf_link": self.pdf_link,
+            "from": self.from_,
+            "date": self.date,
+            "stakeholders": self.stakeholders,
+            "combined_text": self.combined_text,
+        }
+        if include_references and self.eo_references is not None:
+            data["eo_references"] = self.eo_references
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Memo":
+        return cls(
+            title=data.get("title", ""),
+            pdf_link=data.get("pdf_link", ""),
+            from_=data.get("from"),
+            date=data.get("date"),
+            stakeholders=data.get("stakeholders"),
+            combined_text=data.get("combined_text"),
+            eo_references=data.get("eo_references"),
+        )
+
+
+@dataclass(slots=True)
+class PresidentialDocument:
+    """An entry from the DoD guidance page: an EO, a memo or a proclamation."""
+
+    doc_number: str
+    pdf_link: str
+    date: str
+    title: str
+
+    @property
+    def eo_number(self) -> Optional[str]:
+        """The EO number for an "EO 14222" entry, None for memos and proclamations."""
+        doc_number = self.doc_number.strip()
+        if doc_number.upper().startswith("EO "):
+            return doc_number[3:].strip()
+        return None
+
+    def to_dict(self, include_references: bool = True) -> Dict:
+        return {
+            "doc_number": self.doc_number,
+            "pdf_link": self.pdf_link,
+            "date": self.date,
+            "title": self.title,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PresidentialDocument":
+        return cls(
+            doc_number=data.get("doc_number", ""),
+            pdf_link=data.get("pdf_link", ""),
+            date=data.get("date", ""),
+            title=data.get("title", ""),
+        )
+
+
+@dataclass(slots=True)
+class PresidentialOrders:
+    CATEGORIES = ("executive_orders", "memos", "proclamations")
+
+    executive_orders: List[PresidentialDocument] = field(default_factory=list)
+    memos: List[PresidentialDocument] = field(default_factory=list)
+    proclamations: List[PresidentialDocument] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "executive_orders": [doc.to_dict() for doc in self.executive_orders],
+            "memos": [doc.to_dict() for doc in self.memos],
+            "proclamations": [doc.to_dict() for doc in self.proclamations],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PresidentialOrders":
+        return cls(
+            executive_orders=[PresidentialDocument.from_dict(d) for d in data.get("executive_orders", [])],
+            memos=[PresidentialDocument.from_dict(d) for d in data.get("memos", [])],
+            proclamations=[PresidentialDocument.from_dict(d) for d in data.get("proclamations", [])],
+        )
+
+    def to_records(self) -> Iterator[Dict]:
+        """One flat record per document, tagged with its ``category``, for NDJSON artifacts."""
+        for category in self.CATEGORIES:
+            for doc in getattr(self, category):
+                yield {"category": category, **doc.to_dict()}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> "PresidentialOrders":
+        orders = cls()
+        for record in records:
+            getattr(orders, record["category"]).append(PresidentialDocument.from_dict(record))
+        return orders
+
+
+@dataclass(slots=True)
+class AnalysisResult:
+    """EO references detected in a single PDF."""
+
+    pdf_link: str
+    eo_references: List[str]
+    pdf_text_preview: str
+
+    def to_dict(self) -> Dict:
+        return {
+            "pdf_link": self.pdf_link,
+            "eo_references": self.eo_references,
+            "pdf_text_preview": self.pdf_text_preview,
+        }
+
+
+@dataclass(slots=True)
+class ExecutiveOrder:
+    """An EO together with the OPM, DoD and Army documents that reference it."""
+
+    eo_number: str
+    eo_title: str
+    eo_link: str
+    opm_docs: List[Memo] = field(default_factory=list)
+    dod_docs: List[PresidentialDocument] = field(default_factory=list)
+    da_docs: List[Memo] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "eo_number": self.eo_number,
+            "eo_title": self.eo_title,
+            "eo_link": self.eo_link,
+            "opm_docs": [doc.to_dict(include_references=False) for doc in self.opm_docs],
+            "dod_docs": [doc.to_dict(include_references=False) for doc in self.dod_docs],
+            "da_docs": [doc.to_dict(include_references=False) for doc in self.da_docs],
+        }
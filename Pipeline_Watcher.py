@@ -0,0 +1,286 @@
+import json
+import logging
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from Analysis_Store import AnalysisStore
+from Artifact_IO import write_json, write_records
+from Document_Registry import DocumentRegistry
+from EO_Reference_Consolidator import EOReferenceConsolidator, iter_eo_links, load_consolidated
+from HTTP_Client import HTTPClient
+from PDF_Analyzer import PDFAnalyzer
+from PDF_Backends import DEFAULT_BACKEND
+from Pipeline_Metrics import PipelineMetrics
+from Pipeline_Records import Memo, PresidentialOrders
+from Search_Index import SearchIndex
+
+# (eo_number, source, doc_link) -> document title
+Links = Dict[Tuple[str, str, str], str]
+
+
+@dataclass
+class WatchedSource:
+    """A source polled every ``interval`` seconds. Memo sources set ``base_url`` for their PDF links."""
+
+    name: str
+    scraper: Any
+    interval: float
+    base_url: Optional[str] = None
+    next_poll: float = 0.0
+
+
+class PipelineWatcher:
+    """
+    Long-running alternative to a cron'd ``main.py``.
+
+    Keeps the last scrape of every source in memory and polls each on its own
+    interval. Only memos whose listing entry is new or changed are analyzed;
+    unchanged ones keep their EO references, except memos whose PDF failed, which
+    are retried on the next poll. When the EO listing changes what the analyzer
+    matches (new titles), every known memo is matched again, which the analysis
+    store serves from stored text. When a poll changes anything, the
+    consolidated file is rewritten (atomically) from the in-memory state and every
+    EO↔document link that appeared or disappeared is appended to an NDJSON change
+    feed. The links already in ``output_path`` at startup are the baseline, so a
+    restart does not re-announce everything. ``output_path`` may name any
+    ``Artifact_IO`` format; the normalized layout is JSON only.
+    """
+
+    def __init__(
+        self,
+        sources: List[WatchedSource],
+        output_path: Path,
+        feed_path: Path,
+        store: AnalysisStore = None,
+        search_index: SearchIndex = None,
+        client: HTTPClient = None,
+        metrics: PipelineMetrics = None,
+        download_workers: int = 1,
+        parse_workers: int = 0,
+        backend: str = DEFAULT_BACKEND,
+        fast_scan_pages: int = 0,
+        lazy_fetch: bool = False,
+        streaming: bool = False,
+        memory_limit: int = 8 * 1024 * 1024,
+        normalized: bool = False,
+    ):
+        self.sources = sources
+        self.output_path = Path(output_path)
+        self.feed_path = Path(feed_path)
+        self.store = store
+        self.search_index = search_index
+        self.client = client
+        self.metrics = metrics
+        self.download_workers = download_workers
+        self.parse_workers = parse_workers
+        self.backend = backend
+        self.fast_scan_pages = fast_scan_pages
+        self.lazy_fetch = lazy_fetch
+        self.streaming = streaming
+        self.memory_limit = memory_limit
+        self.normalized = normalized
+        self.presidential_orders: Optional[PresidentialOrders] = None
+        self.memos: Dict[str, List[Memo]] = {}
+        # Per memo source: the matcher version its memos were analyzed with, and the
+        # keys of memos whose PDF could not be analyzed.
+        self._matcher_versions: Dict[str, str] = {}
+        self._failed: Dict[str, Set[str]] = {}
+        self.links: Links = self._load_links(self.output_path)
+        self._stop = threading.Event()
+
+    def run(self, max_polls: Optional[int] = None) -> None:
+        """Polls sources as they fall due until ``stop()`` is called or ``max_polls`` polls ran."""
+        logging.info(f"👀 Watching {', '.join(source.name for source in self.sources)}")
+        polls = 0
+        while not self._stop.is_set() and (max_polls is None or polls < max_polls):
+            source = min(self.sources, key=lambda s: s.next_poll)
+            if self._stop.wait(max(0.0, source.next_poll - time.monotonic())):
+                break
+            self.poll(source)
+            source.next_poll = time.monotonic() + source.interval
+            polls += 1
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def poll(self, source: WatchedSource) -> bool:
+        """Refreshes one source and publishes the result if it changed. Returns True on change."""
+        try:
+            with self._timed(f"watch.{source.name}"):
+                if source.base_url is None:
+                    changed = self._poll_presidential_orders(source)
+                else:
+                    changed = self._poll_memos(source)
+        except Exception as e:
+            logging.error(f"❌ Polling {source.name} failed, keeping its previous state: {e}")
+            return False
+
+        if changed:
+            self._publish()
+        return changed
+
+    def _poll_presidential_orders(self, source: WatchedSource) -> bool:
+        orders = source.scraper.scrape_records()
+        if self.presidential_orders is not None and orders.to_dict() == self.presidential_orders.to_dict():
+            return False
+        self.presidential_orders = orders
+        for memo_source in self.sources:
+            if memo_source.base_url is not None and memo_source.name in self.memos:
+                analyzer = self._analyzer(memo_source)
+                if analyzer.matcher_version != self._matcher_versions.get(memo_source.name):
+                    logging.info(f"🔁 EO titles changed; matching {memo_source.name} memos again")
+                    self._analyze(memo_source, analyzer, self.memos[memo_source.name])
+        return True
+
+    def _poll_memos(self, source: WatchedSource) -> bool:
+        memos = source.scraper.scrape_records()
+        if not memos:
+            raise ValueError(f"{source.scraper.__class__.__name__} returned no data.")
+
+        previous = self.memos.get(source.name)
+        analyzer = self._analyzer(source)
+        if analyzer.matcher_version != self._matcher_versions.get(source.name):
+            known = {}
+        else:
+            failed = self._failed.get(source.name, set())
+            known = {
+                key: memo.eo_references
+                for memo in previous or []
+                if (key := self._memo_key(memo)) not in failed
+            }
+        fresh = []
+        for memo in memos:
+            key = self._memo_key(memo)
+            if key in known:
+                memo.eo_references = known[key]
+            else:
+                fresh.append(memo)
+
+        if fresh:
+            logging.info(f"🆕 {len(fresh)} new, changed or failed {source.name} memos")
+            self._analyze(source, analyzer, fresh)
+
+        self.memos[source.name] = memos
+        return previous is None or self._memo_state(memos) != self._memo_state(previous)
+
+    def _analyzer(self, source: WatchedSource) -> PDFAnalyzer:
+        # A fresh registry per poll, so a PDF that changed behind an edited memo is fetched again.
+        return PDFAnalyzer(
+            base_url=source.base_url,
+            download_workers=self.download_workers,
+            parse_workers=self.parse_workers,
+            client=self.client,
+            store=self.store,
+            search_index=self.search_index,
+            source=source.name,
+            metrics=self.metrics,
+            registry=DocumentRegistry(),
+            backend=self.backend,
+            fast_scan_pages=self.fast_scan_pages,
+            executive_orders=self.presidential_orders.executive_orders if self.presidential_orders else None,
+            lazy_fetch=self.lazy_fetch,
+            streaming=self.streaming,
+            memory_limit=self.memory_limit,
+        )
+
+    def _analyze(self, source: WatchedSource, analyzer: PDFAnalyzer, memos: List[Memo]) -> None:
+        """
+        Fills in ``memos``' EO references. Memos not passed in were analyzed without
+        failing, so the failures recorded here are all the source has.
+        """
+        reference_map = {result.pdf_link: result.eo_references for result in analyzer.analyze_memos(memos)}
+        failed = set()
+        for memo in memos:
+            absolute_link = analyzer.resolve_link(memo.pdf_link) if memo.pdf_link else ""
+            memo.eo_references = reference_map.get(absolute_link, [])
+            if absolute_link in analyzer.failed_urls:
+                failed.add(self._memo_key(memo))
+        if failed:
+            logging.warning(f"⚠️ {len(failed)} {source.name} memos failed; retrying them next poll")
+        self._failed[source.name] = failed
+        self._matcher_versions[source.name] = analyzer.matcher_version
+
+    def _publish(self) -> None:
+        """Re-consolidates once every source has been seen, then writes the file and the feed."""
+        if self.presidential_orders is None or any(
+            source.name not in self.memos for source in self.sources if source.base_url is not None
+        ):
+            return
+
+        consolidator = EOReferenceConsolidator()
+        with self._timed("watch.consolidate"):
+            executive_orders = consolidator.consolidate(
+                presidential_orders=self.presidential_orders,
+                army_memos=self.memos.get("army", []),
+                opm_memos=self.memos.get("opm", []),
+            )
+            if self.normalized:
+                output = consolidator.normalize(executive_orders)
+            else:
+                output = [eo.to_dict() for eo in executive_orders]
+        links = self._links_from_dicts(output)
+        added = sorted(links.keys() - self.links.keys())
+        removed = sorted(self.links.keys() - links.keys())
+
+        if self.normalized:
+            write_json(self.output_path, output)
+        else:
+            write_records(self.output_path, output)
+        logging.info(f"✅ Output written to {self.output_path}")
+        if added or removed:
+            self._append_feed(
+                [("added", link, links[link]) for link in added]
+                + [("removed", link, self.links[link]) for link in removed]
+            )
+            logging.info(f"🔔 {len(added)} EO links added, {len(removed)} removed")
+        self.links = links
+        if self.metrics:
+            self.metrics.write()
+
+    def _append_feed(self, changes: List[Tuple[str, Tuple[str, str, str], str]]) -> None:
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self.feed_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.feed_path.open("a", encoding="utf-8") as feed:
+            for change, (eo_number, source, doc_link), doc_title in changes:
+                record = {
+                    "time": timestamp,
+                    "change": change,
+                    "eo_number": eo_number,
+                    "source": source,
+                    "doc_link": doc_link,
+                    "doc_title": doc_title,
+                }
+                feed.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    @classmethod
+    def _load_links(cls, path: Path) -> Links:
+        try:
+            return cls._links_from_dicts(load_consolidated(path))
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _links_from_dicts(eo_data: Union[List[Dict], Dict]) -> Links:
+        links = {}
+        for eo, docs in iter_eo_links(eo_data):
+            for source, doc in docs:
+                links[(eo["eo_number"], source, doc.get("pdf_link") or "")] = (
+                    doc.get("title") or doc.get("doc_number") or ""
+                )
+        return links
+
+    @staticmethod
+    def _memo_key(memo: Memo) -> str:
+        return json.dumps(memo.to_dict(include_references=False), sort_keys=True)
+
+    @classmethod
+    def _memo_state(cls, memos: List[Memo]) -> List[Tuple[str, List[str]]]:
+        return [(cls._memo_key(memo), sorted(memo.eo_references)) for memo in memos]
+
+    def _timed(self, name: str):
+        return self.metrics.stage(name) if self.metrics else nullcontext()
@@ -1,10 +1,14 @@
 import json
-import requests
 from enum import Enum, auto
-from typing import List, Tuple, Dict
-from bs4 import BeautifulSoup
+from typing import List, Optional, Tuple
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
 
+from Artifact_IO import artifact_format, artifact_path, write_json, write_records
+from HTML_Parsing import parse_region
+from HTTP_Client import HTTPClient, get_default_client
+from Pipeline_Records import PresidentialDocument, PresidentialOrders
+
 
 class DocumentType(Enum):
     EXECUTIVE_ORDER = auto()
@@ -21,10 +25,21 @@ class PresidentialOrderScraper:
     DEFAULT_URL = "https://www.defense.gov/Spotlights/Guidance-for-Federal-Personnel-and-Readiness-Policies/"
     BASE_URL = "https://www.defense.gov"
     OUTPUT_PATH = "./docs/PO_Docs.json"
-
-    def __init__(self, url: str = None, base_url: str = None):
+    PARSE_ONLY = SoupStrainer("div", id="eo-links")
+
+    def __init__(
+        self,
+        url: str = None,
+        base_url: str = None,
+        client: HTTPClient = None,
+        parser: str = None,
+        output_format: str = None,
+    ):
         self.url = url or self.DEFAULT_URL
         self.base_url = base_url or self.BASE_URL
+        self.client = client or get_default_client()
+        self.parser = parser
+        self.output_path = artifact_path(self.OUTPUT_PATH, output_format)
         self.headers = {
             "User-Agent": (
                 "Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) "
@@ -34,25 +49,30 @@ class PresidentialOrderScraper:
         }
 
     def scrape(self) -> str:
+        return json.dumps(self.scrape_records().to_dict(), indent=2, ensure_ascii=False)
+
+    def scrape_records(self) -> PresidentialOrders:
         html = self._fetch_html()
         eo_items, memo_items, proc_items = self._parse_html(html)
 
-        result = {
-            "executive_orders": eo_items,
-            "memos": memo_items,
-            "proclamations": proc_items,
-        }
+        result = PresidentialOrders(
+            executive_orders=eo_items,
+            memos=memo_items,
+            proclamations=proc_items,
+        )
 
         self._save_json(result)
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return result
 
     def _fetch_html(self) -> str:
-        response = requests.get(self.url, headers=self.headers, timeout=10)
+        response = self.client.get(self.url, headers=self.headers, timeout=10)
         response.raise_for_status()
         return response.text
 
-    def _parse_html(self, html_content: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        soup = BeautifulSoup(html_content, "html.parser")
+    def _parse_html(
+        self, html_content: str
+    ) -> Tuple[List[PresidentialDocument], List[PresidentialDocument], List[PresidentialDocument]]:
+        soup = parse_region(html_content, self.PARSE_ONLY, self.parser)
         container = soup.find("div", id="eo-links")
         if not container:
             return [], [], []
@@ -68,7 +88,7 @@ class PresidentialOrderScraper:
             if not doc_data:
                 continue
 
-            doc_type = self._categorize(doc_data["doc_number"])
+            doc_type = self._categorize(doc_data.doc_number)
             items[doc_type].append(doc_data)
 
         return (
@@ -77,24 +97,19 @@ class PresidentialOrderScraper:
             items[DocumentType.PROCLAMATION],
         )
 
-    def _extract_document_data(self, anchor) -> Dict:
+    def _extract_document_data(self, anchor) -> Optional[PresidentialDocument]:
         href = anchor.get("href", "").strip()
         pdf_link = urljoin(self.base_url, href)
 
         item_div = anchor.find("div", class_=["item", "sub-item", "sub-item-first"])
         if not item_div:
-            return {}
+            return None
 
         doc_number = self._get_text(item_div.find("div", class_="eo"))
         date = self._get_text(item_div.find("div", class_="date"))
         title = self._get_text(item_div.find("div", class_="title"))
 
-        return {
-            "doc_number": doc_number,
-            "pdf_link": pdf_link,
-            "date": date,
-            "title": title,
-        }
+        return PresidentialDocument(doc_number=doc_number, pdf_link=pdf_link, date=date, title=title)
 
     def _categorize(self, doc_number: str) -> DocumentType:
         if not doc_number:
@@ -116,6 +131,9 @@ class PresidentialOrderScraper:
             return container.find("span").get_text(strip=True)
         return container.get_text(strip=True) if container else ""
 
-    def _save_json(self, data: Dict) -> None:
-        with open(self.OUTPUT_PATH, "w", encoding="utf-8") as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
+    def _save_json(self, data: PresidentialOrders) -> None:
+        # The JSON artifact keeps its category-keyed layout; NDJSON tags each record instead.
+        if artifact_format(self.output_path) == "json":
+            write_json(self.output_path, data.to_dict())
+        else:
+            write_records(self.output_path, data.to_records())
@@ -0,0 +1,145 @@
+import io
+import re
+from typing import Dict, Iterator, Optional, Tuple
+
+from HTTP_Client import HTTPClient
+
+
+class RemoteFile(io.RawIOBase):
+    """
+    Read-only, seekable file over a URL that fetches only the blocks that are read.
+
+    Opening sends one ``Range`` request for the first block, which also reports the
+    size. Later reads fetch the missing blocks they cover with ``Range`` requests
+    (adjacent missing blocks in one request) and keep them, so a PDF reader only
+    pulls the trailer, the xref and the objects of the pages it extracts.
+
+    A server that ignores ``Range`` answers the probe with the whole body (as does
+    the HTTP cache after a 304); the file then reads from that copy and ``ranged``
+    is False. Block requests carry ``If-Range``, so a file that changes while it is
+    being read raises ``OSError`` instead of mixing two versions.
+    """
+
+    DEFAULT_BLOCK_SIZE = 64 * 1024
+    CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+)")
+
+    def __init__(
+        self,
+        client: HTTPClient,
+        url: str,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        timeout: float = 30,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        super().__init__()
+        self.client = client
+        self.url = url
+        self.block_size = max(1, block_size)
+        self.timeout = timeout
+        self.headers = dict(headers or {})
+        self.bytes_fetched = 0
+        self.requests = 0
+        self._blocks: Dict[int, bytes] = {}
+        self._content: Optional[bytes] = None
+        self._position = 0
+
+        response = self._get(0, self.block_size - 1)
+        if response.status_code == 206:
+            start, _, self.size = self._content_range(response)
+            self._store(start, response.content)
+            self.ranged = True
+        else:
+            response.raise_for_status()
+            self._content = response.content
+            self.size = len(self._content)
+            self.ranged = False
+        # Identifies this version of the file; also sent as If-Range, which takes no weak ETags.
+        etag = response.headers.get("ETag")
+        self.validator = etag if etag and not etag.startswith("W/") else response.headers.get("Last-Modified")
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"invalid whence ({whence})")
+        if position < 0:
+            raise OSError(f"negative seek position {position}")
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        end = min(self._position + len(buffer), self.size)
+        if end <= self._position:
+            return 0
+        data = self._read(self._position, end)
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
+    def _read(self, start: int, end: int) -> bytes:
+        if not self.ranged:
+            return self._content[start:end]
+
+        first, last = start // self.block_size, (end - 1) // self.block_size
+        for run_start, run_end in self._missing_runs(first, last):
+            range_end = min((run_end + 1) * self.block_size, self.size) - 1
+            response = self._get(run_start * self.block_size, range_end, if_range=True)
+            if response.status_code != 206:
+                response.raise_for_status()
+                raise OSError(f"{self.url} changed while it was being read")
+            self._store(self._content_range(response)[0], response.content)
+
+        if any(index not in self._blocks for index in range(first, last + 1)):
+            raise OSError(f"{self.url} sent a shorter range than requested")
+        offset = first * self.block_size
+        if first == last:
+            # PDF readers mostly read a few bytes at a time; slicing the block avoids copying it.
+            return self._blocks[first][start - offset : end - offset]
+        data = b"".join(self._blocks[index] for index in range(first, last + 1))
+        return data[start - offset : end - offset]
+
+    def _missing_runs(self, first: int, last: int) -> Iterator[Tuple[int, int]]:
+        """Runs of adjacent blocks in ``first..last`` that have not been fetched yet."""
+        run_start = None
+        for index in range(first, last + 2):
+            missing = index <= last and index not in self._blocks
+            if missing and run_start is None:
+                run_start = index
+            elif not missing and run_start is not None:
+                yield run_start, index - 1
+                run_start = None
+
+    def _store(self, start: int, data: bytes) -> None:
+        if start % self.block_size:
+            raise OSError(f"{self.url} answered a range request at unaligned offset {start}")
+        for offset in range(0, len(data), self.block_size):
+            self._blocks[(start + offset) // self.block_size] = data[offset : offset + self.block_size]
+
+    def _get(self, start: int, end: int, if_range: bool = False):
+        headers = {**self.headers, "Range": f"bytes={start}-{end}"}
+        if if_range and self.validator:
+            headers["If-Range"] = self.validator
+        response = self.client.get(self.url, headers=headers, timeout=self.timeout)
+        self.requests += 1
+        if not getattr(response, "from_cache", False):
+            self.bytes_fetched += len(response.content)
+        return response
+
+    def _content_range(self, response) -> Tuple[int, int, int]:
+        match = self.CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+        if not match:
+            raise OSError(f"{self.url} sent a partial response without a usable Content-Range")
+        return int(match.group(1)), int(match.group(2)), int(match.group(3))
@@ -0,0 +1,225 @@
+import argparse
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+
+@dataclass
+class SearchHit:
+    pdf_link: str
+    source: Optional[str]
+    page: int
+    eo_references: List[str]
+    snippet: str
+
+
+class SearchIndex:
+    """
+    Local SQLite FTS5 index over the text extracted from every analyzed PDF.
+
+    Each page of each document is one FTS row linked to its ``pdf_link``. The
+    document's source and detected EO references live in side tables, so phrase
+    searches, EO lookups and both combined are answered without re-fetching PDFs.
+    """
+
+    DEFAULT_PATH = Path("./docs/memo_text_index.sqlite")
+    SNIPPET_TOKENS = 16
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or self.DEFAULT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS documents (
+                pdf_link TEXT PRIMARY KEY,
+                source TEXT,
+                content_hash TEXT,
+                eo_references TEXT NOT NULL DEFAULT '[]'
+            );
+            CREATE TABLE IF NOT EXISTS document_eos (
+                pdf_link TEXT NOT NULL,
+                eo_number TEXT NOT NULL,
+                PRIMARY KEY (eo_number, pdf_link)
+            );
+            CREATE INDEX IF NOT EXISTS documents_source ON documents (source);
+            CREATE TABLE IF NOT EXISTS page_text (
+                id INTEGER PRIMARY KEY,
+                pdf_link TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                text TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS page_text_link ON page_text (pdf_link, page);
+            CREATE VIRTUAL TABLE IF NOT EXISTS page_fts USING fts5(
+                text,
+                content = 'page_text',
+                content_rowid = 'id',
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+            CREATE TRIGGER IF NOT EXISTS page_text_insert AFTER INSERT ON page_text BEGIN
+                INSERT INTO page_fts (rowid, text) VALUES (new.id, new.text);
+            END;
+            CREATE TRIGGER IF NOT EXISTS page_text_delete AFTER DELETE ON page_text BEGIN
+                INSERT INTO page_fts (page_fts, rowid, text) VALUES ('delete', old.id, old.text);
+            END;
+            """
+        )
+        self._conn.commit()
+
+    def has_document(self, pdf_link: str, content_hash: Optional[str]) -> bool:
+        """True if ``pdf_link`` is indexed from the same content."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT content_hash FROM documents WHERE pdf_link = ?", (pdf_link,)
+            ).fetchone()
+        return bool(row) and content_hash is not None and row[0] == content_hash
+
+    def index_document(
+        self,
+        pdf_link: str,
+        source: Optional[str],
+        eo_references: Iterable[str],
+        pages: Iterable[str],
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """Replaces every indexed page of ``pdf_link`` and its metadata."""
+        with self._lock:
+            self.clear_pages(pdf_link)
+            for number, text in enumerate(pages, start=1):
+                self.add_page(pdf_link, number, text)
+            self.set_document(pdf_link, source, eo_references, content_hash)
+
+    def clear_pages(self, pdf_link: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM page_text WHERE pdf_link = ?", (pdf_link,))
+
+    def add_page(self, pdf_link: str, page: int, text: str) -> None:
+        """Adds one page; used directly when pages are streamed in one at a time."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO page_text (pdf_link, page, text) VALUES (?, ?, ?)", (pdf_link, page, text)
+            )
+
+    def set_document(
+        self,
+        pdf_link: str,
+        source: Optional[str],
+        eo_references: Iterable[str],
+        content_hash: Optional[str] = None,
+    ) -> None:
+        """Records the document's metadata and commits its pages."""
+        eo_references = sorted(set(eo_references))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO documents (pdf_link, source, content_hash, eo_references) "
+                "VALUES (?, ?, ?, ?)",
+                (pdf_link, source, content_hash, json.dumps(eo_references)),
+            )
+            self._conn.execute("DELETE FROM document_eos WHERE pdf_link = ?", (pdf_link,))
+            self._conn.executemany(
+                "INSERT INTO document_eos (pdf_link, eo_number) VALUES (?, ?)",
+                [(pdf_link, eo) for eo in eo_references],
+            )
+            self._conn.commit()
+
+    def search(
+        self,
+        phrase: Optional[str] = None,
+        eo_number: Optional[str] = None,
+        source: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[SearchHit]:
+        """
+        Finds pages containing ``phrase`` and/or documents referencing ``eo_number``.
+
+        ``phrase`` is matched as an exact FTS phrase. Without a phrase, one hit
+        per matching document is returned, previewing its first page.
+        """
+        if not phrase and not eo_number:
+            raise ValueError("Provide a phrase, an EO number, or both.")
+
+        filters, params = [], []
+        if eo_number:
+            filters.append("d.pdf_link IN (SELECT pdf_link FROM document_eos WHERE eo_number = ?)")
+            params.append(eo_number)
+        if source:
+            filters.append("d.source = ?")
+            params.append(source)
+
+        if phrase:
+            query = (
+                "SELECT d.pdf_link, d.source, t.page, d.eo_references, "
+                f"snippet(page_fts, 0, '[', ']', '…', {self.SNIPPET_TOKENS}) "
+                "FROM page_fts JOIN page_text t ON t.id = page_fts.rowid "
+                "JOIN documents d ON d.pdf_link = t.pdf_link "
+                "WHERE page_fts MATCH ?"
+            )
+            params.insert(0, self._quote_phrase(phrase))
+            order = " ORDER BY rank"
+        else:
+            query = (
+                "SELECT d.pdf_link, d.source, COALESCE(t.page, 1), d.eo_references, "
+                "COALESCE(substr(t.text, 1, 200), '') "
+                "FROM documents d LEFT JOIN page_text t ON t.pdf_link = d.pdf_link AND t.page = 1 "
+                "WHERE 1 = 1"
+            )
+            order = " ORDER BY d.pdf_link"
+
+        for condition in filters:
+            query += f" AND {condition}"
+        query += order + " LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [
+            SearchHit(pdf_link, source, int(page), json.loads(eo_refs), snippet)
+            for pdf_link, source, page, eo_refs, snippet in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _quote_phrase(phrase: str) -> str:
+        return '"' + phrase.replace('"', '""') + '"'
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Search the text extracted from analyzed memo PDFs.")
+    parser.add_argument("phrase", nargs="?", help="exact phrase to search for")
+    parser.add_argument("--eo", dest="eo_number", help="only documents referencing this EO number")
+    parser.add_argument("--source", help="only documents from this source (e.g. army, opm)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--index", type=Path, default=SearchIndex.DEFAULT_PATH, help="index file")
+    parser.add_argument("--json", action="store_true", help="print hits as JSON")
+    args = parser.parse_args(argv)
+
+    if not args.phrase and not args.eo_number:
+        parser.error("provide a phrase, --eo, or both")
+    if not args.index.exists():
+        parser.error(f"no index at {args.index}; run the pipeline first")
+
+    index = SearchIndex(args.index)
+    try:
+        hits = index.search(args.phrase, args.eo_number, args.source, args.limit)
+    finally:
+        index.close()
+
+    if args.json:
+        print(json.dumps([hit.__dict__ for hit in hits], indent=2, ensure_ascii=False))
+        return
+
+    for hit in hits:
+        refs = ", ".join(hit.eo_references) or "-"
+        print(f"{hit.pdf_link} (page {hit.page}, {hit.source or 'unknown'}, EOs: {refs})")
+        print(f"    {hit.snippet}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[..., Any]
+    depends_on: List[str] = field(default_factory=list)
+    after: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StageOutcome:
+    """Result of a single stage: ``status`` is "ok", "failed" or "skipped"."""
+
+    name: str
+    status: str
+    result: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+class StageScheduler:
+    """
+    Runs pipeline stages on a thread pool as soon as their dependencies finish.
+
+    Each stage function is called with the results of its dependencies as keyword
+    arguments named after those stages. A failing stage does not cancel unrelated
+    stages; only the stages that depend on it are skipped. Stages listed in
+    ``after`` are waited for but optional: their result is passed if they
+    succeeded and None otherwise.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._stages: Dict[str, Stage] = {}
+
+    def add(
+        self, name: str, func: Callable[..., Any], depends_on: Iterable[str] = (), after: Iterable[str] = ()
+    ) -> None:
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already registered.")
+        self._stages[name] = Stage(name, func, list(depends_on), list(after))
+
+    def run(self) -> Dict[str, StageOutcome]:
+        self._validate()
+        outcomes: Dict[str, StageOutcome] = {}
+        waiting = dict(self._stages)
+
+        with ThreadPoolExecutor(self.max_workers or len(self._stages) or 1) as pool:
+            running = {}
+            while waiting or running:
+                for stage in list(waiting.values()):
+                    failed_deps = [d for d in stage.depends_on if d in outcomes and not outcomes[d].ok]
+                    if failed_deps:
+                        logging.warning(f"⏭️ Skipping {stage.name}: {', '.join(failed_deps)} did not complete")
+                        outcomes[stage.name] = StageOutcome(stage.name, "skipped")
+                        del waiting[stage.name]
+                    elif all(d in outcomes for d in stage.depends_on + stage.after):
+                        kwargs = {d: outcomes[d].result for d in stage.depends_on + stage.after}
+                        running[pool.submit(stage.func, **kwargs)] = stage.name
+                        del waiting[stage.name]
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is None:
+                        outcomes[name] = StageOutcome(name, "ok", result=future.result())
+                    else:
+                        logging.error(f"❌ Stage {name} failed: {error}")
+                        outcomes[name] = StageOutcome(name, "failed", error=error)
+
+        return outcomes
+
+    def _validate(self) -> None:
+        for stage in self._stages.values():
+            unknown = [d for d in stage.depends_on + stage.after if d not in self._stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {', '.join(unknown)}")
+
+        visiting, visited = set(), set()
+
+        def visit(name: str) -> None:
+            if name in visited:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle detected at stage '{name}'.")
+            visiting.add(name)
+            for dep in self._stages[name].depends_on + self._stages[name].after:
+                visit(dep)
+            visiting.discard(name)
+            visited.add(name)
+
+        for name in self._stages:
+            visit(name)
@@ -0,0 +1,149 @@
+import hashlib
+import mimetypes
+import re
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+
+class FixtureServer:
+    """
+    Serves a fixture directory over HTTP on localhost, standing in for the
+    government sites. Responses carry ETag/Last-Modified and honour conditional
+    requests, so the HTTP cache behaves as it would against the real hosts.
+    Single-range ``Range``/``If-Range`` requests are answered with 206 unless
+    ``ranges`` is False, which stands in for a server that always sends the
+    whole body.
+    """
+
+    def __init__(self, root: Path, host: str = "127.0.0.1", port: int = 0, ranges: bool = True):
+        self.root = Path(root).resolve()
+        handler = type("FixtureHandler", (_FixtureHandler,), {"root": self.root, "ranges": ranges})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "FixtureServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    root: Path
+    ranges: bool
+    RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+    # Headers and body go out in separate writes; with Nagle on, every keep-alive
+    # request would wait out the client's delayed ACK (~40 ms).
+    disable_nagle_algorithm = True
+    # (path, mtime, size) -> ETag, so range requests do not re-hash the whole file.
+    _etags: dict = {}
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_HEAD(self) -> None:
+        self._serve(send_body=False)
+
+    def do_GET(self) -> None:
+        self._serve(send_body=True)
+
+    def _serve(self, send_body: bool) -> None:
+        path = self._resolve(urlsplit(self.path).path)
+        if path is None:
+            self._send_empty(404)
+            return
+
+        stat = path.stat()
+        size = stat.st_size
+        etag_key = (path, stat.st_mtime_ns, size)
+        etag = self._etags.get(etag_key)
+        if etag is None:
+            etag = self._etags[etag_key] = '"' + hashlib.sha1(path.read_bytes()).hexdigest() + '"'
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+        if self.headers.get("If-None-Match") == etag:
+            self._send_empty(304, {"ETag": etag, "Last-Modified": last_modified})
+            return
+
+        status, headers, start, end = 200, {}, 0, size - 1
+        byte_range = self._byte_range(size, etag, last_modified)
+        if byte_range == "unsatisfiable":
+            self._send_empty(416, {"Content-Range": f"bytes */{size}"})
+            return
+        if byte_range:
+            start, end = byte_range
+            status, headers = 206, {"Content-Range": f"bytes {start}-{end}/{size}"}
+        with path.open("rb") as file:
+            file.seek(start)
+            body = file.read(end - start + 1)
+
+        self.send_response(status)
+        self.send_header("Content-Type", self._content_type(path))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", last_modified)
+        if self.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _byte_range(self, size: int, etag: str, last_modified: str):
+        """``(start, end)`` of a satisfiable single range, "unsatisfiable", or None for the whole body."""
+        header = self.headers.get("Range")
+        if not self.ranges or not header:
+            return None
+        if_range = self.headers.get("If-Range")
+        if if_range and if_range not in (etag, last_modified):
+            return None
+        match = self.RANGE.match(header.strip())
+        if not match or match.groups() == ("", ""):
+            return None
+        first, last = match.groups()
+        if first:
+            start, end = int(first), min(int(last), size - 1) if last else size - 1
+        else:
+            start, end = max(0, size - int(last)), size - 1
+        if start >= size or start > end:
+            return "unsatisfiable"
+        return start, end
+
+    @staticmethod
+    def _content_type(path: Path) -> str:
+        # Fixtures are written as UTF-8; without a charset requests decodes text as ISO-8859-1.
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return f"{content_type}; charset=utf-8" if content_type.startswith("text/") else content_type
+
+    def _resolve(self, url_path: str) -> Optional[Path]:
+        candidate = (self.root / unquote(url_path).lstrip("/")).resolve()
+        if self.root not in candidate.parents or not candidate.is_file():
+            return None
+        return candidate
+
+    def _send_empty(self, status: int, headers: Optional[dict] = None) -> None:
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
@@ -0,0 +1,68 @@
+import os
+from typing import List
+
+
+def build_text_pdf(pages: List[str], image_bytes: int = 0) -> bytes:
+    """
+    Builds a minimal, uncompressed PDF with one Helvetica text block per page.
+
+    Good enough for PyPDF2 to extract the text back, which is all the benchmark
+    corpora need. Text must be Latin-1 encodable. ``image_bytes`` adds a random
+    grayscale image of about that size behind each page's text, to model scanned
+    attachment bundles.
+    """
+    page_count = len(pages)
+    per_page = 3 if image_bytes else 2
+    font_id = 3 + per_page * page_count
+    kids = " ".join(f"{3 + per_page * i} 0 R" for i in range(page_count))
+
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {page_count} >>",
+    ]
+    side = int(image_bytes ** 0.5)
+    for i, text in enumerate(pages):
+        page_id = 3 + per_page * i
+        stream = _text_stream(text)
+        resources = f"/Font << /F1 {font_id} 0 R >>"
+        if image_bytes:
+            stream = "q 612 0 0 792 0 0 cm /Im1 Do Q " + stream
+            resources += f" /XObject << /Im1 {page_id + 2} 0 R >>"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents {page_id + 1} 0 R "
+            f"/Resources << {resources} >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        if image_bytes:
+            objects.append(
+                (
+                    f"<< /Type /XObject /Subtype /Image /Width {side} /Height {side} /ColorSpace /DeviceGray "
+                    f"/BitsPerComponent 8 /Length {side * side} >>\nstream\n"
+                ).encode("latin-1")
+                + os.urandom(side * side)
+                + b"\nendstream"
+            )
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        if isinstance(body, str):
+            body = body.encode("latin-1")
+        output += f"{number} 0 obj\n".encode("ascii") + body + b"\nendobj\n"
+
+    xref_offset = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode("ascii")
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode("ascii")
+    output += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n"
+    ).encode("ascii")
+    return bytes(output)
+
+
+def _text_stream(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+    lines = " ".join(f"({line}) '" for line in escaped.split("\n"))
+    return f"BT /F1 11 Tf 72 720 Td 14 TL {lines} ET"
@@ -0,0 +1,579 @@
+"""
+Offline benchmark for the EO reference pipeline.
+
+Replays a fixture corpus (recorded from the live sites or generated) from a local
+HTTP server, times every pipeline stage, checks the output against the corpus's
+golden file and prints a machine-readable JSON report. ``generate`` and ``record``
+run a new corpus once to write that golden file; a later run that no longer
+matches it, or finds none, exits non-zero.
+
+    python benchmarks/run_benchmark.py generate --memos 10000 --eos 5000
+    python benchmarks/run_benchmark.py record
+    python benchmarks/run_benchmark.py run benchmarks/fixtures/synthetic-10000x5000 --output report.json
+    python benchmarks/run_benchmark.py compare before.json after.json
+    python benchmarks/run_benchmark.py parse benchmarks/fixtures/synthetic-10000x5000 --parser lxml
+    python benchmarks/run_benchmark.py extract benchmarks/fixtures/synthetic-10000x5000 --fast-scan 1 2
+    python benchmarks/run_benchmark.py fetch --documents 20 --image-bytes 500000 --fast-scan 1
+"""
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+from bs4 import BeautifulSoup
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+FIXTURES_DIR = BENCH_DIR / "fixtures"
+sys.path.insert(0, str(REPO_ROOT))
+
+from Analysis_Store import AnalysisStore  # noqa: E402
+from DA_Memo_Scraper import ArmyGuidanceScraper  # noqa: E402
+from Document_Registry import DocumentRegistry  # noqa: E402
+from EO_Reference_Consolidator import EOReferenceConsolidator  # noqa: E402
+from HTML_Parsing import DEFAULT_PARSER, available_parsers  # noqa: E402
+from HTTP_Client import HTTPClient  # noqa: E402
+from Pipeline_Metrics import PipelineMetrics  # noqa: E402
+from OPM_Memo_Scraper import OPMMemoScraper  # noqa: E402
+from PDF_Analyzer import PDFAnalyzer  # noqa: E402
+from PDF_Backends import DEFAULT_BACKEND, available_backends  # noqa: E402
+from Pipeline_Records import Memo, PresidentialOrders  # noqa: E402
+from Presidential_Order_Scraper import PresidentialOrderScraper  # noqa: E402
+from flatten import flatten_eo_docs  # noqa: E402
+from main import analyze_memos  # noqa: E402
+from fixture_server import FixtureServer  # noqa: E402
+from pdf_builder import build_text_pdf  # noqa: E402
+from synthetic_corpus import generate_corpus  # noqa: E402
+
+BASE_PLACEHOLDER = "{BASE_URL}"
+
+
+class StageTimer:
+    def __init__(self):
+        self.stages: Dict[str, Dict] = {}
+
+    @contextmanager
+    def stage(self, name: str, **details):
+        start = time.perf_counter()
+        yield details
+        self.stages[name] = {"seconds": round(time.perf_counter() - start, 6), **details}
+
+
+def run_corpus(
+    corpus_dir: Path,
+    download_workers: int = 8,
+    update_golden: bool = False,
+    parser: Optional[str] = None,
+    backend: str = DEFAULT_BACKEND,
+) -> Dict:
+    corpus_dir = Path(corpus_dir).resolve()
+    manifest = json.loads((corpus_dir / "manifest.json").read_text(encoding="utf-8"))
+    timer = StageTimer()
+    client = HTTPClient(use_cache=False)
+
+    with FixtureServer(corpus_dir / "files") as server, _scratch_workdir():
+        base = server.base_url
+        sources = {name: f"{base}/{path}" for name, path in manifest["sources"].items()}
+
+        with timer.stage("listing_download") as info:
+            listings = {name: client.get(url, timeout=30).text for name, url in sources.items()}
+            info["bytes"] = sum(len(text.encode("utf-8")) for text in listings.values())
+
+        po_scraper = PresidentialOrderScraper(url=sources["po"], base_url=base, client=client, parser=parser)
+        army_scraper = ArmyGuidanceScraper(url=sources["army"], client=client, parser=parser)
+        opm_scraper = OPMMemoScraper(url=sources["opm"], base_url=base, client=client, parser=parser)
+
+        with timer.stage("html_parse", parser=parser or DEFAULT_PARSER) as info:
+            eo_items, memo_items, proc_items = po_scraper._parse_html(listings["po"])
+            army_memos = army_scraper._extract_memos(listings["army"])
+            opm_memos = opm_scraper._parse_html(listings["opm"])
+            info["items"] = len(eo_items) + len(memo_items) + len(proc_items) + len(army_memos) + len(opm_memos)
+
+        # Analysis runs through the pipeline's own path: shared registry, analysis store and
+        # EO titles. The second pass finds every PDF unchanged, so the store serves it.
+        presidential_orders = PresidentialOrders(eo_items, memo_items, proc_items)
+        store = AnalysisStore(Path("docs") / "analysis_store.sqlite")
+        try:
+            for stage in ("pdf_analysis", "pdf_analysis_stored"):
+                metrics = PipelineMetrics()
+                analysis_client = HTTPClient(use_cache=False, metrics=metrics)
+                registry = DocumentRegistry()
+                with timer.stage(stage, workers=download_workers, backend=backend) as info:
+                    for source, memos in (("army", army_memos), ("opm", opm_memos)):
+                        analyze_memos(
+                            memos,
+                            base,
+                            download_workers=download_workers,
+                            store=store,
+                            source=source,
+                            client=analysis_client,
+                            metrics=metrics,
+                            registry=registry,
+                            backend=backend,
+                            executive_orders=presidential_orders.executive_orders,
+                        )
+                    info.update(_analysis_counters(metrics, army_memos + opm_memos))
+        finally:
+            store.close()
+
+        with timer.stage("consolidation") as info:
+            executive_orders = EOReferenceConsolidator().consolidate(presidential_orders, army_memos, opm_memos)
+            info["executive_orders"] = len(executive_orders)
+
+        with timer.stage("serialize"):
+            consolidated = [eo.to_dict() for eo in executive_orders]
+            consolidated_json = json.dumps(consolidated, indent=2, ensure_ascii=False)
+
+        with timer.stage("flatten") as info:
+            flat_docs = flatten_eo_docs(consolidated)
+            info["rows"] = len(flat_docs)
+
+        golden = _golden_summary(consolidated_json, flat_docs, base)
+
+    return {
+        "corpus": manifest.get("name", corpus_dir.name),
+        "kind": manifest.get("kind", "recorded"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "stages": timer.stages,
+        "total_seconds": round(sum(stage["seconds"] for stage in timer.stages.values()), 6),
+        "golden": _check_golden(corpus_dir / "golden.json", golden, update_golden),
+    }
+
+
+def _analysis_counters(metrics: PipelineMetrics, memos: List[Memo]) -> Dict:
+    """Where the analysis time went, from the counters the analyzer and HTTP client keep."""
+    counters = metrics.to_dict()["counters"]
+
+    def total(name: str, **labels: str) -> float:
+        return round(
+            sum(
+                entry["value"]
+                for entry in counters.get(name, [])
+                if all(entry["labels"].get(key) == value for key, value in labels.items())
+            ),
+            6,
+        )
+
+    return {
+        "documents": len(memos),
+        "bytes": total("http_bytes_total"),
+        "pages_parsed": total("pdf_pages_parsed_total"),
+        "parse_seconds": total("pdf_parse_seconds_total"),
+        "matcher_seconds": total("matcher_seconds_total"),
+        "store_hits": total("analysis_cache_total", result="hit"),
+        "deduplicated": total("documents_deduplicated_total"),
+        "references": sum(len(memo.eo_references) for memo in memos),
+    }
+
+
+def compare_parsing(corpus_dir: Path, parser: Optional[str] = None, repeat: int = 5) -> Dict:
+    """
+    Times each scraper's listing parse with a full document tree against the
+    region-only parse it uses, and checks that both yield the same records.
+    """
+    files_dir = Path(corpus_dir) / "files"
+    manifest = json.loads((Path(corpus_dir) / "manifest.json").read_text(encoding="utf-8"))
+    listings = {
+        "po": (PresidentialOrderScraper(parser=parser, client=HTTPClient(use_cache=False)), "_parse_html"),
+        "army": (ArmyGuidanceScraper(parser=parser, client=HTTPClient(use_cache=False)), "_extract_memos"),
+        "opm": (OPMMemoScraper(parser=parser, client=HTTPClient(use_cache=False)), "_parse_html"),
+    }
+
+    results = {}
+    for name, (scraper, method) in listings.items():
+        html = (files_dir / manifest["sources"][name]).read_text(encoding="utf-8")
+        timings, outputs = {}, {}
+        for mode in ("full_tree", "region"):
+            # An instance attribute shadows the class strainer, so None parses the full tree.
+            scraper.PARSE_ONLY = None if mode == "full_tree" else type(scraper).PARSE_ONLY
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                parsed = getattr(scraper, method)(html)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[mode] = round(best, 6)
+            outputs[mode] = _records_digest(parsed)
+        results[name] = {
+            "bytes": len(html.encode("utf-8")),
+            **timings,
+            "speedup": round(timings["full_tree"] / timings["region"], 2) if timings["region"] else None,
+            "identical": outputs["full_tree"] == outputs["region"],
+        }
+
+    return {
+        "corpus": manifest.get("name", Path(corpus_dir).name),
+        "parser": parser or DEFAULT_PARSER,
+        "available_parsers": available_parsers(),
+        "repeat": repeat,
+        "listings": results,
+    }
+
+
+def compare_extraction(
+    corpus_dir: Path, backends: Optional[List[str]] = None, fast_scan: List[int] = (), repeat: int = 1
+) -> Dict:
+    """
+    Times PDF analysis of every corpus PDF per backend, with full extraction and
+    each fast-scan depth, and scores the EO references found against full PyPDF2
+    extraction (the default pipeline) as recall.
+    """
+    files_dir = Path(corpus_dir) / "files"
+    manifest = json.loads((Path(corpus_dir) / "manifest.json").read_text(encoding="utf-8"))
+    contents = [path.read_bytes() for path in sorted(files_dir.rglob("*.pdf"))]
+    reference_analyzer = PDFAnalyzer(client=HTTPClient(use_cache=False))
+    reference = [_safe_analysis(reference_analyzer, content)[0] for content in contents]
+    expected = sum(len(refs) for refs in reference)
+
+    results = {}
+    for backend in backends or available_backends():
+        for pages in (0, *fast_scan):
+            analyzer = PDFAnalyzer(client=HTTPClient(use_cache=False), backend=backend, fast_scan_pages=pages)
+            best, found, pages_parsed, failures = None, 0, 0, 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                analyses = [_safe_analysis(analyzer, content) for content in contents]
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            for (refs, parsed), expected_refs in zip(analyses, reference):
+                found += len(refs & expected_refs)
+                pages_parsed += parsed
+                failures += parsed < 0
+            results[f"{backend}/{'full' if not pages else f'fast-{pages}'}"] = {
+                "seconds": round(best, 6),
+                "pages_parsed": pages_parsed,
+                "failures": failures,
+                "recall": round(found / expected, 4) if expected else None,
+            }
+
+    return {
+        "corpus": manifest.get("name", Path(corpus_dir).name),
+        "documents": len(contents),
+        "references": expected,
+        "available_backends": available_backends(),
+        "repeat": repeat,
+        "runs": results,
+    }
+
+
+def compare_fetching(
+    documents: int = 20,
+    pages: int = 20,
+    image_bytes: int = 500_000,
+    fast_scan: int = 1,
+    backend: str = DEFAULT_BACKEND,
+    download_workers: int = 4,
+) -> Dict:
+    """
+    Times full downloads against range-request lazy fetching on generated scanned-style
+    PDFs (an EO citation on page one, an image behind every page), served with and
+    without range support, and reports the bytes each mode transferred.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        files_dir = Path(tmp)
+        memos = []
+        for index in range(documents):
+            texts = [f"Implements Executive Order {14000 + index}."]
+            texts += [f"Attachment page {n}" for n in range(2, pages + 1)]
+            (files_dir / f"memo-{index}.pdf").write_bytes(build_text_pdf(texts, image_bytes=image_bytes))
+            memos.append(Memo(title=f"Memo {index}", pdf_link=f"/memo-{index}.pdf"))
+        total_bytes = sum(path.stat().st_size for path in files_dir.iterdir())
+
+        runs = {}
+        for ranges in (True, False):
+            with FixtureServer(files_dir, ranges=ranges) as server:
+                for lazy in (False, True):
+                    metrics = PipelineMetrics()
+                    analyzer = PDFAnalyzer(
+                        base_url=server.base_url,
+                        download_workers=download_workers,
+                        client=HTTPClient(use_cache=False, metrics=metrics),
+                        metrics=metrics,
+                        backend=backend,
+                        fast_scan_pages=fast_scan,
+                        lazy_fetch=lazy,
+                    )
+                    start = time.perf_counter()
+                    results = analyzer.analyze_memos(memos)
+                    elapsed = time.perf_counter() - start
+                    counters = metrics.to_dict()["counters"]
+                    fetched = sum(entry["value"] for entry in counters.get("http_bytes_total", []))
+                    found = sum(f"{14000 + index}" in result.eo_references for index, result in enumerate(results))
+                    runs[f"{'ranges' if ranges else 'no-ranges'}/{'lazy' if lazy else 'full'}"] = {
+                        "seconds": round(elapsed, 6),
+                        "requests": sum(entry["value"] for entry in counters.get("http_requests_total", [])),
+                        "bytes_fetched": fetched,
+                        "fraction_fetched": round(fetched / total_bytes, 4),
+                        "recall": round(found / documents, 4),
+                    }
+
+    return {
+        "documents": documents,
+        "pages": pages,
+        "bytes": total_bytes,
+        "backend": backend,
+        "fast_scan": fast_scan,
+        "runs": runs,
+    }
+
+
+def _safe_analysis(analyzer: PDFAnalyzer, content: bytes):
+    """EO references and pages parsed for one PDF; -1 pages marks a PDF the backend could not read."""
+    try:
+        (refs, _), (pages_parsed, _, _) = analyzer._analyze_content_timed(content)
+    except Exception:
+        return set(), -1
+    return refs, pages_parsed
+
+
+def _records_digest(parsed) -> str:
+    groups = parsed if isinstance(parsed, tuple) else (parsed,)
+    return _digest(json.dumps([[record.to_dict() for record in group] for group in groups], sort_keys=True))
+
+
+def record_corpus(out_dir: Path) -> Path:
+    """
+    Records the live listing pages and every memo PDF they link to into a fixture
+    corpus. Links are rewritten to local paths so the corpus replays offline.
+    """
+    out_dir = Path(out_dir)
+    files_dir = out_dir / "files"
+    (files_dir / "pdfs").mkdir(parents=True, exist_ok=True)
+    client = HTTPClient(use_cache=False)
+
+    po_scraper = PresidentialOrderScraper(client=client)
+    army_scraper = ArmyGuidanceScraper(client=client)
+    opm_scraper = OPMMemoScraper(client=client)
+    listings = {
+        "po": (po_scraper.url, None, po_scraper._fetch_html()),
+        "army": (army_scraper.url, "https://api.army.mil", army_scraper._fetch_html()),
+        "opm": (opm_scraper.url, opm_scraper.BASE_URL, client.get(opm_scraper.url, timeout=30).text),
+    }
+    pdf_links = {
+        "army": {memo.pdf_link for memo in army_scraper._extract_memos(listings["army"][2])},
+        "opm": {urlsplit(memo.pdf_link).path for memo in opm_scraper._parse_html(listings["opm"][2])},
+    }
+
+    recorded = {}
+    for name, (url, site_base, html) in listings.items():
+        if name in pdf_links:
+            soup = BeautifulSoup(html, "html.parser")
+            for anchor in soup.find_all("a", href=True):
+                href = anchor["href"]
+                if href not in pdf_links[name] and urlsplit(href).path not in pdf_links[name]:
+                    continue
+                absolute = urljoin(site_base, href)
+                local = "/pdfs/" + hashlib.sha1(absolute.encode("utf-8")).hexdigest()[:16] + ".pdf"
+                if local not in recorded:
+                    try:
+                        response = client.get(absolute, timeout=60)
+                        response.raise_for_status()
+                    except Exception as e:
+                        print(f"Skipping {absolute}: {e}", file=sys.stderr)
+                        continue
+                    (files_dir / local.lstrip("/")).write_bytes(response.content)
+                    recorded[local] = absolute
+                anchor["href"] = local
+            html = str(soup)
+        (files_dir / f"{name}.html").write_text(html, encoding="utf-8")
+        recorded[f"/{name}.html"] = url
+
+    manifest = {
+        "name": out_dir.name,
+        "kind": "recorded",
+        "recorded_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "sources": {"po": "po.html", "army": "army.html", "opm": "opm.html"},
+        "urls": recorded,
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return out_dir
+
+
+def compare_reports(before: Dict, after: Dict) -> Dict:
+    """Per-stage timing deltas between two reports (positive means slower)."""
+    stages = {}
+    for name in sorted(set(before["stages"]) | set(after["stages"])):
+        old = before["stages"].get(name, {}).get("seconds")
+        new = after["stages"].get(name, {}).get("seconds")
+        entry = {"before": old, "after": new}
+        if old and new:
+            entry["change_pct"] = round((new - old) / old * 100, 1)
+        stages[name] = entry
+    return {
+        "before": {"commit": before.get("commit"), "total_seconds": before.get("total_seconds")},
+        "after": {"commit": after.get("commit"), "total_seconds": after.get("total_seconds")},
+        "stages": stages,
+    }
+
+
+def _golden_summary(consolidated_json: str, flat_docs: List[Dict], base_url: str) -> Dict:
+    """Port-independent digest of the outputs, plus counts that explain a mismatch."""
+    consolidated = json.loads(consolidated_json.replace(base_url, BASE_PLACEHOLDER))
+    flat_json = json.dumps(flat_docs, ensure_ascii=False).replace(base_url, BASE_PLACEHOLDER)
+    return {
+        "consolidated_sha256": _digest(json.dumps(consolidated, sort_keys=True, ensure_ascii=False)),
+        "flat_sha256": _digest(flat_json),
+        "counts": {
+            "executive_orders": len(consolidated),
+            "opm_links": sum(len(eo["opm_docs"]) for eo in consolidated),
+            "da_links": sum(len(eo["da_docs"]) for eo in consolidated),
+            "dod_links": sum(len(eo["dod_docs"]) for eo in consolidated),
+            "flat_rows": len(flat_docs),
+        },
+    }
+
+
+def _write_golden(corpus_dir: Path) -> Path:
+    """Runs a new corpus once and records its output as the golden file later runs are checked against."""
+    run_corpus(corpus_dir, update_golden=True)
+    return corpus_dir
+
+
+def _check_golden(path: Path, summary: Dict, update: bool) -> Dict:
+    if update:
+        path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        return {"status": "updated", **summary}
+    if not path.exists():
+        return {"status": "missing", **summary}
+
+    expected = json.loads(path.read_text(encoding="utf-8"))
+    if expected == summary:
+        return {"status": "match"}
+    return {"status": "mismatch", "expected": expected, "actual": summary}
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@contextmanager
+def _scratch_workdir():
+    """The scrapers write ./docs/*.json; keep that out of the repository."""
+    previous = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="eo-bench-") as workdir:
+        (Path(workdir) / "docs").mkdir()
+        os.chdir(workdir)
+        try:
+            yield Path(workdir)
+        finally:
+            os.chdir(previous)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="replay a corpus and time each stage")
+    run.add_argument("corpus", type=Path)
+    run.add_argument("--download-workers", type=int, default=8)
+    run.add_argument("--update-golden", action="store_true", help="accept the current output as golden")
+    run.add_argument("--output", type=Path, help="write the JSON report here instead of stdout")
+    run.add_argument("--parser", help=f"HTML parser backend (default {DEFAULT_PARSER})")
+    run.add_argument(
+        "--backend", default=DEFAULT_BACKEND, help=f"PDF text-extraction backend (default {DEFAULT_BACKEND})"
+    )
+
+    parse = commands.add_parser("parse", help="compare full-tree and region-only listing parsing")
+    parse.add_argument("corpus", type=Path)
+    parse.add_argument("--parser", help=f"HTML parser backend (default {DEFAULT_PARSER})")
+    parse.add_argument("--repeat", type=int, default=5, help="runs per mode; the fastest is reported")
+
+    extract = commands.add_parser("extract", help="compare PDF backends and fast-scan depths")
+    extract.add_argument("corpus", type=Path)
+    extract.add_argument(
+        "--backend", action="append", dest="backends", help="backend to time (repeatable; default all installed)"
+    )
+    extract.add_argument(
+        "--fast-scan", type=int, nargs="*", default=[1, 2], help="fast-scan depths to time besides full extraction"
+    )
+    extract.add_argument("--repeat", type=int, default=1, help="runs per configuration; the fastest is reported")
+
+    fetch = commands.add_parser("fetch", help="compare full downloads and range-request lazy fetching")
+    fetch.add_argument("--documents", type=int, default=20)
+    fetch.add_argument("--pages", type=int, default=20, help="pages per generated PDF")
+    fetch.add_argument("--image-bytes", type=int, default=500_000, help="size of the image behind each page")
+    fetch.add_argument("--fast-scan", type=int, default=1, help="fast-scan depth for both modes (0 reads every page)")
+    fetch.add_argument(
+        "--backend", default=DEFAULT_BACKEND, help=f"PDF text-extraction backend (default {DEFAULT_BACKEND})"
+    )
+
+    generate = commands.add_parser("generate", help="generate a synthetic corpus")
+    generate.add_argument("--memos", type=int, default=10_000)
+    generate.add_argument("--eos", type=int, default=5_000)
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument("--out", type=Path)
+
+    record = commands.add_parser("record", help="record the live sites into a corpus")
+    record.add_argument("--out", type=Path, default=FIXTURES_DIR / "recorded")
+
+    compare = commands.add_parser("compare", help="compare two JSON reports")
+    compare.add_argument("before", type=Path)
+    compare.add_argument("after", type=Path)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        out = args.out or FIXTURES_DIR / f"synthetic-{args.memos}x{args.eos}"
+        generate_corpus(out, args.memos, args.eos, args.seed, keywords=PDFAnalyzer.EO_NAME_KEYWORDS)
+        _write_golden(out)
+        print(out)
+        return 0
+
+    if args.command == "record":
+        print(_write_golden(record_corpus(args.out)))
+        return 0
+
+    if args.command == "parse":
+        report = compare_parsing(args.corpus, args.parser, args.repeat)
+        print(json.dumps(report, indent=2))
+        return 0 if all(listing["identical"] for listing in report["listings"].values()) else 1
+
+    if args.command == "extract":
+        report = compare_extraction(args.corpus, args.backends, args.fast_scan, args.repeat)
+        print(json.dumps(report, indent=2))
+        return 0
+
+    if args.command == "fetch":
+        report = compare_fetching(args.documents, args.pages, args.image_bytes, args.fast_scan, args.backend)
+        print(json.dumps(report, indent=2))
+        return 0 if all(run["recall"] == 1 for run in report["runs"].values()) else 1
+
+    if args.command == "compare":
+        before = json.loads(args.before.read_text(encoding="utf-8"))
+        after = json.loads(args.after.read_text(encoding="utf-8"))
+        print(json.dumps(compare_reports(before, after), indent=2))
+        return 0
+
+    report = run_corpus(args.corpus, args.download_workers, args.update_golden, args.parser, args.backend)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(output, encoding="utf-8")
+    else:
+        print(output)
+    return 0 if report["golden"]["status"] in ("match", "updated") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
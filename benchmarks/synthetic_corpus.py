@@ -0,0 +1,178 @@
+import html
+import json
+import random
+from pathlib import Path
+from typing import Dict, List
+
+from pdf_builder import build_text_pdf
+
+ARMY_HEADER = "ARMY IMPLEMENTATION GUIDANCE MEMORANDUMS"
+# Navigation, sidebar and footer links per listing page; on the live pages this
+# chrome outweighs the region each scraper actually reads.
+CHROME_LINKS = 3_000
+FILLER_WORDS = (
+    "personnel policy guidance implementation readiness workforce federal agency department "
+    "component commander directive memorandum review compliance schedule report training "
+    "program office authority update requirement effective immediately annual plan"
+).split()
+# EO titles get their own vocabulary, so memo text only matches a title where a memo cites it.
+TITLE_WORDS = (
+    "Protecting Restoring Ending Securing Strengthening Reforming Promoting Establishing Unleashing "
+    "Revitalizing Modernizing Defending Prioritizing Expanding Reducing American Energy Borders Freedom "
+    "Manufacturing Maritime Innovation Sovereignty Excellence Accountability Integrity Prosperity "
+    "Dominance Fairness Transparency Competitiveness Infrastructure Supply Chains Critical Minerals Drones"
+).split()
+
+
+def generate_corpus(
+    out_dir: Path,
+    memo_count: int = 10_000,
+    eo_count: int = 5_000,
+    seed: int = 0,
+    keywords: Dict[str, List[str]] = None,
+) -> Path:
+    """
+    Writes a synthetic fixture corpus: the DoD, Army and OPM listing pages plus one
+    small PDF per Army/OPM memo, laid out like a recorded corpus so the benchmark
+    replays both the same way.
+
+    Memos cite random EOs numerically ("Executive Order N", "E.O. N"), sometimes by
+    their listed title, and when ``keywords`` is given, by one of those title phrases.
+    """
+    rng = random.Random(seed)
+    out_dir = Path(out_dir)
+    files_dir = out_dir / "files"
+    (files_dir / "pdfs").mkdir(parents=True, exist_ok=True)
+
+    eo_numbers = [str(10_000 + i) for i in range(eo_count)]
+    keyword_items = sorted((keywords or {}).items())
+
+    dod_count = memo_count // 10
+    army_count = (memo_count - dod_count) // 2
+    opm_count = memo_count - dod_count - army_count
+
+    eo_titles = [_eo_title(rng) for _ in eo_numbers]
+    po_entries = [
+        (f"EO {number}", f"/eo/{number}.pdf", _date(rng), title)
+        for number, title in zip(eo_numbers, eo_titles)
+    ]
+    for i in range(dod_count):
+        cited = rng.choice(eo_numbers)
+        po_entries.append((f"Memo {i}", f"/dod/{i}.pdf", _date(rng), f"Implementing EO {cited}: {_title(rng)}"))
+    for i in range(max(1, dod_count // 20)):
+        po_entries.append((f"Proc. {i}", f"/proc/{i}.pdf", _date(rng), _title(rng)))
+
+    army_items = [
+        _write_memo_pdf(files_dir, "army", i, rng, eo_numbers, eo_titles, keyword_items) for i in range(army_count)
+    ]
+    opm_items = [
+        _write_memo_pdf(files_dir, "opm", i, rng, eo_numbers, eo_titles, keyword_items) for i in range(opm_count)
+    ]
+
+    chrome = _page_chrome(rng)
+    (files_dir / "po.html").write_text(_po_page(po_entries, chrome), encoding="utf-8")
+    (files_dir / "army.html").write_text(_army_page(army_items, rng, chrome), encoding="utf-8")
+    (files_dir / "opm.html").write_text(_opm_page(opm_items, chrome), encoding="utf-8")
+
+    manifest = {
+        "name": out_dir.name,
+        "kind": "synthetic",
+        "sources": {"po": "po.html", "army": "army.html", "opm": "opm.html"},
+        "params": {"memo_count": memo_count, "eo_count": eo_count, "seed": seed},
+    }
+    (out_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return out_dir
+
+
+def _write_memo_pdf(
+    files_dir: Path, source: str, index: int, rng: random.Random, eo_numbers, eo_titles, keyword_items
+):
+    pages = []
+    for _ in range(rng.randint(1, 3)):
+        sentences = [_sentence(rng) for _ in range(rng.randint(4, 10))]
+        for _ in range(rng.randint(0, 2)):
+            number = rng.choice(eo_numbers)
+            citation = rng.choice([f"Executive Order {number}", f"E.O. {number}", f"Executive Order No. {number}"])
+            sentences.insert(rng.randrange(len(sentences) + 1), f"Pursuant to {citation}, agencies shall comply.")
+        if rng.random() < 0.1:
+            sentences.append(f"This memorandum implements {rng.choice(eo_titles)}.")
+        if keyword_items and rng.random() < 0.2:
+            _, phrases = rng.choice(keyword_items)
+            phrase = rng.choice(phrases).encode("latin-1", "replace").decode("latin-1")
+            sentences.append(f"This supports {phrase}.")
+        pages.append("\n".join(sentences))
+
+    path = f"/pdfs/{source}-{index}.pdf"
+    (files_dir / path.lstrip("/")).write_bytes(build_text_pdf(pages))
+    return path, _title(rng)
+
+
+def _page_chrome(rng: random.Random):
+    """Header navigation and footer markup shared by the three listing pages."""
+    menu = "".join(
+        f'<li class="menu-item"><a class="menu-link" href="/section/{i}"><span>{_title(rng)}</span></a></li>'
+        for i in range(CHROME_LINKS // 2)
+    )
+    footer = "".join(
+        f'<div class="footer-col"><a href="/about/{i}">{_title(rng)}</a><p>{_sentence(rng)}</p></div>'
+        for i in range(CHROME_LINKS // 2)
+    )
+    return f'<header><nav><ul class="menu">{menu}</ul></nav></header>', f"<footer>{footer}</footer>"
+
+
+def _po_page(entries, chrome) -> str:
+    header, footer = chrome
+    anchors = "\n".join(
+        f'<a target="_blank" href="{href}"><div class="item">'
+        f'<div class="eo"><span>{html.escape(number)}</span></div>'
+        f'<div class="date">{date}</div><div class="title">{html.escape(title)}</div></div></a>'
+        for number, href, date, title in entries
+    )
+    return (
+        "<html><head><title>Guidance</title></head><body>"
+        + header
+        + f'<div id="eo-links">{anchors}</div>'
+        + footer + "</body></html>"
+    )
+
+
+def _army_page(items, rng: random.Random, chrome) -> str:
+    header, footer = chrome
+    rows = "\n".join(
+        f"<li>{_date(rng)} — <a href=\"{href}\">{html.escape(title)}</a></li>" for href, title in items
+    )
+    return (
+        "<html><body>"
+        + header
+        + '<section class="microtext"><h4>NEWS</h4><ul><li><a href="/news">News</a></li></ul></section>'
+        + f'<section class="microtext"><h4>{ARMY_HEADER}</h4><ul>{rows}</ul></section>'
+        + footer + "</body></html>"
+    )
+
+
+def _opm_page(items, chrome) -> str:
+    header, footer = chrome
+    rows = "\n".join(
+        '<li class="usa-collection__item">'
+        f'<a class="usa-link" href="{href}">{html.escape(title)}</a>'
+        '<div class="usa-collection__description">'
+        "<p><strong>From:</strong> Director</p><p>Memorandum summary text.</p></div></li>"
+        for href, title in items
+    )
+    return f'<html><body>{header}<ul class="usa-collection">{rows}</ul>{footer}</body></html>'
+
+
+def _title(rng: random.Random) -> str:
+    return " ".join(rng.choice(FILLER_WORDS).capitalize() for _ in range(rng.randint(3, 8)))
+
+
+def _eo_title(rng: random.Random) -> str:
+    return " ".join(rng.choice(TITLE_WORDS) for _ in range(rng.randint(4, 9)))
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(FILLER_WORDS) for _ in range(rng.randint(6, 14))).capitalize() + "."
+
+
+def _date(rng: random.Random) -> str:
+    return f"{rng.randint(1, 12):02d}/{rng.randint(1, 28):02d}/{rng.randint(2017, 2025)}"
@@ -1,20 +1,25 @@
-import json
+from typing import Dict, Iterable, Iterator, List, Union
 
-with open("./docs/consolidated_eo_references.json", "r", encoding="utf-8") as f:
-    eo_data = json.load(f)
+from Artifact_IO import artifact_format, write_records
+from EO_Query_Store import EOQueryStore
+from EO_Reference_Consolidator import iter_eo_links, load_consolidated
 
-flat_docs = []
+INPUT_PATH = "./docs/consolidated_eo_references.json"
+OUTPUT_PATH = "./docs/eo_docs_flat.json"
+STORE_PATH = "./docs/eo_docs.sqlite"
 
-for eo in eo_data:
-    base = {
-        "eo_number": eo["eo_number"],
-        "eo_title": eo["eo_title"],
-        "eo_link": eo["eo_link"]
-    }
 
-    for source, docs in [("opm", eo["opm_docs"]), ("dod", eo["dod_docs"]), ("da", eo["da_docs"])]:
-        for doc in docs:
-            flat_docs.append({
+def iter_flat_docs(eo_data: Union[Iterable[Dict], Dict]) -> Iterator[Dict]:
+    """Yields one row per EO↔document link; accepts the nested or the normalized consolidated output."""
+    for eo, docs in iter_eo_links(eo_data):
+        base = {
+            "eo_number": eo["eo_number"],
+            "eo_title": eo["eo_title"],
+            "eo_link": eo["eo_link"]
+        }
+
+        for source, doc in docs:
+            yield {
                 **base,
                 "source": source,
                 "doc_title": doc.get("title") or doc.get("doc_number"),
@@ -22,7 +27,24 @@ for eo in eo_data:
                 "date": doc.get("date"),
                 "from": doc.get("from"),
                 "stakeholders": doc.get("stakeholders"),
-            })
+            }
+
+
+def flatten_eo_docs(eo_data: Union[Iterable[Dict], Dict]) -> List[Dict]:
+    return list(iter_flat_docs(eo_data))
+
+
+def main(input_path: str = INPUT_PATH, output_path: str = OUTPUT_PATH, store_path: str = STORE_PATH) -> None:
+    """Paths may name any ``Artifact_IO`` format; rows are streamed to ``output_path``."""
+    eo_data = load_consolidated(input_path)
+    write_records(output_path, iter_flat_docs(eo_data))
+
+    # Indexed copy the dashboard queries instead of filtering the JSON in memory.
+    if artifact_format(input_path) != "json":
+        # The first pass consumed the stream.
+        eo_data = load_consolidated(input_path)
+    EOQueryStore(store_path).rebuild(eo_data)
+
 
-with open("./docs/eo_docs_flat.json", "w", encoding="utf-8") as f:
-    json.dump(flat_docs, f, indent=2, ensure_ascii=False)
+if __name__ == "__main__":
+    main()
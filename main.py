@@ -1,50 +1,171 @@
+"""
+EO reference pipeline.
+
+    python main.py                 # scrape, analyze, consolidate and flatten
+    python main.py scrape          # listings -> docs/PO_Docs.json, DA_Memos.json, OPM_Memos.json
+    python main.py analyze         # memo PDFs -> docs/DA_Memos_analyzed.json, OPM_Memos_analyzed.json
+    python main.py consolidate     # -> docs/consolidated_eo_references.json
+    python main.py flatten         # -> docs/eo_docs_flat.json and docs/eo_docs.sqlite
+
+Each stage reads the previous stage's files, so one can be re-run on its own.
+``--format ndjson.gz`` (or ``ndjson``, ``ndjson.zst``) writes every artifact as
+compressed NDJSON instead, e.g. docs/DA_Memos.ndjson.gz; later stages must be
+given the same ``--format``.
+Modules are imported by the stage that needs them: ``consolidate`` and
+``flatten`` never load requests, BeautifulSoup or the PDF libraries.
+"""
+from __future__ import annotations
+
+import argparse
 import json
 import logging
-from urllib.parse import urljoin
+from concurrent.futures import Future
+from contextlib import nullcontext
 from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+
+from Artifact_IO import DEFAULT_FORMAT, FORMATS, artifact_format, artifact_path, read_records, write_json, write_records
+from HTML_Parsing import DEFAULT_PARSER, STRAINABLE_PARSERS, available_parsers
+from PDF_Backends import BACKENDS, DEFAULT_BACKEND
+from Pipeline_Metrics import PipelineMetrics
 
-from EO_Reference_Consolidator import EOReferenceConsolidator
-from OPM_Memo_Scraper import OPMMemoScraper
-from DA_Memo_Scraper import ArmyGuidanceScraper
-from PDF_Analyzer import PDFAnalyzer
-from Presidential_Order_Scraper import PresidentialOrderScraper
+if TYPE_CHECKING:
+    from Analysis_Store import AnalysisStore
+    from Document_Registry import DocumentRegistry
+    from HTTP_Client import HTTPClient
+    from Pipeline_Records import ExecutiveOrder, Memo, PresidentialDocument, PresidentialOrders
+    from Search_Index import SearchIndex
 
 # Constants
 DOCS_DIR = Path("./docs")
 OUTPUT_FILE = DOCS_DIR / "consolidated_eo_references.json"
+CHANGE_FEED_FILE = DOCS_DIR / "eo_link_changes.ndjson"
+# Stage intermediates; the scraped files are the scrapers' own OUTPUT_PATHs.
+# All artifact paths are given in JSON form and re-suffixed for --format.
+PO_FILE = DOCS_DIR / "PO_Docs.json"
+SCRAPED_FILES = {"army": DOCS_DIR / "DA_Memos.json", "opm": DOCS_DIR / "OPM_Memos.json"}
+ANALYZED_FILES = {"army": DOCS_DIR / "DA_Memos_analyzed.json", "opm": DOCS_DIR / "OPM_Memos_analyzed.json"}
+# Upper bound only; HTTPClient adapts the concurrency actually used per host.
+PDF_DOWNLOAD_WORKERS = 16
+PDF_PARSE_WORKERS = 4
+PROFILE_DIR = DOCS_DIR / "profiles"
+BACKFILL_WORKERS = 4
+# Pages read before the rest of a memo is (only if no EO was cited there); 0 reads everything.
+FAST_SCAN_PAGES = 0
+# With --streaming, bytes of each PDF download kept in RAM before it is spooled to disk.
+STREAMING_MEMORY_LIMIT = 8 * 1024 * 1024
+# Seconds between polls of each source in --watch mode.
+WATCH_INTERVALS = {"po": 3600, "army": 900, "opm": 900}
+ARMY_BASE_URL = "https://api.army.mil"
+OPM_BASE_URL = "https://www.opm.gov"
+MEMO_BASE_URLS = {"army": ARMY_BASE_URL, "opm": OPM_BASE_URL}
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 
-def scrape_and_analyze_memos(scraper, analyzer_base_url: str) -> str:
+def scrape_and_analyze_memos(
+    scraper,
+    analyzer_base_url: str,
+    download_workers: int = PDF_DOWNLOAD_WORKERS,
+    parse_workers: int = PDF_PARSE_WORKERS,
+    store: AnalysisStore = None,
+    search_index: SearchIndex = None,
+    source: str = None,
+    client: HTTPClient = None,
+    metrics: PipelineMetrics = None,
+    registry: DocumentRegistry = None,
+    backend: str = DEFAULT_BACKEND,
+    fast_scan_pages: int = FAST_SCAN_PAGES,
+    executive_orders: Union[List[PresidentialDocument], Future] = None,
+    lazy_fetch: bool = False,
+    streaming: bool = False,
+    memory_limit: int = STREAMING_MEMORY_LIMIT,
+) -> List[Memo]:
     """
     Scrapes memos and analyzes PDFs for EO references.
 
     Returns:
-        A JSON string with EO references added to each memo.
+        The scraped memos with ``eo_references`` filled in.
     Raises:
         ValueError: If the scraper returns empty data.
     """
-    raw_json = scraper.scrape()
-    if not raw_json or raw_json.strip() in ["[]", ""]:
+    with _timed(metrics, f"{source}.scrape" if source else None):
+        memos = scraper.scrape_records()
+    if not memos:
         raise ValueError(f"{scraper.__class__.__name__} returned no data.")
 
-    memos = json.loads(raw_json)
-    analyzer = PDFAnalyzer(base_url=analyzer_base_url)
-    analysis = analyzer.parse_pdfs_for_eo_references(raw_json)
+    return analyze_memos(
+        memos,
+        analyzer_base_url,
+        download_workers=download_workers,
+        parse_workers=parse_workers,
+        store=store,
+        search_index=search_index,
+        source=source,
+        client=client,
+        metrics=metrics,
+        registry=registry,
+        backend=backend,
+        fast_scan_pages=fast_scan_pages,
+        executive_orders=executive_orders,
+        lazy_fetch=lazy_fetch,
+        streaming=streaming,
+        memory_limit=memory_limit,
+    )
 
-    reference_map = {
-        item["pdf_link"]: item.get("eo_references", [])
-        for item in analysis
-    }
+
+def analyze_memos(
+    memos: List[Memo],
+    analyzer_base_url: str,
+    download_workers: int = PDF_DOWNLOAD_WORKERS,
+    parse_workers: int = PDF_PARSE_WORKERS,
+    store: AnalysisStore = None,
+    search_index: SearchIndex = None,
+    source: str = None,
+    client: HTTPClient = None,
+    metrics: PipelineMetrics = None,
+    registry: DocumentRegistry = None,
+    backend: str = DEFAULT_BACKEND,
+    fast_scan_pages: int = FAST_SCAN_PAGES,
+    executive_orders: Union[List[PresidentialDocument], Future] = None,
+    lazy_fetch: bool = False,
+    streaming: bool = False,
+    memory_limit: int = STREAMING_MEMORY_LIMIT,
+) -> List[Memo]:
+    """
+    Fills in ``eo_references`` on each memo from its PDF and returns the memos.
+    The titles of ``executive_orders`` are matched as well as EO numbers.
+    """
+    from PDF_Analyzer import PDFAnalyzer
+
+    analyzer = PDFAnalyzer(
+        base_url=analyzer_base_url,
+        download_workers=download_workers,
+        parse_workers=parse_workers,
+        store=store,
+        search_index=search_index,
+        source=source,
+        client=client,
+        metrics=metrics,
+        registry=registry,
+        backend=backend,
+        fast_scan_pages=fast_scan_pages,
+        executive_orders=executive_orders,
+        lazy_fetch=lazy_fetch,
+        streaming=streaming,
+        memory_limit=memory_limit,
+    )
+    with _timed(metrics, f"{source}.analyze" if source else None):
+        analysis = analyzer.analyze_memos(memos)
+
+    reference_map = {result.pdf_link: result.eo_references for result in analysis}
 
     for memo in memos:
-        original_link = memo.get("pdf_link", "")
-        absolute_link = urljoin(analyzer.base_url, original_link) if original_link else ""
-        memo["eo_references"] = reference_map.get(absolute_link, [])
+        absolute_link = analyzer.resolve_link(memo.pdf_link) if memo.pdf_link else ""
+        memo.eo_references = reference_map.get(absolute_link, [])
 
-    return json.dumps(memos, indent=2, ensure_ascii=False)
+    return memos
 
 
 def write_output_to_file(data: str, path: Path) -> None:
@@ -53,44 +174,543 @@ def write_output_to_file(data: str, path: Path) -> None:
     logging.info(f"✅ Output written to {path}")
 
 
-def main():
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "command",
+        nargs="?",
+        default="all",
+        choices=COMMANDS,
+        help="pipeline stage to run (default all)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help=f"run each stage under cProfile and write .pstats files to {PROFILE_DIR}",
+    )
+    parser.add_argument(
+        "--backfill",
+        action="store_true",
+        help="crawl every page of the Army and OPM listings instead of the first one (resumable)",
+    )
+    parser.add_argument("--max-pages", type=int, help="stop a backfill run after fetching this many listing pages")
+    parser.add_argument(
+        "--pdf-backend",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help=f"PDF text-extraction backend (default {DEFAULT_BACKEND})",
+    )
+    parser.add_argument(
+        "--parser",
+        dest="html_parser",
+        choices=[name for name, _ in STRAINABLE_PARSERS],
+        default=DEFAULT_PARSER,
+        help=f"HTML parser for the listing pages; lxml is faster (pip install lxml) (default {DEFAULT_PARSER})",
+    )
+    parser.add_argument(
+        "--fast-scan",
+        type=int,
+        default=FAST_SCAN_PAGES,
+        metavar="N",
+        help="extract only the first N pages and the last one unless they cite no EO",
+    )
+    parser.add_argument(
+        "--lazy-fetch",
+        action="store_true",
+        help="read PDFs with HTTP range requests, fetching only the pages analyzed (pairs with --fast-scan)",
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="spool each PDF download and match it page by page, keeping memory bounded per document",
+    )
+    parser.add_argument(
+        "--memory-limit",
+        type=int,
+        default=STREAMING_MEMORY_LIMIT // (1024 * 1024),
+        metavar="MIB",
+        help="with --streaming, MiB of a download kept in RAM before it spills to disk "
+        f"(default {STREAMING_MEMORY_LIMIT // (1024 * 1024)})",
+    )
+    parser.add_argument(
+        "--normalized",
+        action="store_true",
+        help="write the consolidated output as a documents table plus per-EO document ID lists",
+    )
+    parser.add_argument(
+        "--format",
+        dest="artifact_format",
+        choices=FORMATS,
+        default=DEFAULT_FORMAT,
+        help="format of every intermediate and output file; the NDJSON formats are streamed (default json)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help=f"keep running, poll each source on its interval and append link changes to {CHANGE_FEED_FILE}",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        action="append",
+        default=[],
+        metavar="SOURCE=SECONDS",
+        help=f"override a --watch interval (sources: {', '.join(WATCH_INTERVALS)})",
+    )
+    args = parser.parse_args(argv)
+    if args.normalized and args.artifact_format != DEFAULT_FORMAT:
+        parser.error("--normalized output is only written as json")
+    if args.html_parser not in available_parsers():
+        parser.error(f"--parser {args.html_parser} is not installed: pip install {args.html_parser}")
+    if args.watch:
+        return _watch(args)
+
+    metrics = PipelineMetrics(profile_dir=PROFILE_DIR if args.profile else None)
+    try:
+        COMMANDS[args.command](args, metrics)
+    finally:
+        # A command that stopped before its first stage (e.g. a missing input) leaves no report.
+        if not metrics.empty:
+            metrics.write(*_metrics_paths(args.command))
+
+
+def _run_all(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    from Analysis_Store import AnalysisStore
+    from Document_Registry import DocumentRegistry
+    from HTTP_Client import HTTPClient
+    from Search_Index import SearchIndex
+    from Stage_Scheduler import StageScheduler
+
     logging.info("📥 Starting EO Reference Consolidation Pipeline")
 
-    # Step 1: Get Presidential Orders
-    po_json = PresidentialOrderScraper().scrape()
+    client = HTTPClient(metrics=metrics)
+    # Shared by both memo branches so a PDF linked from Army and OPM is fetched and parsed once.
+    registry = DocumentRegistry()
+
+    # The three source branches only meet at consolidation, so they run side by side.
+    store = AnalysisStore()
+    search_index = SearchIndex()
+    # Memo analysis matches the titles of the scraped EOs, but only its matching step waits for
+    # them: the memo branches scrape and download right away, and match on numbers and keywords
+    # alone if the DoD scrape fails.
+    executive_orders: Future = Future()
+
+    def run_presidential_orders() -> PresidentialOrders:
+        po = None
+        try:
+            po = _run_presidential_orders(client, args.artifact_format, args.html_parser)
+            return po
+        finally:
+            executive_orders.set_result(_listed_executive_orders(po))
+
+    scheduler = StageScheduler()
+    scheduler.add("po", metrics.wrap("po", run_presidential_orders))
+    shared = (
+        store,
+        search_index,
+        client,
+        metrics,
+        registry,
+        args.backfill,
+        args.max_pages,
+        args.pdf_backend,
+        args.fast_scan,
+        args.artifact_format,
+        args.lazy_fetch,
+        args.streaming,
+        args.memory_limit * 1024 * 1024,
+        args.html_parser,
+    )
+    scheduler.add("army", metrics.wrap("army", lambda: _run_army_memos(*shared, executive_orders=executive_orders)))
+    scheduler.add("opm", metrics.wrap("opm", lambda: _run_opm_memos(*shared, executive_orders=executive_orders)))
+    scheduler.add("consolidate", metrics.wrap("consolidate", _run_consolidation), depends_on=("po", "army", "opm"))
+
+    try:
+        outcomes = scheduler.run()
+        consolidation = outcomes["consolidate"]
+        if not consolidation.ok:
+            logging.error("❌ Consolidation did not run; no output written")
+            return
+
+        with metrics.stage("write_output"):
+            _write_consolidated(consolidation.result, args.normalized, args.artifact_format)
+        with metrics.stage("flatten"):
+            _run_flatten(args.artifact_format)
+    finally:
+        store.close()
+        search_index.close()
+
+
+def _run_scrape(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    """Fetches the three listings; each scraper writes its own docs/ artifact."""
+    from DA_Memo_Scraper import ArmyGuidanceScraper
+    from HTTP_Client import HTTPClient
+    from OPM_Memo_Scraper import OPMMemoScraper
+    from Stage_Scheduler import StageScheduler
+
+    client = HTTPClient(metrics=metrics)
+    DOCS_DIR.mkdir(parents=True, exist_ok=True)
+    fmt, html_parser = args.artifact_format, args.html_parser
+    scrapers = {
+        "army": ArmyGuidanceScraper(client=client, parser=html_parser, output_format=fmt),
+        "opm": OPMMemoScraper(client=client, parser=html_parser, output_format=fmt),
+    }
+    scrapers = {
+        source: _listing_scraper(scraper, args.backfill, args.max_pages) for source, scraper in scrapers.items()
+    }
+    scheduler = StageScheduler()
+    scheduler.add("po.scrape", metrics.wrap("po.scrape", lambda: _run_presidential_orders(client, fmt, html_parser)))
+    for source, scraper in scrapers.items():
+        scheduler.add(f"{source}.scrape", metrics.wrap(f"{source}.scrape", scraper.scrape_records))
+    _raise_failures(scheduler.run())
+
+
+def _run_analyze(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    """Analyzes the scraped memo PDFs and writes the memos with their EO references."""
+    from Analysis_Store import AnalysisStore
+    from Document_Registry import DocumentRegistry
+    from HTTP_Client import HTTPClient
+    from Search_Index import SearchIndex
+    from Stage_Scheduler import StageScheduler
+
+    client = HTTPClient(metrics=metrics)
+    registry = DocumentRegistry()
+    store = AnalysisStore()
+    search_index = SearchIndex()
+    fmt = args.artifact_format
+    executive_orders = _read_executive_orders(fmt)
+
+    def analyze(source: str) -> None:
+        memos = analyze_memos(
+            _read_memos(artifact_path(SCRAPED_FILES[source], fmt)),
+            MEMO_BASE_URLS[source],
+            store=store,
+            search_index=search_index,
+            source=source,
+            client=client,
+            metrics=metrics,
+            registry=registry,
+            backend=args.pdf_backend,
+            fast_scan_pages=args.fast_scan,
+            executive_orders=executive_orders,
+            lazy_fetch=args.lazy_fetch,
+            streaming=args.streaming,
+            memory_limit=args.memory_limit * 1024 * 1024,
+        )
+        _write_memos(memos, artifact_path(ANALYZED_FILES[source], fmt))
+
+    scheduler = StageScheduler()
+    for source in MEMO_BASE_URLS:
+        scheduler.add(source, lambda source=source: analyze(source))
+    try:
+        _raise_failures(scheduler.run())
+    finally:
+        store.close()
+        search_index.close()
+
+
+def _run_consolidate(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    fmt = args.artifact_format
+    po_path = artifact_path(PO_FILE, fmt)
+    if not po_path.exists():
+        raise SystemExit(f"❌ {po_path} not found; run the previous stage first")
+    with metrics.stage("consolidate"):
+        executive_orders = _run_consolidation(
+            po=_read_presidential_orders(po_path),
+            army=_read_memos(artifact_path(ANALYZED_FILES["army"], fmt)),
+            opm=_read_memos(artifact_path(ANALYZED_FILES["opm"], fmt)),
+        )
+    with metrics.stage("write_output"):
+        _write_consolidated(executive_orders, args.normalized, fmt)
+
+
+def _run_flatten_command(args: argparse.Namespace, metrics: PipelineMetrics) -> None:
+    import flatten
+
+    input_path = artifact_path(flatten.INPUT_PATH, args.artifact_format)
+    if not input_path.exists():
+        raise SystemExit(f"❌ {input_path} not found; run the previous stage first")
+    with metrics.stage("flatten"):
+        _run_flatten(args.artifact_format)
+
+
+def _metrics_paths(command: str) -> Tuple[Optional[Path], Optional[Path]]:
+    """A full run writes docs/pipeline_metrics.*; a single stage writes pipeline_metrics.<stage>.* beside it."""
+    if command == "all":
+        return None, None
+    return (
+        PipelineMetrics.DEFAULT_JSON_PATH.with_suffix(f".{command}.json"),
+        PipelineMetrics.DEFAULT_PROMETHEUS_PATH.with_suffix(f".{command}.prom"),
+    )
+
+
+COMMANDS = {
+    "all": _run_all,
+    "scrape": _run_scrape,
+    "analyze": _run_analyze,
+    "consolidate": _run_consolidate,
+    "flatten": _run_flatten_command,
+}
+
+
+def _watch(args: argparse.Namespace) -> None:
+    from Analysis_Store import AnalysisStore
+    from DA_Memo_Scraper import ArmyGuidanceScraper
+    from HTTP_Client import HTTPClient
+    from OPM_Memo_Scraper import OPMMemoScraper
+    from Pipeline_Watcher import PipelineWatcher, WatchedSource
+    from Presidential_Order_Scraper import PresidentialOrderScraper
+    from Search_Index import SearchIndex
+
+    intervals = dict(WATCH_INTERVALS)
+    for override in args.poll_interval:
+        name, _, seconds = override.partition("=")
+        if name not in intervals:
+            raise SystemExit(f"Unknown source '{name}' in --poll-interval; choose from {', '.join(intervals)}")
+        intervals[name] = float(seconds)
+
+    fmt, html_parser = args.artifact_format, args.html_parser
+    metrics = PipelineMetrics(profile_dir=PROFILE_DIR if args.profile else None)
+    client = HTTPClient(metrics=metrics)
+    store = AnalysisStore()
+    search_index = SearchIndex()
+    watcher = PipelineWatcher(
+        [
+            WatchedSource(
+                "po", PresidentialOrderScraper(client=client, parser=html_parser, output_format=fmt), intervals["po"]
+            ),
+            WatchedSource(
+                "army",
+                ArmyGuidanceScraper(client=client, parser=html_parser, output_format=fmt),
+                intervals["army"],
+                ARMY_BASE_URL,
+            ),
+            WatchedSource(
+                "opm",
+                OPMMemoScraper(client=client, parser=html_parser, output_format=fmt),
+                intervals["opm"],
+                OPM_BASE_URL,
+            ),
+        ],
+        artifact_path(OUTPUT_FILE, fmt),
+        CHANGE_FEED_FILE,
+        store=store,
+        search_index=search_index,
+        client=client,
+        metrics=metrics,
+        download_workers=PDF_DOWNLOAD_WORKERS,
+        parse_workers=PDF_PARSE_WORKERS,
+        backend=args.pdf_backend,
+        fast_scan_pages=args.fast_scan,
+        lazy_fetch=args.lazy_fetch,
+        streaming=args.streaming,
+        memory_limit=args.memory_limit * 1024 * 1024,
+        normalized=args.normalized,
+    )
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        logging.info("👋 Watch stopped")
+    finally:
+        store.close()
+        search_index.close()
+        if not metrics.empty:
+            metrics.write()
+
+
+def _timed(metrics: PipelineMetrics, name: str):
+    return metrics.stage(name) if metrics and name else nullcontext()
+
+
+def _raise_failures(outcomes) -> None:
+    failed = [name for name, outcome in outcomes.items() if not outcome.ok]
+    if failed:
+        raise SystemExit(f"❌ Stages failed: {', '.join(failed)}")
+
+
+def _read_memos(path: Path) -> List[Memo]:
+    from Pipeline_Records import Memo
+
+    if not path.exists():
+        raise SystemExit(f"❌ {path} not found; run the previous stage first")
+    return [Memo.from_dict(memo) for memo in read_records(path)]
+
+
+def _read_presidential_orders(path: Path) -> PresidentialOrders:
+    from Pipeline_Records import PresidentialOrders
+
+    if artifact_format(path) == DEFAULT_FORMAT:
+        return PresidentialOrders.from_dict(json.loads(path.read_text(encoding="utf-8")))
+    return PresidentialOrders.from_records(read_records(path))
+
+
+def _read_executive_orders(fmt: str = DEFAULT_FORMAT) -> List[PresidentialDocument]:
+    """The scraped EOs whose titles the analyzer matches; numbers alone if the listing is missing."""
+    po_path = artifact_path(PO_FILE, fmt)
+    if not po_path.exists():
+        logging.warning(f"⚠️ {po_path} not found; EO titles will not be matched")
+        return []
+    return _read_presidential_orders(po_path).executive_orders
+
+
+def _listed_executive_orders(po: PresidentialOrders = None) -> List[PresidentialDocument]:
+    """The EOs of a Presidential Orders scrape, or none (with a warning) if it failed."""
+    if po is None:
+        logging.warning("⚠️ Presidential Orders unavailable; EO titles will not be matched")
+        return []
+    return po.executive_orders
+
+
+def _write_memos(memos: List[Memo], path: Path) -> None:
+    write_records(path, (memo.to_dict() for memo in memos))
+    logging.info(f"✅ Output written to {path}")
+
+
+def _write_consolidated(
+    executive_orders: List[ExecutiveOrder], normalized: bool = False, fmt: str = DEFAULT_FORMAT
+) -> None:
+    if normalized:
+        from EO_Reference_Consolidator import EOReferenceConsolidator
+
+        output = EOReferenceConsolidator().normalize(executive_orders)
+        write_json(OUTPUT_FILE, output)
+        logging.info(f"✅ Output written to {OUTPUT_FILE}")
+        return
+    path = artifact_path(OUTPUT_FILE, fmt)
+    write_records(path, (eo.to_dict() for eo in executive_orders))
+    logging.info(f"✅ Output written to {path}")
+
+
+def _run_flatten(fmt: str = DEFAULT_FORMAT) -> None:
+    import flatten
+
+    output_path = artifact_path(flatten.OUTPUT_PATH, fmt)
+    flatten.main(artifact_path(flatten.INPUT_PATH, fmt), output_path)
+    logging.info(f"✅ Flattened output written to {output_path} and {flatten.STORE_PATH}")
+
+
+def _listing_scraper(scraper, backfill: bool, max_pages: int = None):
+    """Wraps ``scraper`` in a resumable crawl over every listing page when backfilling."""
+    if not backfill:
+        return scraper
+    from Backfill_Crawler import BackfillCrawler
+
+    return BackfillCrawler(scraper, workers=BACKFILL_WORKERS, max_pages=max_pages)
+
+
+def _run_presidential_orders(
+    client: HTTPClient = None, fmt: str = DEFAULT_FORMAT, html_parser: str = None
+) -> PresidentialOrders:
+    from Presidential_Order_Scraper import PresidentialOrderScraper
+
+    scraper = PresidentialOrderScraper(client=client, parser=html_parser, output_format=fmt)
+    presidential_orders = scraper.scrape_records()
     logging.info("✅ Fetched Presidential Orders")
+    return presidential_orders
+
+
+def _run_army_memos(
+    store: AnalysisStore,
+    search_index: SearchIndex,
+    client: HTTPClient = None,
+    metrics: PipelineMetrics = None,
+    registry: DocumentRegistry = None,
+    backfill: bool = False,
+    max_pages: int = None,
+    backend: str = DEFAULT_BACKEND,
+    fast_scan_pages: int = FAST_SCAN_PAGES,
+    output_format: str = DEFAULT_FORMAT,
+    lazy_fetch: bool = False,
+    streaming: bool = False,
+    memory_limit: int = STREAMING_MEMORY_LIMIT,
+    html_parser: str = None,
+    executive_orders: Union[List[PresidentialDocument], Future] = None,
+) -> List[Memo]:
+    from DA_Memo_Scraper import ArmyGuidanceScraper
 
-    # Step 2: Army Memos
     try:
-        final_army_json = scrape_and_analyze_memos(
-            ArmyGuidanceScraper(), "https://api.army.mil"
+        army_memos = scrape_and_analyze_memos(
+            _listing_scraper(
+                ArmyGuidanceScraper(client=client, parser=html_parser, output_format=output_format), backfill, max_pages
+            ),
+            ARMY_BASE_URL,
+            store=store,
+            search_index=search_index,
+            source="army",
+            client=client,
+            metrics=metrics,
+            registry=registry,
+            backend=backend,
+            fast_scan_pages=fast_scan_pages,
+            executive_orders=executive_orders,
+            lazy_fetch=lazy_fetch,
+            streaming=streaming,
+            memory_limit=memory_limit,
         )
-        logging.info("✅ Army Memos processed")
     except ValueError as e:
         logging.error(f"❌ Army memo error: {e}")
-        return
+        raise
+    _write_memos(army_memos, artifact_path(ANALYZED_FILES["army"], output_format))
+    logging.info("✅ Army Memos processed")
+    return army_memos
+
+
+def _run_opm_memos(
+    store: AnalysisStore,
+    search_index: SearchIndex,
+    client: HTTPClient = None,
+    metrics: PipelineMetrics = None,
+    registry: DocumentRegistry = None,
+    backfill: bool = False,
+    max_pages: int = None,
+    backend: str = DEFAULT_BACKEND,
+    fast_scan_pages: int = FAST_SCAN_PAGES,
+    output_format: str = DEFAULT_FORMAT,
+    lazy_fetch: bool = False,
+    streaming: bool = False,
+    memory_limit: int = STREAMING_MEMORY_LIMIT,
+    html_parser: str = None,
+    executive_orders: Union[List[PresidentialDocument], Future] = None,
+) -> List[Memo]:
+    from OPM_Memo_Scraper import OPMMemoScraper
 
-    # Step 3: OPM Memos
     try:
-        final_opm_json = scrape_and_analyze_memos(
-            OPMMemoScraper(), "https://www.opm.gov"
+        opm_memos = scrape_and_analyze_memos(
+            _listing_scraper(
+                OPMMemoScraper(client=client, parser=html_parser, output_format=output_format), backfill, max_pages
+            ),
+            OPM_BASE_URL,
+            store=store,
+            search_index=search_index,
+            source="opm",
+            client=client,
+            metrics=metrics,
+            registry=registry,
+            backend=backend,
+            fast_scan_pages=fast_scan_pages,
+            executive_orders=executive_orders,
+            lazy_fetch=lazy_fetch,
+            streaming=streaming,
+            memory_limit=memory_limit,
         )
-        logging.info("✅ OPM Memos processed")
     except ValueError as e:
         logging.error(f"❌ OPM memo error: {e}")
-        return
+        raise
+    _write_memos(opm_memos, artifact_path(ANALYZED_FILES["opm"], output_format))
+    logging.info("✅ OPM Memos processed")
+    return opm_memos
+
+
+def _run_consolidation(po: PresidentialOrders, army: List[Memo], opm: List[Memo]) -> List[ExecutiveOrder]:
+    from EO_Reference_Consolidator import EOReferenceConsolidator
 
-    # Step 4: Consolidation
     consolidator = EOReferenceConsolidator()
-    consolidated_json = consolidator.build_relationships(
-        po_json_str=po_json,
-        army_json_str=final_army_json,
-        opm_json_str=final_opm_json,
+    executive_orders = consolidator.consolidate(
+        presidential_orders=po,
+        army_memos=army,
+        opm_memos=opm,
     )
     logging.info("✅ Consolidation complete")
-
-    # Step 5: Output
-    write_output_to_file(consolidated_json, OUTPUT_FILE)
+    return executive_orders
 
 
 if __name__ == "__main__":
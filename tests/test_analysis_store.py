@@ -0,0 +1,119 @@
+import sqlite3
+
+import pytest
+
+from Analysis_Store import AnalysisStore, StoredAnalysis
+from benchmarks.pdf_builder import build_text_pdf
+from PDF_Analyzer import PDFAnalyzer
+from Pipeline_Metrics import PipelineMetrics
+from Pipeline_Records import Memo, PresidentialDocument
+
+URL = "https://www.opm.gov/memo.pdf"
+TITLE = "Restoring Gold Standard Science Across Agencies"
+NEW_EO = PresidentialDocument(doc_number="EO 14303", pdf_link="", date="2025-05-23", title=TITLE)
+
+
+class Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class Client:
+    def __init__(self, content):
+        self.content = content
+
+    def get(self, url, **kwargs):
+        return Response(self.content)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = AnalysisStore(tmp_path / "analysis.sqlite")
+    yield store
+    store.close()
+
+
+def counters(metrics):
+    return {
+        (name, tuple(sorted(series["labels"].items()))): series["value"]
+        for name, all_series in metrics.to_dict()["counters"].items()
+        for series in all_series
+    }
+
+
+def analyze(store, content, executive_orders=None, fast_scan_pages=0):
+    """Runs one analyzer over ``content`` and returns its references and (parsed, cache outcome) counts."""
+    metrics = PipelineMetrics()
+    analyzer = PDFAnalyzer(
+        client=Client(content),
+        store=store,
+        metrics=metrics,
+        executive_orders=executive_orders,
+        fast_scan_pages=fast_scan_pages,
+    )
+    (result,) = analyzer.analyze_memos([Memo(title="memo", pdf_link=URL)])
+    found = counters(metrics)
+    outcome = next((dict(labels)["result"] for name, labels in found if name == "analysis_cache_total"), None)
+    return sorted(result.eo_references), found.get(("pdf_documents_total", ()), 0), outcome
+
+
+def test_lookup_requires_the_same_content_and_save_replaces(store):
+    store.save(StoredAnalysis(URL, "hash-1", "v1", ["14210"], ["page one", "página dos"]))
+    stored = store.lookup(URL, "hash-1")
+    assert (stored.eo_references, stored.pages) == (["14210"], ["page one", "página dos"])
+    assert stored.text == "page one\npágina dos"
+    assert store.lookup(URL, "hash-2") is None
+
+    store.save(StoredAnalysis(URL, "hash-2", "v2", [], ["new"], text_complete=False))
+    assert store.lookup(URL, "hash-1") is None
+    assert not store.lookup(URL, "hash-2").text_complete
+
+
+def test_cache_from_an_older_schema_is_dropped(tmp_path):
+    path = tmp_path / "analysis.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE analyses (pdf_url TEXT PRIMARY KEY, stale TEXT)")
+    conn.execute("INSERT INTO analyses VALUES ('x', 'y')")
+    conn.commit()
+    conn.close()
+
+    store = AnalysisStore(path)
+    store.save(StoredAnalysis(URL, "hash", "v1", [], [""]))
+    assert store.lookup(URL, "hash") is not None
+    store.close()
+
+
+def test_unchanged_pdf_is_served_from_the_store_without_parsing(store):
+    pdf = build_text_pdf([f"Pursuant to Executive Order 14210 and {TITLE}."])
+    assert analyze(store, pdf) == (["14210"], 1, "miss")
+    assert analyze(store, pdf) == (["14210"], 0, "hit")
+
+
+def test_new_matcher_version_rematches_stored_text_without_parsing(store):
+    pdf = build_text_pdf([f"Pursuant to Executive Order 14210 and {TITLE}."])
+    analyze(store, pdf)
+    assert analyze(store, pdf, executive_orders=[NEW_EO]) == (["14210", "14303"], 0, "rematched")
+    # The re-match is stored under the new version, so the next run is a plain hit.
+    assert analyze(store, pdf, executive_orders=[NEW_EO]) == (["14210", "14303"], 0, "hit")
+
+
+def test_changed_content_is_parsed_again(store):
+    analyze(store, build_text_pdf(["Executive Order 14210"]))
+    assert analyze(store, build_text_pdf(["Executive Order 14151"])) == (["14151"], 1, "miss")
+
+
+def test_partially_read_text_is_parsed_again_when_the_matcher_changes(store):
+    pages = ["Pursuant to Executive Order 14210.", "", TITLE, "", "Signed."]
+    pdf = build_text_pdf(pages)
+    assert analyze(store, pdf, fast_scan_pages=1) == (["14210"], 1, "miss")
+    # Only the first page was stored, so the stored text cannot be trusted to hold the new title.
+    assert analyze(store, pdf, executive_orders=[NEW_EO]) == (["14210", "14303"], 1, "miss")
+
+
+def test_fast_scan_that_read_every_page_is_rematched_from_the_store(store):
+    pdf = build_text_pdf(["Nothing on the first page.", TITLE, "Executive Order 14210", "Signed."])
+    assert analyze(store, pdf, fast_scan_pages=1) == (["14210"], 1, "miss")
+    assert analyze(store, pdf, fast_scan_pages=1, executive_orders=[NEW_EO]) == (["14210", "14303"], 0, "rematched")
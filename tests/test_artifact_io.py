@@ -0,0 +1,91 @@
+import gzip
+import json
+
+import pytest
+
+from Artifact_IO import FORMATS, artifact_format, artifact_path, read_records, write_json, write_records
+
+RECORDS = [
+    {"title": "Memo “one”", "pdf_link": "/a.pdf", "eo_references": ["14210", "14222"]},
+    {"title": "K–12", "pdf_link": None, "eo_references": [], "nested": {"depth": [1, {"x": "é"}]}},
+]
+
+
+def needs_codec(fmt):
+    if fmt == "ndjson.zst":
+        pytest.importorskip("zstandard")
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_records_round_trip_in_every_format(tmp_path, fmt):
+    needs_codec(fmt)
+    path = artifact_path(tmp_path / "memos.json", fmt)
+    assert write_records(path, iter(RECORDS)) == len(RECORDS)
+    assert list(read_records(path)) == RECORDS
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_empty_artifacts_round_trip(tmp_path, fmt):
+    needs_codec(fmt)
+    path = artifact_path(tmp_path / "memos.json", fmt)
+    assert write_records(path, []) == 0
+    assert list(read_records(path)) == []
+
+
+@pytest.mark.parametrize("records", [RECORDS, RECORDS[:1], []])
+def test_json_output_is_identical_to_json_dump(tmp_path, records):
+    path = tmp_path / "memos.json"
+    write_records(path, records)
+    assert path.read_text(encoding="utf-8") == json.dumps(records, indent=2, ensure_ascii=False)
+
+
+def test_ndjson_writes_one_record_per_line(tmp_path):
+    path = tmp_path / "memos.ndjson.gz"
+    write_records(path, RECORDS)
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == RECORDS
+
+
+def test_write_json_keeps_a_document_layout_and_creates_parents(tmp_path):
+    path = tmp_path / "nested" / "dir" / "PO_Docs.json"
+    data = {"executive_orders": RECORDS, "memos": []}
+    write_json(path, data)
+    assert json.loads(path.read_text(encoding="utf-8")) == data
+    assert [p.name for p in path.parent.iterdir()] == ["PO_Docs.json"]
+
+
+def test_failed_write_leaves_the_previous_file_and_no_temp_file(tmp_path):
+    path = tmp_path / "memos.json"
+    write_records(path, RECORDS)
+    before = path.read_text(encoding="utf-8")
+
+    def broken():
+        yield RECORDS[0]
+        raise RuntimeError("scrape failed halfway")
+
+    with pytest.raises(RuntimeError):
+        write_records(path, broken())
+    assert path.read_text(encoding="utf-8") == before
+    assert [p.name for p in tmp_path.iterdir()] == ["memos.json"]
+
+
+@pytest.mark.parametrize(
+    "name, fmt",
+    [
+        ("DA_Memos.json", "json"),
+        ("DA_Memos.ndjson", "ndjson"),
+        ("DA_Memos.ndjson.gz", "ndjson.gz"),
+        ("DA_Memos.ndjson.zst", "ndjson.zst"),
+        ("DA_Memos.txt", "json"),
+    ],
+)
+def test_format_is_taken_from_the_suffix(name, fmt):
+    assert artifact_format(name) == fmt
+
+
+def test_artifact_path_swaps_only_the_format_suffix(tmp_path):
+    assert artifact_path(tmp_path / "DA_Memos.json", "ndjson.gz").name == "DA_Memos.ndjson.gz"
+    assert artifact_path(tmp_path / "DA_Memos.ndjson.gz", "json").name == "DA_Memos.json"
+    assert artifact_path(tmp_path / "DA_Memos.json", None) == tmp_path / "DA_Memos.json"
+    with pytest.raises(ValueError):
+        artifact_path(tmp_path / "DA_Memos.json", "csv")
@@ -0,0 +1,111 @@
+import json
+
+import pytest
+
+from Backfill_Crawler import BackfillCrawler
+from Pipeline_Records import Memo
+
+SEED = "https://www.opm.gov/chcoc/"
+# page -> (memo PDF links on it, pages it links to)
+SITE = {
+    SEED: (["a.pdf", "b.pdf"], [SEED + "?page=2", SEED + "?page=3", "https://www.opm.gov/about/"]),
+    SEED + "?page=2": (["c.pdf", "b.pdf"], [SEED, SEED + "?page=3"]),
+    SEED + "?page=3": (["d.pdf"], [SEED + "?page=4"]),
+    SEED + "?page=4": (["e.pdf"], []),
+    "https://www.opm.gov/about/": (["elsewhere.pdf"], []),
+}
+
+
+class Response:
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+
+class Client:
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.requested = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requested.append(url)
+        if url in self.failing:
+            raise ConnectionError(f"{url} unreachable")
+        return Response(url)
+
+
+class Scraper:
+    url = SEED
+
+    def __init__(self, client):
+        self.client = client
+
+    def parse_listing(self, html, page_url):
+        pdf_links, page_links = SITE[html]
+        return [Memo(title=link, pdf_link=link) for link in pdf_links], page_links
+
+
+@pytest.fixture
+def checkpoint(tmp_path):
+    return tmp_path / "backfill" / "Scraper.json"
+
+
+def crawl(checkpoint, client, **kwargs):
+    return [memo.pdf_link for memo in BackfillCrawler(Scraper(client), checkpoint, **kwargs).crawl()]
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_crawl_follows_listing_pages_only_and_removes_its_checkpoint(checkpoint, workers):
+    client = Client()
+    assert crawl(checkpoint, client, workers=workers) == ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+    assert sorted(client.requested) == sorted(url for url in SITE if url.startswith(SEED))
+    assert not checkpoint.exists()
+
+
+def test_page_budget_stops_the_crawl_and_the_next_run_resumes(checkpoint):
+    first = Client()
+    assert crawl(checkpoint, first, workers=1, max_pages=2) == ["a.pdf", "b.pdf", "c.pdf"]
+    state = json.loads(checkpoint.read_text(encoding="utf-8"))
+    assert sorted(state["pages"]) == [SEED, SEED + "?page=2"]
+
+    second = Client()
+    assert crawl(checkpoint, second, workers=1, max_pages=2) == ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+    assert second.requested == [SEED + "?page=3", SEED + "?page=4"]
+    assert not checkpoint.exists()
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_resumed_run_with_the_same_budget_fetches_new_pages(checkpoint, workers):
+    runs = []
+    while not runs or checkpoint.exists():
+        client = Client()
+        runs.append((crawl(checkpoint, client, workers=workers, max_pages=1), client.requested))
+        assert len(runs) <= 4
+    assert [requested for _, requested in runs] == [
+        [SEED],
+        [SEED + "?page=2"],
+        [SEED + "?page=3"],
+        [SEED + "?page=4"],
+    ]
+    assert runs[-1][0] == ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+
+
+def test_failed_pages_stay_in_the_checkpoint_for_the_next_run(checkpoint):
+    flaky = SEED + "?page=3"
+    assert crawl(checkpoint, Client(failing=[flaky])) == ["a.pdf", "b.pdf", "c.pdf"]
+    assert checkpoint.exists()
+
+    retry = Client()
+    assert crawl(checkpoint, retry) == ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+    assert retry.requested == [flaky, SEED + "?page=4"]
+
+
+@pytest.mark.parametrize("content", ["not json", json.dumps({"seed": "https://other.example/", "pages": {}})])
+def test_unusable_or_foreign_checkpoint_starts_over(checkpoint, content):
+    checkpoint.parent.mkdir(parents=True)
+    checkpoint.write_text(content, encoding="utf-8")
+    client = Client()
+    assert crawl(checkpoint, client) == ["a.pdf", "b.pdf", "c.pdf", "d.pdf", "e.pdf"]
+    assert client.requested[0] == SEED
@@ -0,0 +1,130 @@
+import threading
+
+import pytest
+
+from benchmarks.pdf_builder import build_text_pdf
+from Document_Registry import DocumentRegistry
+from PDF_Analyzer import PDFAnalyzer
+from Pipeline_Metrics import PipelineMetrics
+from Pipeline_Records import Memo
+
+CANONICAL = "https://www.opm.gov/policy/memo%20one.pdf"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.opm.gov/policy/memo%20one.pdf",
+        "HTTPS://WWW.OPM.GOV/policy/memo%20one.pdf",
+        "https://www.opm.gov:443/policy/memo%20one.pdf",
+        "https://www.opm.gov/policy/memo one.pdf",
+        "https://www.opm.gov/policy/memo%20one.pdf#page=2",
+        "https://www.opm.gov/policy/memo%20one.pdf?utm_source=mail&utm_medium=email",
+        "  https://www.opm.gov/policy/memo%20one.pdf\n",
+    ],
+)
+def test_spellings_of_the_same_link_normalize_alike(url):
+    assert DocumentRegistry.normalize_url(url) == CANONICAL
+
+
+def test_query_is_sorted_and_kept_apart_from_tracking_parameters():
+    normalized = DocumentRegistry.normalize_url("http://a.example:8080/x.pdf?b=2&utm_id=1&a=1")
+    assert normalized == "http://a.example:8080/x.pdf?a=1&b=2"
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.opm.gov/policy/Memo%20one.pdf",
+        "http://www.opm.gov/policy/memo%20one.pdf",
+        "https://www.opm.gov:8443/policy/memo%20one.pdf",
+        "https://www.opm.gov/policy/memo%20one.pdf?version=2",
+    ],
+)
+def test_different_documents_stay_distinct(url):
+    assert DocumentRegistry.normalize_url(url) != CANONICAL
+
+
+def test_first_claimant_owns_a_link_and_later_spellings_share_its_future():
+    registry = DocumentRegistry()
+    future, owner = registry.claim_url(CANONICAL)
+    again, again_owner = registry.claim_url("HTTPS://WWW.OPM.GOV:443/policy/memo one.pdf#page=2")
+    assert owner and not again_owner
+    assert again is future
+
+
+def test_content_claims_are_separate_from_link_claims():
+    registry = DocumentRegistry()
+    assert registry.claim_url("abc")[1]
+    future, owner = registry.claim_content("abc")
+    assert owner
+    assert registry.claim_content("abc") == (future, False)
+
+
+def test_concurrent_claims_have_exactly_one_owner():
+    registry = DocumentRegistry()
+    barrier = threading.Barrier(8)
+    owners = []
+
+    def claim():
+        barrier.wait()
+        owners.append(registry.claim_content("same-bytes")[1])
+
+    threads = [threading.Thread(target=claim) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(owners) == [False] * 7 + [True]
+
+
+class Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class Client:
+    def __init__(self, documents):
+        self.documents = documents
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        return Response(self.documents[url])
+
+
+def counter(metrics, name, **labels):
+    return sum(
+        series["value"]
+        for series in metrics.to_dict()["counters"].get(name, [])
+        if all(series["labels"].get(key) == value for key, value in labels.items())
+    )
+
+
+@pytest.mark.parametrize("download_workers", [1, 4])
+def test_analyzers_sharing_a_registry_fetch_each_link_and_parse_each_content_once(download_workers):
+    pdf = build_text_pdf(["Pursuant to Executive Order 14210."])
+    client = Client({"https://a.example/memo.pdf": pdf, "https://b.example/copy.pdf": pdf})
+    registry, metrics = DocumentRegistry(), PipelineMetrics()
+
+    def analyze(base_url, links, source):
+        analyzer = PDFAnalyzer(
+            base_url=base_url,
+            client=client,
+            registry=registry,
+            metrics=metrics,
+            source=source,
+            download_workers=download_workers,
+        )
+        memos = [Memo(title=link, pdf_link=link) for link in links]
+        return [result.eo_references for result in analyzer.analyze_memos(memos)]
+
+    army_links = ["memo.pdf", "memo.pdf#top", "/memo.pdf?utm_source=x"]
+    assert analyze("https://a.example/", army_links, "army") == [["14210"]] * 3
+    assert analyze("https://b.example/", ["copy.pdf", "https://A.example/memo.pdf"], "opm") == [["14210"], ["14210"]]
+    assert sorted(client.requested) == ["https://a.example/memo.pdf", "https://b.example/copy.pdf"]
+    assert counter(metrics, "pdf_documents_total") == 1
+    assert counter(metrics, "documents_deduplicated_total", kind="content") == 1
@@ -0,0 +1,118 @@
+import multiprocessing
+import pickle
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from benchmarks.pdf_builder import build_text_pdf
+from EO_Matcher import EOMatcher, KeywordAutomaton
+from PDF_Analyzer import PDFAnalyzer, _analyze_in_worker, _init_parse_worker
+
+TEXTS = [
+    "Pursuant to Executive Order 14210, agencies shall report.",
+    "See E.O. 14151 and executive order no. 14173 for details.",
+    "This memo implements the DOGE Cost Efficiency Initiative and ends Paper Straws.",
+    "Guidance on K–12 Schooling under Restoring America's Fighting Force.",
+    "Revocation of Executive Order 14003 is addressed in Executive Order No.14236.",
+    "No executive order is cited here, only the word Executive Order without a number.",
+    "İstanbul office: Executive Order 14168 on Defending Women applies.",
+    "",
+]
+
+
+def regex_and_substring(text):
+    """The matching PDFAnalyzer did before the automaton: one regex plus a substring test per phrase."""
+    numeric = {g2 or g3 for _, g2, g3 in PDFAnalyzer.EO_PATTERN.findall(text) if g2 or g3}
+    lowered = text.lower()
+    keywords = {
+        eo_number
+        for eo_number, phrases in PDFAnalyzer.EO_NAME_KEYWORDS.items()
+        if any(phrase.lower() in lowered for phrase in phrases)
+    }
+    return numeric | keywords
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return EOMatcher(PDFAnalyzer.EO_NAME_KEYWORDS, PDFAnalyzer.EO_PATTERN)
+
+
+def ordered(matches):
+    return sorted(matches, key=lambda match: (match.end, match.start, match.kind, match.eo_number))
+
+
+def stream(matcher, chunks):
+    scanner = matcher.stream()
+    matches = [match for chunk in chunks for match in scanner.feed(chunk)]
+    return matches + scanner.finish()
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_matcher_finds_what_the_regex_and_substring_path_found(matcher, text):
+    assert matcher.find_eo_numbers(text) == regex_and_substring(text)
+
+
+def test_matcher_agrees_with_the_old_path_on_random_text(matcher):
+    rng = random.Random(7)
+    words = ["Executive", "Order", "E.O.", "No.", "14210", "DOGE", "Paper", "Straws", "the", "of", "12", "K–12"]
+    words += [phrase for phrases in PDFAnalyzer.EO_NAME_KEYWORDS.values() for phrase in phrases]
+    for _ in range(300):
+        text = " ".join(rng.choice(words) for _ in range(rng.randint(1, 30)))
+        assert matcher.find_eo_numbers(text) == regex_and_substring(text), text
+
+
+def test_match_offsets_index_the_original_text(matcher):
+    text = "İİ Executive Order 14210 and Paper Straws"
+    found = {(match.kind, text[match.start:match.end]) for match in matcher.find_matches(text)}
+    assert found == {("numeric", "Executive Order 14210"), ("keyword", "Paper Straws")}
+
+
+def test_automaton_reports_overlapping_phrases():
+    automaton = KeywordAutomaton()
+    for phrase in ("he", "she", "his", "hers"):
+        automaton.add(phrase, phrase)
+    hits, _ = automaton.scan("ushers")
+    assert sorted(hits) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_stream_matches_whole_text_at_every_split(matcher, text):
+    expected = ordered(matcher.find_matches(text))
+    for split in range(len(text) + 1):
+        assert ordered(stream(matcher, [text[:split], text[split:]])) == expected, split
+
+
+def test_stream_matches_text_fed_one_character_at_a_time(matcher):
+    text = TEXTS[1] + "\n" + TEXTS[2]
+    assert {match.eo_number for match in stream(matcher, list(text))} == matcher.find_eo_numbers(text)
+
+
+def test_stream_waits_for_a_number_split_across_chunks(matcher):
+    scanner = matcher.stream()
+    assert scanner.feed("as ordered by Executive Order 142") == []
+    (match,) = scanner.feed("10 today")
+    assert (match.eo_number, match.start, match.end) == ("14210", 14, 35)
+    assert scanner.finish() == []
+
+
+def test_stream_confirms_a_number_at_the_end_of_the_text_on_finish(matcher):
+    scanner = matcher.stream()
+    assert scanner.feed("see E.O. 14151") == []
+    assert [match.eo_number for match in scanner.finish()] == ["14151"]
+
+
+def test_matcher_keeps_numeric_hits_after_pickling(matcher):
+    text = "See E.O. 14151 and the DOGE Cost Efficiency Initiative."
+    restored = pickle.loads(pickle.dumps(matcher))
+    assert restored.find_eo_numbers(text) == {"14151", "14222", "14210"}
+    assert ordered(stream(restored, [text[:9], text[9:]])) == ordered(matcher.find_matches(text))
+
+
+def test_analyzer_pickled_into_a_spawned_parse_worker_finds_numeric_citations():
+    analyzer = PDFAnalyzer()
+    pdf = build_text_pdf(["Pursuant to Executive Order 14151, programs end."])
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(1, mp_context=context, initializer=_init_parse_worker, initargs=(analyzer,)) as pool:
+        (eo_refs, _), _ = pool.submit(_analyze_in_worker, pdf).result(timeout=60)
+    assert eo_refs == {"14151"}
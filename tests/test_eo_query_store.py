@@ -0,0 +1,92 @@
+import pytest
+
+from EO_Query_Store import EOQueryStore
+
+SHARED = {"title": "Workforce guidance", "pdf_link": "https://www.opm.gov/shared.pdf", "date": "03/04/2025"}
+EO_DATA = [
+    {
+        "eo_number": "14151",
+        "eo_title": "Ending DEI Programs",
+        "eo_link": "https://dod.example/14151.pdf",
+        "opm_docs": [SHARED, {"title": "Follow-up", "pdf_link": "https://www.opm.gov/b.pdf", "date": "2025-04-01"}],
+        "dod_docs": [{"doc_number": "MEMO", "title": "DoD memo", "pdf_link": "https://dod.example/m.pdf"}],
+        "da_docs": [{"title": "Army memo", "pdf_link": "", "date": "May 2, 2025", "from": "Army G-1"}],
+    },
+    {
+        "eo_number": "14210",
+        "eo_title": "Workforce Optimization",
+        "eo_link": "https://dod.example/14210.pdf",
+        "opm_docs": [SHARED],
+        "dod_docs": [],
+        "da_docs": [],
+    },
+    {
+        "eo_number": "14303",
+        "eo_title": "Gold Standard Science",
+        "eo_link": "https://dod.example/14303.pdf",
+        "opm_docs": [],
+        "dod_docs": [
+            {"doc_number": "MEMO", "title": "Science memo", "pdf_link": "https://dod.example/s.pdf"},
+            {"doc_number": "MEMO", "title": "Second memo", "pdf_link": "https://dod.example/t.pdf"},
+        ],
+        "da_docs": [],
+    },
+]
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EOQueryStore(tmp_path / "eo_docs.sqlite")
+    store.rebuild(EO_DATA)
+    yield store
+    store.close()
+
+
+def counts(rows):
+    return [(row["eo_number"], row["opm"], row["dod"], row["da"], row["total"]) for row in rows]
+
+
+def test_eo_counts_by_source(store):
+    assert counts(store.eo_counts()) == [
+        ("14151", 2, 1, 1, 4),
+        ("14303", 0, 2, 0, 2),
+        ("14210", 1, 0, 0, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("opm", [("14151", 2, 0, 0, 2), ("14210", 1, 0, 0, 1), ("14303", 0, 0, 0, 0)]),
+        ("dod", [("14303", 0, 2, 0, 2), ("14151", 0, 1, 0, 1), ("14210", 0, 0, 0, 0)]),
+        ("da", [("14151", 0, 0, 1, 1), ("14210", 0, 0, 0, 0), ("14303", 0, 0, 0, 0)]),
+    ],
+)
+def test_eo_counts_with_a_source_count_only_that_source_and_keep_every_eo(store, source, expected):
+    assert counts(store.eo_counts(source)) == expected
+
+
+def test_documents_cited_by_several_eos_are_counted_once_per_source(store):
+    assert store.source_counts() == {"da": 1, "dod": 3, "opm": 2}
+    assert store.agency_counts() == {"DoD": 3, "OPM": 2, "Army G-1": 1}
+    assert store.agency_counts("da") == {"Army G-1": 1}
+
+
+def test_document_filters_and_pagination(store):
+    assert [row["doc_title"] for row in store.documents(eo_number="14151")] == [
+        "Army memo",
+        "Follow-up",
+        "Workforce guidance",
+        "DoD memo",
+    ]
+    same_day = store.documents(source="opm", date_from="2025-03-04", date_to="2025-03-04")
+    assert [row["eo_number"] for row in same_day] == ["14151", "14210"]
+    assert store.count_links(source="dod") == 3
+    assert [row["doc_title"] for row in store.documents(source="dod", limit=1, offset=1)] == ["Science memo"]
+
+
+def test_rebuild_replaces_the_store_under_an_open_reader(store):
+    assert store.eo_numbers() == ["14151", "14210", "14303"]
+    store.rebuild(EO_DATA[1:])
+    assert store.eo_numbers() == ["14210", "14303"]
+    assert store.date_range() == ("2025-03-04", "2025-03-04")
@@ -0,0 +1,74 @@
+import random
+import re
+
+import pytest
+
+from EO_Reference_Consolidator import EOReferenceConsolidator
+from Pipeline_Records import PresidentialDocument, PresidentialOrders
+
+EO_NUMBERS = {"14151", "14210", "14303", "13526-A", "14210.1", "14222a"}
+
+
+def regex_path(eo_numbers, doc_number, title):
+    """The per-EO regex scan the token index replaced."""
+    return {
+        eo
+        for eo in eo_numbers
+        if re.search(rf"\b{re.escape(eo)}\b", doc_number) or re.search(rf"\b{re.escape(eo)}\b", title)
+    }
+
+
+def token_path(eo_numbers, doc_number, title):
+    consolidator = EOReferenceConsolidator()
+    token_index, fallback_patterns = consolidator._build_eo_index(eo_numbers)
+    return consolidator._find_eo_numbers(doc_number, title, token_index, fallback_patterns)
+
+
+@pytest.mark.parametrize(
+    "doc_number, title",
+    [
+        ("MEMO", "Implementing Executive Order 14210"),
+        ("MEMO", "Implementing EO14210 and EO 14151."),
+        ("MEMO", "Order 142100 and 014210 are different numbers"),
+        ("MEMO", "Amended by 14210.1, see also 14210-1"),
+        ("MEMO", "Sections 13526-A and 13526-AB"),
+        ("MEMO", "Guidance for 14222a, not 14222ab or 14222"),
+        ("14303", "(14151)/14210_draft"),
+        ("MEMO", "Unicode neighbours: é14210 14210é ١٤٢١٠"),
+        ("", ""),
+    ],
+)
+def test_token_index_finds_what_the_regex_path_found(doc_number, title):
+    assert token_path(EO_NUMBERS, doc_number, title) == regex_path(EO_NUMBERS, doc_number, title)
+
+
+def test_token_index_agrees_with_the_regex_path_on_random_text():
+    rng = random.Random(7)
+    pieces = sorted(EO_NUMBERS) + ["EO", "14", "210", "-", ".", "_", "a", "A", " ", "/", "é", "1"]
+    for _ in range(2000):
+        doc_number = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 4)))
+        title = "".join(rng.choice(pieces) for _ in range(rng.randint(0, 12)))
+        assert token_path(EO_NUMBERS, doc_number, title) == regex_path(EO_NUMBERS, doc_number, title)
+
+
+def test_word_numbers_use_the_index_and_the_rest_keep_a_pattern():
+    token_index, fallback_patterns = EOReferenceConsolidator()._build_eo_index(EO_NUMBERS)
+    assert token_index == {"14151", "14210", "14303", "14222a"}
+    assert sorted(fallback_patterns) == ["13526-A", "14210.1"]
+
+
+def test_dod_memos_are_mapped_to_every_eo_they_cite():
+    eos = [PresidentialDocument(f"EO {number}", "", "", f"Order {number}") for number in ("14151", "14210", "14303")]
+    memos = [
+        PresidentialDocument("MEMO", "", "", "Implementing EO 14151 and EO 14210"),
+        PresidentialDocument("14303", "", "", "Guidance"),
+        PresidentialDocument("MEMO", "", "", "Unrelated 142100"),
+    ]
+    executive_orders = EOReferenceConsolidator().consolidate(
+        PresidentialOrders(executive_orders=eos, memos=memos), [], []
+    )
+    assert {eo.eo_number: [memo.title for memo in eo.dod_docs] for eo in executive_orders} == {
+        "14151": ["Implementing EO 14151 and EO 14210"],
+        "14210": ["Implementing EO 14151 and EO 14210"],
+        "14303": ["Guidance"],
+    }
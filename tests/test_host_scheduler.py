@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+import Host_Scheduler
+from Host_Scheduler import HostLimit, HostScheduler
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(Host_Scheduler.time, "monotonic", clock)
+    return clock
+
+
+def response(status=200, latency=0.1, **headers):
+    result = requests.Response()
+    result.status_code = status
+    result.headers.update(headers)
+    result.elapsed = timedelta(seconds=latency)
+    return result
+
+
+def test_healthy_responses_grow_the_limit_additively_up_to_the_maximum(clock):
+    limit = HostLimit("example.org", initial=2, minimum=1, maximum=4)
+    limit.on_response(0.1)
+    assert limit.limit == pytest.approx(2.5)
+    for _ in range(50):
+        limit.on_response(0.1)
+    assert limit.limit == 4
+
+
+def test_throttle_halves_the_limit_once_per_cooldown(clock):
+    limit = HostLimit("example.org", initial=8, minimum=1, maximum=16)
+    limit.on_throttle(None)
+    limit.on_throttle(None)
+    assert limit.limit == 4
+    clock.now += 1.0
+    limit.on_throttle(None)
+    assert limit.limit == 2
+    clock.now += 1.0
+    limit.on_throttle(None)
+    clock.now += 1.0
+    limit.on_throttle(None)
+    assert limit.limit == 1
+
+
+def test_rising_latency_decreases_the_limit_and_rebases(clock):
+    limit = HostLimit("example.org", initial=8, minimum=1, maximum=16)
+    limit.on_response(0.1)
+    while limit.limit > 8:
+        limit.on_response(2.0)
+    assert limit.limit == pytest.approx(4.5, abs=0.5)
+    assert limit.baseline == limit.latency
+
+
+def test_jitter_within_the_slack_is_not_treated_as_rising_latency(clock):
+    limit = HostLimit("example.org", initial=4, minimum=1, maximum=16)
+    limit.on_response(0.01)
+    for _ in range(10):
+        limit.on_response(0.05)
+    assert limit.limit > 4
+
+
+def test_retry_after_pauses_the_host(clock):
+    limit = HostLimit("example.org", initial=4, minimum=1, maximum=16)
+    limit.on_throttle(30)
+    assert limit.paused_until == clock.now + 30
+
+
+def test_observe_reports_only_throttle_statuses_as_retryable():
+    scheduler = HostScheduler(initial_limit=4)
+    limit = scheduler.host_limit("https://Example.org/a")
+    assert scheduler.host_limit("https://example.org/b") is limit
+    assert scheduler.observe(limit, response(429, **{"Retry-After": "0"})) is True
+    assert limit.limit == 2
+    assert scheduler.observe(limit, response(200)) is False
+    assert scheduler.observe(limit, None) is False
+
+
+def test_hosts_back_off_independently():
+    scheduler = HostScheduler(initial_limit=4)
+    slow = scheduler.host_limit("https://slow.example/")
+    scheduler.observe(slow, response(503))
+    scheduler.observe(scheduler.host_limit("https://fast.example/"), response(200))
+    assert scheduler.limits() == {"slow.example": 2, "fast.example": pytest.approx(4.25)}
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, HostScheduler.DEFAULT_BACKOFF),
+        ("7", 7.0),
+        ("2.5", 2.5),
+        ("-3", 0.0),
+        ("100000", HostScheduler.MAX_RETRY_AFTER),
+        ("soon", HostScheduler.DEFAULT_BACKOFF),
+    ],
+)
+def test_retry_after_seconds(value, expected):
+    headers = {"Retry-After": value} if value is not None else {}
+    assert HostScheduler()._retry_after(response(429, **headers)) == expected
+
+
+def test_retry_after_http_date():
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    delay = HostScheduler()._retry_after(response(503, **{"Retry-After": format_datetime(when, usegmt=True)}))
+    assert 28 <= delay <= 30
+
+
+def test_retry_after_date_in_the_past_does_not_wait():
+    when = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert HostScheduler()._retry_after(response(503, **{"Retry-After": format_datetime(when, usegmt=True)})) == 0.0
@@ -0,0 +1,150 @@
+import io
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from HTTP_Client import HTTPClient
+from Pipeline_Metrics import PipelineMetrics
+
+
+class Site:
+    """Resources served by the stand-in server: path -> (status, body, headers)."""
+
+    def __init__(self):
+        self.resources = {}
+        self.requests = []
+
+
+def handler(site):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            site.requests.append((self.path, dict(self.headers)))
+            status, body, headers = site.resources[self.path]
+            etag = headers.get("ETag")
+            if status == 200 and etag and self.headers.get("If-None-Match") == etag:
+                status, body = 304, b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def site():
+    site = Site()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler(site))
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    site.url = f"http://127.0.0.1:{server.server_port}"
+    yield site
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(tmp_path):
+    return HTTPClient(cache_dir=tmp_path / "http")
+
+
+def sent(site, index):
+    return site.requests[index][1]
+
+
+def test_304_is_served_from_the_cached_body(site, client):
+    site.resources["/memo.pdf"] = (200, b"%PDF v1", {"ETag": '"v1"', "Content-Type": "application/pdf"})
+    first = client.get(site.url + "/memo.pdf")
+    second = client.get(site.url + "/memo.pdf")
+
+    assert (first.status_code, first.content, first.from_cache) == (200, b"%PDF v1", False)
+    assert (second.status_code, second.content, second.from_cache) == (200, b"%PDF v1", True)
+    assert second.headers["Content-Type"] == "application/pdf"
+    assert "If-None-Match" not in sent(site, 0)
+    assert sent(site, 1)["If-None-Match"] == '"v1"'
+
+
+def test_last_modified_is_sent_back_as_if_modified_since(site, client):
+    stamp = "Tue, 01 Apr 2025 00:00:00 GMT"
+    site.resources["/list"] = (200, b"<html>", {"Last-Modified": stamp})
+    client.get(site.url + "/list")
+    client.get(site.url + "/list")
+    assert sent(site, 1)["If-Modified-Since"] == stamp
+
+
+def test_changed_resource_replaces_the_cache(site, client):
+    site.resources["/memo.pdf"] = (200, b"v1", {"ETag": '"v1"'})
+    client.get(site.url + "/memo.pdf")
+    site.resources["/memo.pdf"] = (200, b"v2", {"ETag": '"v2"'})
+    assert client.get(site.url + "/memo.pdf").content == b"v2"
+    assert client.get(site.url + "/memo.pdf").from_cache
+    assert sent(site, 2)["If-None-Match"] == '"v2"'
+
+
+@pytest.mark.parametrize(
+    "status, headers",
+    [
+        (404, {"ETag": '"missing"'}),
+        (500, {"ETag": '"error"'}),
+        (200, {}),
+    ],
+)
+def test_only_200_responses_with_a_validator_are_cached(site, client, status, headers):
+    site.resources["/page"] = (status, b"body", headers)
+    client.get(site.url + "/page")
+    client.get(site.url + "/page")
+    assert "If-None-Match" not in sent(site, 1)
+    assert list(client.cache_dir.glob("*")) == []
+
+
+def test_missing_cached_body_is_fetched_again_without_validators(site, client):
+    site.resources["/memo.pdf"] = (200, b"v1", {"ETag": '"v1"'})
+    client.get(site.url + "/memo.pdf")
+    for body in client.cache_dir.glob("*.body"):
+        body.unlink()
+
+    response = client.get(site.url + "/memo.pdf")
+    assert (response.content, response.from_cache) == (b"v1", False)
+    assert "If-None-Match" in sent(site, 1)
+    assert "If-None-Match" not in sent(site, 2)
+
+
+def test_download_streams_and_revalidates_through_the_same_cache(site, client):
+    site.resources["/big.pdf"] = (200, b"x" * 200_000, {"ETag": '"big"'})
+    first, second = io.BytesIO(), io.BytesIO()
+    assert not client.download(site.url + "/big.pdf", first).from_cache
+    assert client.download(site.url + "/big.pdf", second).from_cache
+    assert first.getvalue() == second.getvalue() == b"x" * 200_000
+    assert client.get(site.url + "/big.pdf").from_cache
+
+
+def test_download_writes_no_body_for_an_error(site, client):
+    site.resources["/gone.pdf"] = (404, b"not here", {"ETag": '"gone"'})
+    sink = io.BytesIO()
+    assert client.download(site.url + "/gone.pdf", sink).status_code == 404
+    assert sink.getvalue() == b""
+
+
+def test_cache_can_be_disabled(site, tmp_path):
+    client = HTTPClient(cache_dir=tmp_path / "http", use_cache=False)
+    site.resources["/memo.pdf"] = (200, b"v1", {"ETag": '"v1"'})
+    client.get(site.url + "/memo.pdf")
+    client.get(site.url + "/memo.pdf")
+    assert "If-None-Match" not in sent(site, 1)
+    assert not (tmp_path / "http").exists()
+
+
+def test_requests_are_recorded_with_their_cache_outcome(site, tmp_path):
+    metrics = PipelineMetrics()
+    client = HTTPClient(cache_dir=tmp_path / "http", metrics=metrics)
+    site.resources["/memo.pdf"] = (200, b"v1", {"ETag": '"v1"'})
+    client.get(site.url + "/memo.pdf")
+    client.get(site.url + "/memo.pdf")
+    requests = metrics.to_dict()["counters"]["http_requests_total"]
+    assert sorted((series["labels"]["cache"], series["value"]) for series in requests) == [("hit", 1), ("miss", 1)]
@@ -0,0 +1,70 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import main
+from Pipeline_Metrics import PipelineMetrics
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def metrics_files(workdir):
+    return sorted(path.name for path in workdir.glob("docs/pipeline_metrics*"))
+
+
+@pytest.mark.parametrize("command", ["consolidate", "flatten"])
+def test_stage_that_stops_before_running_writes_no_metrics(workdir, command):
+    with pytest.raises(SystemExit):
+        main.main([command])
+    assert metrics_files(workdir) == []
+
+
+def test_single_stage_writes_its_own_metrics_next_to_the_full_runs(workdir):
+    docs = workdir / "docs"
+    docs.mkdir()
+    (docs / "PO_Docs.json").write_text("{}", encoding="utf-8")
+    for path in main.ANALYZED_FILES.values():
+        path.write_text("[]", encoding="utf-8")
+    (docs / "pipeline_metrics.json").write_text('{"full": "run"}', encoding="utf-8")
+
+    main.main(["consolidate"])
+
+    assert metrics_files(workdir) == [
+        "pipeline_metrics.consolidate.json",
+        "pipeline_metrics.consolidate.prom",
+        "pipeline_metrics.json",
+    ]
+    assert json.loads((docs / "pipeline_metrics.json").read_text(encoding="utf-8")) == {"full": "run"}
+    stages = json.loads((docs / "pipeline_metrics.consolidate.json").read_text(encoding="utf-8"))["stages"]
+    assert sorted(stages) == ["consolidate", "write_output"]
+
+
+def test_consolidate_and_flatten_do_not_import_the_scraping_stack(workdir):
+    script = (
+        "import sys, main\n"
+        "try:\n"
+        "    main.main(['flatten'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted({'bs4', 'requests', 'PyPDF2'} & set(sys.modules)))\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    result = subprocess.run([sys.executable, "-c", script], cwd=workdir, env=env, capture_output=True, text=True)
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_metrics_are_empty_until_something_is_recorded():
+    metrics = PipelineMetrics()
+    assert metrics.empty
+    metrics.increment("pdf_documents_total")
+    assert not metrics.empty
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+import flatten
+import main
+from EO_Query_Store import EOQueryStore
+from EO_Reference_Consolidator import EOReferenceConsolidator, document_id, iter_eo_links, load_consolidated
+from Pipeline_Records import Memo, PresidentialDocument, PresidentialOrders
+
+EOS = [
+    PresidentialDocument("EO 14151", "https://dod.example/14151.pdf", "2025-01-20", "Ending DEI Programs"),
+    PresidentialDocument("EO 14210", "https://dod.example/14210.pdf", "2025-02-11", "Workforce Optimization"),
+]
+
+
+def opm_memo(title, link, *references):
+    return Memo(title=title, pdf_link=link, date="2025-03-04", eo_references=list(references))
+
+
+def consolidate(opm_memos, dod_memos=()):
+    return EOReferenceConsolidator().consolidate(
+        PresidentialOrders(executive_orders=EOS, memos=list(dod_memos)), [], opm_memos
+    )
+
+
+def link_set(eo_data):
+    return sorted(
+        (eo["eo_number"], source, doc.get("pdf_link"), doc.get("title"))
+        for eo, docs in iter_eo_links(eo_data)
+        for source, doc in docs
+    )
+
+
+@pytest.fixture
+def executive_orders():
+    return consolidate(
+        [
+            opm_memo("Shared guidance", "https://www.opm.gov/shared.pdf", "14151", "14210"),
+            opm_memo("Only one", "https://www.opm.gov/one.pdf", "14210"),
+            opm_memo("No link", "", "14151"),
+        ],
+        [PresidentialDocument("MEMO", "https://dod.example/m.pdf", "2025-03-01", "Implements EO 14151 and 14210")],
+    )
+
+
+def test_documents_cited_by_several_eos_are_stored_once(executive_orders):
+    normalized = EOReferenceConsolidator().normalize(executive_orders)
+
+    assert normalized["format"] == "normalized"
+    assert len(normalized["documents"]) == 4
+    by_eo = {eo["eo_number"]: eo for eo in normalized["executive_orders"]}
+    (shared,) = set(by_eo["14151"]["opm_docs"]) & set(by_eo["14210"]["opm_docs"])
+    assert normalized["documents"][shared] == {
+        "source": "opm",
+        **opm_memo("Shared guidance", "https://www.opm.gov/shared.pdf").to_dict(include_references=False),
+    }
+    assert by_eo["14151"]["dod_docs"] == by_eo["14210"]["dod_docs"]
+    assert all(doc_id.startswith(doc["source"] + "-") for doc_id, doc in normalized["documents"].items())
+
+
+def test_normalized_and_nested_outputs_hold_the_same_links(executive_orders):
+    nested = [eo.to_dict() for eo in executive_orders]
+    normalized = EOReferenceConsolidator().normalize(executive_orders)
+    assert link_set(normalized) == link_set(nested)
+    assert flatten.flatten_eo_docs(normalized) == flatten.flatten_eo_docs(nested)
+
+
+def test_ids_are_stable_across_runs_and_spellings_of_a_link():
+    first = consolidate([opm_memo("Memo", "https://www.opm.gov/memo.pdf", "14151")])
+    second = consolidate([opm_memo("Memo", "HTTPS://WWW.OPM.GOV:443/memo.pdf#page=2", "14151")])
+    ids = [EOReferenceConsolidator().normalize(eos)["executive_orders"][0]["opm_docs"] for eos in (first, second)]
+    assert ids[0] == ids[1] == [document_id("opm", {"pdf_link": "https://www.opm.gov/memo.pdf"})]
+
+
+def test_distinct_records_sharing_a_link_are_both_kept():
+    normalized = EOReferenceConsolidator().normalize(
+        consolidate(
+            [
+                opm_memo("Cover letter", "https://www.opm.gov/packet.pdf", "14151"),
+                opm_memo("Attachment", "https://www.opm.gov/packet.pdf#page=4", "14151"),
+            ]
+        )
+    )
+    assert sorted(doc["title"] for doc in normalized["documents"].values()) == ["Attachment", "Cover letter"]
+    assert len(normalized["executive_orders"][0]["opm_docs"]) == 2
+
+
+def test_query_store_reads_the_normalized_output_like_the_nested_one(tmp_path, executive_orders):
+    rows = {}
+    for name, eo_data in (
+        ("nested", [eo.to_dict() for eo in executive_orders]),
+        ("normalized", EOReferenceConsolidator().normalize(executive_orders)),
+    ):
+        store = EOQueryStore(tmp_path / f"{name}.sqlite")
+        store.rebuild(eo_data)
+        rows[name] = (store.documents(), store.eo_counts(), store.source_counts())
+        store.close()
+    assert rows["normalized"] == rows["nested"]
+
+
+def test_main_writes_normalized_output_as_json(tmp_path, monkeypatch, executive_orders):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs").mkdir()
+    main._write_consolidated(executive_orders, normalized=True)
+
+    written = load_consolidated(main.OUTPUT_FILE)
+    assert written == json.loads(json.dumps(EOReferenceConsolidator().normalize(executive_orders)))
+    assert link_set(written) == link_set([eo.to_dict() for eo in executive_orders])
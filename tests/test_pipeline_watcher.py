@@ -0,0 +1,162 @@
+import json
+
+import pytest
+
+from benchmarks.pdf_builder import build_text_pdf
+from Pipeline_Records import Memo, PresidentialDocument, PresidentialOrders
+from Pipeline_Watcher import PipelineWatcher, WatchedSource
+
+OPM = "https://www.opm.gov"
+TITLE = "Restoring Gold Standard Science Across Agencies"
+EO_14151 = PresidentialDocument("EO 14151", "https://dod.example/14151.pdf", "2025-01-20", "Ending DEI Programs")
+EO_14303 = PresidentialDocument("EO 14303", "https://dod.example/14303.pdf", "2025-05-23", TITLE)
+
+
+class Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class Client:
+    def __init__(self, documents):
+        self.documents = documents
+        self.failing = set()
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        if url in self.failing:
+            raise ConnectionError(f"{url} unreachable")
+        return Response(self.documents[url])
+
+
+class Scraper:
+    """Returns whatever ``records`` holds, as a fresh copy per scrape like a real scrape would."""
+
+    def __init__(self, records):
+        self.records = records
+
+    def scrape_records(self):
+        if isinstance(self.records, Exception):
+            raise self.records
+        if isinstance(self.records, PresidentialOrders):
+            return PresidentialOrders.from_dict(self.records.to_dict())
+        return [Memo.from_dict(memo.to_dict()) for memo in self.records]
+
+
+def memo(name):
+    return Memo(title=f"Memo {name}", pdf_link=f"{OPM}/{name}.pdf")
+
+
+@pytest.fixture
+def client():
+    return Client(
+        {
+            f"{OPM}/a.pdf": build_text_pdf(["Implements Executive Order 14151."]),
+            f"{OPM}/b.pdf": build_text_pdf([f"Guidance on {TITLE}."]),
+            f"{OPM}/c.pdf": build_text_pdf(["Also under Executive Order 14151."]),
+        }
+    )
+
+
+class Watch:
+    """A watcher over one DoD listing and one OPM listing, with the change feed it wrote."""
+
+    def __init__(self, tmp_path, client, executive_orders, memos):
+        self.po = WatchedSource("po", Scraper(PresidentialOrders(executive_orders=executive_orders)), 60)
+        self.opm = WatchedSource("opm", Scraper(memos), 60, base_url=OPM)
+        self.feed_path = tmp_path / "feed.ndjson"
+        self.output_path = tmp_path / "consolidated.json"
+        self.watcher = PipelineWatcher([self.po, self.opm], self.output_path, self.feed_path, client=client)
+
+    def poll(self, *sources):
+        return [self.watcher.poll(source) for source in sources or (self.po, self.opm)]
+
+    def feed(self):
+        if not self.feed_path.exists():
+            return []
+        lines = self.feed_path.read_text(encoding="utf-8").splitlines()
+        return [(entry["change"], entry["eo_number"], entry["doc_link"]) for entry in map(json.loads, lines)]
+
+
+def test_first_complete_poll_announces_every_link(tmp_path, client):
+    watch = Watch(tmp_path, client, [EO_14151, EO_14303], [memo("a"), memo("b")])
+    assert watch.poll(watch.po) == [True]
+    assert watch.feed() == [] and not watch.output_path.exists()
+
+    assert watch.poll(watch.opm) == [True]
+    assert watch.feed() == [("added", "14151", f"{OPM}/a.pdf"), ("added", "14303", f"{OPM}/b.pdf")]
+    output = json.loads(watch.output_path.read_text(encoding="utf-8"))
+    assert {eo["eo_number"]: [doc["pdf_link"] for doc in eo["opm_docs"]] for eo in output} == {
+        "14151": [f"{OPM}/a.pdf"],
+        "14303": [f"{OPM}/b.pdf"],
+    }
+
+
+def test_unchanged_poll_publishes_nothing_and_fetches_nothing(tmp_path, client):
+    watch = Watch(tmp_path, client, [EO_14151], [memo("a")])
+    watch.poll()
+    client.requested.clear()
+
+    assert watch.poll() == [False, False]
+    assert client.requested == []
+    assert len(watch.feed()) == 1
+
+
+def test_only_new_memos_are_analyzed_and_removed_links_are_announced(tmp_path, client):
+    watch = Watch(tmp_path, client, [EO_14151], [memo("a")])
+    watch.poll()
+    client.requested.clear()
+
+    watch.opm.scraper.records = [memo("c")]
+    assert watch.poll(watch.opm) == [True]
+    assert client.requested == [f"{OPM}/c.pdf"]
+    assert watch.feed()[1:] == [("added", "14151", f"{OPM}/c.pdf"), ("removed", "14151", f"{OPM}/a.pdf")]
+
+
+def test_restart_uses_the_existing_output_as_the_baseline(tmp_path, client):
+    first = Watch(tmp_path, client, [EO_14151], [memo("a")])
+    first.poll()
+    assert first.feed() == [("added", "14151", f"{OPM}/a.pdf")]
+
+    restarted = Watch(tmp_path, client, [EO_14151], [memo("a"), memo("c")])
+    restarted.poll()
+    assert restarted.feed()[1:] == [("added", "14151", f"{OPM}/c.pdf")]
+
+
+def test_new_eo_titles_match_the_known_memos_again(tmp_path, client):
+    watch = Watch(tmp_path, client, [EO_14151], [memo("a"), memo("b")])
+    watch.poll()
+
+    watch.po.scraper.records = PresidentialOrders(executive_orders=[EO_14151, EO_14303])
+    assert watch.poll(watch.po) == [True]
+    assert watch.feed()[1:] == [("added", "14303", f"{OPM}/b.pdf")]
+
+
+def test_failed_pdf_is_retried_on_the_next_poll(tmp_path, client):
+    client.failing.add(f"{OPM}/a.pdf")
+    watch = Watch(tmp_path, client, [EO_14151], [memo("a"), memo("c")])
+    watch.poll()
+    assert watch.feed() == [("added", "14151", f"{OPM}/c.pdf")]
+
+    client.failing.clear()
+    client.requested.clear()
+    assert watch.poll(watch.opm) == [True]
+    assert client.requested == [f"{OPM}/a.pdf"]
+    assert watch.feed()[1:] == [("added", "14151", f"{OPM}/a.pdf")]
+
+
+def test_failed_scrape_keeps_the_previous_state(tmp_path, client):
+    watch = Watch(tmp_path, client, [EO_14151], [memo("a")])
+    watch.poll()
+    output = watch.output_path.read_text(encoding="utf-8")
+
+    watch.opm.scraper.records = ConnectionError("opm.gov unreachable")
+    assert watch.poll(watch.opm) == [False]
+    watch.opm.scraper.records = []
+    assert watch.poll(watch.opm) == [False]
+    assert [memo.pdf_link for memo in watch.watcher.memos["opm"]] == [f"{OPM}/a.pdf"]
+    assert watch.output_path.read_text(encoding="utf-8") == output
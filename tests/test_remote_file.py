@@ -0,0 +1,150 @@
+import io
+import random
+import re
+
+import pytest
+import requests
+
+from Remote_File import RemoteFile
+
+CONTENT = bytes(random.Random(3).getrandbits(8) for _ in range(1000))
+
+
+class RangeServer:
+    """Answers GETs like a static file server: 206 for a satisfiable Range, honouring If-Range."""
+
+    def __init__(self, content=CONTENT, etag='"v1"', last_modified=None, ranges=True):
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.ranges = ranges
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        headers = headers or {}
+        self.requests.append(headers)
+        response = requests.Response()
+        response.url = url
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.last_modified:
+            response.headers["Last-Modified"] = self.last_modified
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", headers.get("Range", ""))
+        if_range = headers.get("If-Range")
+        current = if_range is None or if_range in (self.etag, self.last_modified)
+        if self.ranges and match and current:
+            start, end = int(match.group(1)), min(int(match.group(2)), len(self.content) - 1)
+            response.status_code = 206
+            response.headers["Content-Range"] = f"bytes {start}-{end}/{len(self.content)}"
+            response._content = self.content[start : end + 1]
+        else:
+            response.status_code = 200
+            response._content = self.content
+        return response
+
+    def ranges_requested(self):
+        return [headers["Range"] for headers in self.requests]
+
+
+def test_opening_fetches_only_the_first_block():
+    server = RangeServer()
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    assert remote.ranged and remote.size == len(CONTENT)
+    assert server.ranges_requested() == ["bytes=0-99"]
+    assert remote.bytes_fetched == 100
+
+
+def test_reads_return_the_requested_bytes_after_any_seek():
+    remote = RemoteFile(RangeServer(), "https://example.org/a.pdf", block_size=64)
+    rng = random.Random(5)
+    for _ in range(200):
+        start = rng.randrange(len(CONTENT) + 10)
+        size = rng.randrange(300)
+        remote.seek(start)
+        assert remote.read(size) == CONTENT[start : start + size]
+    remote.seek(-10, io.SEEK_END)
+    assert remote.read() == CONTENT[-10:]
+
+
+def test_adjacent_missing_blocks_are_fetched_in_one_request():
+    server = RangeServer()
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    remote.seek(450)
+    remote.read(10)
+    remote.seek(150)
+    remote.read(600)
+    assert server.ranges_requested() == ["bytes=0-99", "bytes=400-499", "bytes=100-399", "bytes=500-799"]
+    remote.seek(0)
+    assert remote.read(800) == CONTENT[:800]
+    assert len(server.requests) == 4
+
+
+def test_last_block_request_stops_at_the_end_of_the_file():
+    server = RangeServer()
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=300)
+    remote.seek(950)
+    assert remote.read() == CONTENT[950:]
+    assert server.ranges_requested()[-1] == "bytes=900-999"
+
+
+@pytest.mark.parametrize(
+    "fetched, first, last, runs",
+    [
+        (set(), 0, 3, [(0, 3)]),
+        ({0, 1, 2, 3}, 0, 3, []),
+        ({1, 2}, 0, 3, [(0, 0), (3, 3)]),
+        ({0, 3}, 0, 3, [(1, 2)]),
+        ({0, 2, 4}, 0, 5, [(1, 1), (3, 3), (5, 5)]),
+        ({5}, 2, 2, [(2, 2)]),
+        ({2}, 2, 2, []),
+    ],
+)
+def test_missing_runs(fetched, first, last, runs):
+    remote = RemoteFile(RangeServer(content=b"x" * 1000), "https://example.org/a.pdf", block_size=100)
+    remote._blocks = {index: b"x" * 100 for index in fetched}
+    assert list(remote._missing_runs(first, last)) == runs
+
+
+def test_block_requests_carry_a_strong_etag_as_if_range():
+    server = RangeServer(etag='"v1"', last_modified="Tue, 01 Apr 2025 00:00:00 GMT")
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    remote.seek(500)
+    remote.read(1)
+    assert "If-Range" not in server.requests[0]
+    assert server.requests[1]["If-Range"] == '"v1"'
+    assert remote.validator == '"v1"'
+
+
+def test_weak_etag_falls_back_to_last_modified():
+    server = RangeServer(etag='W/"v1"', last_modified="Tue, 01 Apr 2025 00:00:00 GMT")
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    remote.seek(500)
+    remote.read(1)
+    assert server.requests[1]["If-Range"] == "Tue, 01 Apr 2025 00:00:00 GMT"
+
+
+def test_no_validator_sends_no_if_range():
+    server = RangeServer(etag=None)
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    remote.seek(500)
+    assert remote.read(5) == CONTENT[500:505]
+    assert remote.validator is None
+    assert "If-Range" not in server.requests[1]
+
+
+def test_file_changed_between_blocks_raises_instead_of_mixing_versions():
+    server = RangeServer()
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    server.content, server.etag = bytes(reversed(CONTENT)), '"v2"'
+    remote.seek(500)
+    with pytest.raises(OSError, match="changed"):
+        remote.read(10)
+
+
+def test_server_ignoring_range_is_read_from_the_whole_body():
+    server = RangeServer(ranges=False)
+    remote = RemoteFile(server, "https://example.org/a.pdf", block_size=100)
+    assert not remote.ranged
+    remote.seek(700)
+    assert remote.read(50) == CONTENT[700:750]
+    assert len(server.requests) == 1
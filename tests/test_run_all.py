@@ -0,0 +1,144 @@
+import argparse
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+import main
+from benchmarks.pdf_builder import build_text_pdf
+from PDF_Analyzer import PDFAnalyzer
+from Pipeline_Metrics import PipelineMetrics
+from Pipeline_Records import Memo, PresidentialDocument, PresidentialOrders
+
+TITLE = "Restoring Gold Standard Science Across Agencies"
+EO = PresidentialDocument(doc_number="EO 14303", pdf_link="", date="2025-05-23", title=TITLE)
+
+
+class Response:
+    def __init__(self, content):
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+
+class Client:
+    """Serves one PDF per link and signals once ``expected`` of them were requested."""
+
+    def __init__(self, documents, expected):
+        self.documents = documents
+        self.requested = []
+        self.expected = threading.Event()
+        self._expected_count = expected
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        if len(self.requested) >= self._expected_count:
+            self.expected.set()
+        return Response(self.documents[url])
+
+
+def run_all_args():
+    return argparse.Namespace(
+        artifact_format="json",
+        html_parser=None,
+        backfill=False,
+        max_pages=None,
+        pdf_backend=main.DEFAULT_BACKEND,
+        fast_scan=0,
+        lazy_fetch=False,
+        streaming=False,
+        memory_limit=8,
+        normalized=False,
+    )
+
+
+@pytest.mark.parametrize("download_workers, parse_workers", [(1, 0), (4, 0), (4, 2)])
+def test_pdfs_are_fetched_before_the_eo_titles_arrive_and_matched_with_them(download_workers, parse_workers):
+    documents = {
+        f"https://a.example/{index}.pdf": build_text_pdf([f"Memo {index} implements {TITLE}."]) for index in range(3)
+    }
+    # Sequential analysis fetches one PDF before it has to match; parallel analysis fetches them all.
+    client = Client(documents, expected=1 if download_workers == 1 else len(documents))
+    titles = Future()
+    analyzer = PDFAnalyzer(
+        base_url="https://a.example/",
+        client=client,
+        download_workers=download_workers,
+        parse_workers=parse_workers,
+        executive_orders=titles,
+    )
+    results = []
+    memos = [Memo(title=url, pdf_link=url) for url in documents]
+    worker = threading.Thread(target=lambda: results.extend(analyzer.analyze_memos(memos)))
+    worker.start()
+
+    assert client.expected.wait(10)
+    assert worker.is_alive()
+    titles.set_result([EO])
+    worker.join(30)
+
+    assert [result.eo_references for result in results] == [["14303"]] * 3
+    assert analyzer.eo_titles == {"14303": TITLE}
+
+
+def test_memo_branches_start_before_the_dod_scrape_finishes(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    memo_branches_started = threading.Barrier(3, timeout=10)
+    seen = {}
+
+    def presidential_orders(client, fmt, html_parser):
+        memo_branches_started.wait()
+        return PresidentialOrders(executive_orders=[EO])
+
+    def memo_branch(source):
+        def run(*shared, executive_orders):
+            memo_branches_started.wait()
+            seen[source] = executive_orders.result(timeout=10)
+            return []
+
+        return run
+
+    monkeypatch.setattr(main, "_run_presidential_orders", presidential_orders)
+    monkeypatch.setattr(main, "_run_army_memos", memo_branch("army"))
+    monkeypatch.setattr(main, "_run_opm_memos", memo_branch("opm"))
+    monkeypatch.setattr(main, "_write_consolidated", lambda *args: None)
+    monkeypatch.setattr(main, "_run_flatten", lambda *args: None)
+    metrics = PipelineMetrics()
+
+    main._run_all(run_all_args(), metrics)
+
+    assert seen == {"army": [EO], "opm": [EO]}
+    assert {name: stage["status"] for name, stage in metrics.to_dict()["stages"].items()} == {
+        "po": "ok",
+        "army": "ok",
+        "opm": "ok",
+        "consolidate": "ok",
+        "write_output": "ok",
+        "flatten": "ok",
+    }
+
+
+def test_failed_dod_scrape_releases_the_memo_branches_without_titles(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    seen = {}
+
+    def presidential_orders(client, fmt, html_parser):
+        raise ConnectionError("defense.gov unreachable")
+
+    def memo_branch(source):
+        def run(*shared, executive_orders):
+            seen[source] = executive_orders.result(timeout=10)
+            return []
+
+        return run
+
+    monkeypatch.setattr(main, "_run_presidential_orders", presidential_orders)
+    monkeypatch.setattr(main, "_run_army_memos", memo_branch("army"))
+    monkeypatch.setattr(main, "_run_opm_memos", memo_branch("opm"))
+    metrics = PipelineMetrics()
+
+    main._run_all(run_all_args(), metrics)
+
+    assert seen == {"army": [], "opm": []}
+    assert "consolidate" not in metrics.to_dict()["stages"]
@@ -0,0 +1,83 @@
+import threading
+
+import pytest
+
+from Stage_Scheduler import StageScheduler
+
+
+def fail():
+    raise RuntimeError("boom")
+
+
+def statuses(outcomes):
+    return {name: outcome.status for name, outcome in outcomes.items()}
+
+
+def test_results_are_passed_to_dependents_by_stage_name():
+    scheduler = StageScheduler()
+    scheduler.add("a", lambda: 2)
+    scheduler.add("b", lambda: 3)
+    scheduler.add("sum", lambda a, b: a + b, depends_on=("a", "b"))
+    outcomes = scheduler.run()
+    assert outcomes["sum"].ok and outcomes["sum"].result == 5
+
+
+def test_failure_skips_dependents_transitively_but_not_unrelated_stages():
+    scheduler = StageScheduler()
+    scheduler.add("po", fail)
+    scheduler.add("army", lambda: ["memo"])
+    scheduler.add("consolidate", lambda po, army: None, depends_on=("po", "army"))
+    scheduler.add("flatten", lambda consolidate: None, depends_on=("consolidate",))
+    outcomes = scheduler.run()
+    assert statuses(outcomes) == {"po": "failed", "army": "ok", "consolidate": "skipped", "flatten": "skipped"}
+    assert isinstance(outcomes["po"].error, RuntimeError)
+
+
+def test_after_stage_runs_with_none_when_the_stage_it_waits_for_fails():
+    seen = {}
+    scheduler = StageScheduler()
+    scheduler.add("po", fail)
+    scheduler.add("army", lambda po: seen.setdefault("po", po), after=("po",))
+    outcomes = scheduler.run()
+    assert statuses(outcomes) == {"po": "failed", "army": "ok"}
+    assert seen == {"po": None}
+
+
+def test_after_stage_waits_for_and_receives_a_successful_result():
+    scheduler = StageScheduler()
+    scheduler.add("po", lambda: "orders")
+    scheduler.add("army", lambda po: po.upper(), after=("po",))
+    assert scheduler.run()["army"].result == "ORDERS"
+
+
+def test_independent_stages_run_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    scheduler = StageScheduler(max_workers=2)
+    scheduler.add("a", barrier.wait)
+    scheduler.add("b", barrier.wait)
+    assert statuses(scheduler.run()) == {"a": "ok", "b": "ok"}
+
+
+@pytest.mark.parametrize(
+    "stages, message",
+    [
+        ([("a", ("missing",), ())], "unknown stage"),
+        ([("a", (), ("missing",))], "unknown stage"),
+        ([("a", ("b",), ()), ("b", (), ("a",))], "cycle"),
+    ],
+)
+def test_invalid_graphs_are_rejected_before_anything_runs(stages, message):
+    ran = []
+    scheduler = StageScheduler()
+    for name, depends_on, after in stages:
+        scheduler.add(name, lambda **_: ran.append(name), depends_on=depends_on, after=after)
+    with pytest.raises(ValueError, match=message):
+        scheduler.run()
+    assert ran == []
+
+
+def test_duplicate_stage_names_are_rejected():
+    scheduler = StageScheduler()
+    scheduler.add("a", lambda: None)
+    with pytest.raises(ValueError):
+        scheduler.add("a", lambda: None)
@@ -0,0 +1,128 @@
+import hashlib
+
+import pytest
+
+from Analysis_Store import AnalysisStore
+from benchmarks.pdf_builder import build_text_pdf
+from PDF_Analyzer import PDFAnalyzer
+from Pipeline_Metrics import PipelineMetrics
+from Pipeline_Records import Memo, PresidentialDocument
+from Search_Index import SearchIndex
+
+TITLE = "Restoring Gold Standard Science Across Agencies"
+EO = PresidentialDocument(doc_number="EO 14303", pdf_link="", date="2025-05-23", title=TITLE)
+FILLER = "The agency will report on its progress every quarter. " * 6
+DOCUMENTS = {
+    "https://a.example/one.pdf": build_text_pdf([FILLER + "See Executive Order", "14210 and E.O. 14151.", FILLER]),
+    "https://a.example/two.pdf": build_text_pdf([FILLER, "Implements " + TITLE + ".", "Signed."]),
+    "https://a.example/three.pdf": build_text_pdf(["No citations here."]),
+}
+
+
+class Response:
+    def __init__(self, content, status_code=200):
+        self.content = content
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise ConnectionError(f"HTTP {self.status_code}")
+
+
+class Client:
+    """Serves ``documents`` through both ``get`` and the streaming ``download``; other links are 404s."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.downloaded = []
+
+    def get(self, url, **kwargs):
+        return Response(self.documents[url])
+
+    def download(self, url, sink, timeout=None):
+        self.downloaded.append(url)
+        if url not in self.documents:
+            return Response(b"", status_code=404)
+        sink.write(self.documents[url])
+        return Response(None)
+
+
+def memos(urls):
+    return [Memo(title=url, pdf_link=url) for url in urls]
+
+
+def analyze(documents=DOCUMENTS, urls=None, **kwargs):
+    analyzer = PDFAnalyzer(base_url="https://a.example/", client=Client(documents), executive_orders=[EO], **kwargs)
+    return analyzer, analyzer.analyze_memos(memos(urls or documents))
+
+
+def parsed(metrics):
+    series = metrics.to_dict()["counters"].get("pdf_documents_total", [])
+    return sum(entry["value"] for entry in series)
+
+
+@pytest.mark.parametrize("download_workers", [1, 3])
+@pytest.mark.parametrize("memory_limit", [64, 8 * 1024 * 1024])
+def test_streaming_finds_what_the_whole_document_path_finds(download_workers, memory_limit):
+    _, expected = analyze()
+    _, streamed = analyze(streaming=True, download_workers=download_workers, memory_limit=memory_limit)
+
+    assert [sorted(result.eo_references) for result in streamed] == [["14151", "14210"], ["14303"], []]
+    assert [(sorted(r.eo_references), r.pdf_text_preview) for r in streamed] == [
+        (sorted(r.eo_references), r.pdf_text_preview) for r in expected
+    ]
+    assert all(len(result.pdf_text_preview) <= PDFAnalyzer.PREVIEW_LENGTH for result in streamed)
+
+
+def test_streamed_pages_go_to_the_search_index_but_only_the_preview_is_stored(tmp_path):
+    store = AnalysisStore(tmp_path / "analysis.sqlite")
+    index = SearchIndex(tmp_path / "index.sqlite")
+    analyze(streaming=True, store=store, search_index=index, source="opm")
+
+    (hit,) = index.search(phrase=TITLE)
+    assert (hit.pdf_link, hit.page, hit.eo_references) == ("https://a.example/two.pdf", 2, ["14303"])
+    url = "https://a.example/two.pdf"
+    stored = store.lookup(url, hashlib.sha256(DOCUMENTS[url]).hexdigest())
+    assert not stored.text_complete
+    assert len(stored.pages) == 1 and len(stored.text) <= PDFAnalyzer.PREVIEW_LENGTH
+    index.close()
+    store.close()
+
+
+def test_streamed_result_is_reused_until_the_matcher_changes(tmp_path):
+    store = AnalysisStore(tmp_path / "analysis.sqlite")
+    analyze(streaming=True, store=store)
+
+    metrics = PipelineMetrics()
+    _, results = analyze(streaming=True, store=store, metrics=metrics)
+    assert parsed(metrics) == 0
+    assert sorted(results[0].eo_references) == ["14151", "14210"]
+
+    # The stored preview cannot be re-matched, so new titles mean parsing again.
+    metrics = PipelineMetrics()
+    analyzer = PDFAnalyzer(
+        base_url="https://a.example/", client=Client(DOCUMENTS), store=store, streaming=True, metrics=metrics
+    )
+    results = analyzer.analyze_memos(memos(DOCUMENTS))
+    assert parsed(metrics) == len(DOCUMENTS)
+    assert [sorted(result.eo_references) for result in results] == [["14151", "14210"], [], []]
+    store.close()
+
+
+def test_identical_streamed_content_is_parsed_once():
+    pdf = DOCUMENTS["https://a.example/one.pdf"]
+    documents = {"https://a.example/one.pdf": pdf, "https://b.example/copy.pdf": pdf}
+    metrics = PipelineMetrics()
+    analyzer, results = analyze(documents, streaming=True, download_workers=2, metrics=metrics)
+
+    assert [sorted(result.eo_references) for result in results] == [["14151", "14210"]] * 2
+    assert parsed(metrics) == 1
+    assert sorted(analyzer.client.downloaded) == sorted(documents)
+
+
+def test_failed_streamed_download_is_reported_and_the_rest_still_analyzed():
+    urls = ["https://a.example/missing.pdf", "https://a.example/one.pdf"]
+    analyzer, results = analyze(urls=urls, streaming=True)
+
+    assert [sorted(result.eo_references) for result in results] == [[], ["14151", "14210"]]
+    assert analyzer.failed_urls == {"https://a.example/missing.pdf"}
@@ -0,0 +1,53 @@
+import pytest
+
+from EO_Matcher import TitleShingleIndex
+
+TITLES = {
+    "14148": "Initial Rescissions of Harmful Executive Orders and Actions",
+    "14236": "Additional Rescissions of Harmful Executive Orders and Actions",
+    "14210": "Implementing the President's \"Department of Government Efficiency\" Workforce Optimization Initiative",
+    "14222": "Implementing the President's \"Department of Government Efficiency\" Cost Efficiency Initiative",
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    return TitleShingleIndex(TITLES)
+
+
+def matched(index, text):
+    return sorted(match.eo_number for match in index.find_matches(text))
+
+
+@pytest.mark.parametrize("eo_number", sorted(TITLES))
+def test_title_quoted_alone_matches_only_its_own_eo(index, eo_number):
+    text = f"This memorandum implements {TITLES[eo_number]}, effective immediately."
+    assert matched(index, text) == [eo_number]
+
+
+def test_typographic_variants_and_a_reworded_word_still_match(index):
+    text = "Implementing the President’s “Department of Government Efficiency” Workforce Optimisation Initiative"
+    assert matched(index, text) == ["14210"]
+
+
+def test_shared_prefix_alone_matches_neither_title(index):
+    assert matched(index, "Implementing the President's \"Department of Government Efficiency\" initiative") == []
+
+
+def test_both_titles_quoted_separately_match_both(index):
+    text = f"{TITLES['14148']}. Later, {TITLES['14236']}."
+    assert matched(index, text) == ["14148", "14236"]
+
+
+def test_title_contained_in_a_longer_title_yields_to_the_longer_one():
+    index = TitleShingleIndex(
+        {"1": "Protecting American Workers", "2": "Protecting American Workers From Unfair Competition"}
+    )
+    assert matched(index, "Protecting American Workers From Unfair Competition") == ["2"]
+    assert matched(index, "Protecting American Workers.") == ["1"]
+
+
+def test_match_offsets_span_the_quoted_title(index):
+    text = f"See {TITLES['14148']} for details."
+    (match,) = index.find_matches(text)
+    assert text[match.start:match.end] == TITLES["14148"]